@@ -69,6 +69,7 @@
             tqdm
             python-dotenv
             pyyaml
+            orjson
             click
             chromadb
             psycopg
@@ -96,6 +97,7 @@
             pytest
             pytest-cov
             pytest-asyncio
+            pytest-xdist
             black
             isort
             ruff
@@ -27,6 +27,7 @@
   tqdm,
   python-dotenv,
   pyyaml,
+  orjson,
   click,
   textual,
   tree-sitter,
@@ -66,6 +67,7 @@ buildPythonPackage rec {
     tqdm
     python-dotenv
     pyyaml
+    orjson
     click
     textual
     tree-sitter
@@ -4,21 +4,25 @@ Phantom Core - Framework core modules
 
 __version__ = "2.0.0"
 
+import importlib
+from types import ModuleType
+
 from . import utils
 
-try:
-    from . import gcp
-except ImportError:
-    gcp = None  # type: ignore[assignment]
+# Optional subpackages pull in torch / chromadb / google-cloud at import time,
+# so they are resolved lazily (PEP 562). A missing extra resolves to None.
+_OPTIONAL_SUBMODULES = frozenset({"extraction", "gcp", "rag"})
+
 
-try:
-    from . import extraction
-except ImportError:
-    extraction = None  # type: ignore[assignment]
+def __getattr__(name: str) -> ModuleType | None:
+    if name in _OPTIONAL_SUBMODULES:
+        try:
+            module: ModuleType | None = importlib.import_module(f".{name}", __name__)
+        except ImportError:
+            module = None
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    from . import rag
-except ImportError:
-    rag = None  # type: ignore[assignment]
 
 __all__ = ["extraction", "gcp", "rag", "utils"]
@@ -6,11 +6,12 @@ Vertex AI Search handles indexing/vectorization using GCP credits.
 """
 import os
 
-from google.api_core.client_options import ClientOptions
-from google.cloud import discoveryengine_v1beta as discoveryengine
-
 
 def import_documents(project_id: str, location: str, data_store_id: str, input_jsonl: str):
+    # Deferred: the Discovery Engine SDK adds hundreds of ms to module import.
+    from google.api_core.client_options import ClientOptions
+    from google.cloud import discoveryengine_v1beta as discoveryengine
+
     print("🚀 Starting document ingestion (credit-funded)...")
 
     # 1. Configure client for Discovery Engine endpoint
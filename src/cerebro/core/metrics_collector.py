@@ -10,19 +10,24 @@ Collects real metrics from all repositories using only:
 Zero LLM tokens consumed.
 """
 
-import json
 import logging
+import multiprocessing
 import os
 import re
 import subprocess
+import time
 import tomllib
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger("cerebro.metrics")
 
 # ---------------------------------------------------------------------------
@@ -52,6 +57,23 @@ LANG_EXTENSIONS: dict[str, list[str]] = {
 
 EXT_TO_LANG: dict[str, str] = {ext: lang for lang, exts in LANG_EXTENSIONS.items() for ext in exts}
 
+CODE_EXTS: frozenset[str] = frozenset(EXT_TO_LANG)
+# Data / prose formats are counted for LoC but not security-scanned
+SEC_EXTS: frozenset[str] = CODE_EXTS - {".json", ".yaml", ".yml", ".toml", ".md"}
+
+
+def _file_ext(name: str) -> str:
+    """Lower-cased extension of a file name, equivalent to ``Path(name).suffix.lower()``.
+
+    Skips the ``.lower()`` allocation when the extension is already a known
+    (lower-case) one, which is the common case in the per-file hot loops.
+    """
+    stem, dot, ext = name.rpartition(".")
+    if not dot or not stem or not ext:
+        return ""
+    suffix = dot + ext
+    return suffix if suffix in CODE_EXTS else suffix.lower()
+
 # ---------------------------------------------------------------------------
 # Skip / security constants
 # ---------------------------------------------------------------------------
@@ -63,6 +85,38 @@ SKIP_DIRS = {
 
 MAX_FILES_PER_REPO = 80_000  # safety cap for huge data repos
 
+BINARY_SNIFF_BYTES = 4096  # NUL byte in the head => binary (same heuristic as git)
+# Lockfiles / minified bundles above this size are generated noise, not source
+GENERATED_SKIP_BYTES = 512 * 1024
+GENERATED_FILE_NAMES = frozenset({
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "Cargo.lock", "poetry.lock", "flake.lock",
+})
+GENERATED_FILE_SUFFIXES = (".min.js", ".min.css", ".lock")
+
+
+def _read_source(file_path: Path) -> str | None:
+    """Read a file as text, or ``None`` for binary blobs and large generated files.
+
+    The first ``BINARY_SNIFF_BYTES`` are checked for a NUL byte before the
+    rest of the file is read, so binaries cost one small read.
+    """
+    name = file_path.name
+    if name in GENERATED_FILE_NAMES or name.endswith(GENERATED_FILE_SUFFIXES):
+        try:
+            if file_path.stat().st_size > GENERATED_SKIP_BYTES:
+                return None
+        except OSError:
+            return None
+    try:
+        with file_path.open("rb") as fh:
+            head = fh.read(BINARY_SNIFF_BYTES)
+            if b"\x00" in head:
+                return None
+            data = head + fh.read()
+    except OSError:
+        return None
+    return data.decode("utf-8", errors="ignore")
+
 SECURITY_PATTERNS: dict[str, re.Pattern] = {
     "hardcoded_secret": re.compile(
         r'(?i)(api[_-]?key|secret[_-]?key|password|token)\s*[=:]\s*["\'][A-Za-z0-9+/=_-]{20,}',
@@ -72,6 +126,13 @@ SECURITY_PATTERNS: dict[str, re.Pattern] = {
     "debug_left": re.compile(r'\b(pdb\.set_trace|breakpoint\(\)|debugger)\b'),
 }
 
+# Distribution name at the head of a PEP 508 requirement ("rich>=13; python_version...")
+PEP508_NAME_RE = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?")
+# Module path + version inside a go.mod `require` entry ("golang.org/x/net v0.20.0")
+GOMOD_DEP_RE = re.compile(r"([\w./\-]+)\s+v")
+# Commit count + author in a `git shortlog -sn` line ("    12\tAlice")
+SHORTLOG_LINE_RE = re.compile(r"\s*(\d+)\s+(.+)")
+
 # ---------------------------------------------------------------------------
 # Health-score weights (must sum to 1.0)
 # ---------------------------------------------------------------------------
@@ -101,6 +162,28 @@ TEST_SCORE_MID: float = 80.0
 TEST_SCORE_LOW: float = 60.0
 
 
+# Security scan fan-out: repos with at least this many candidate files are
+# scanned in a process pool of up to SECURITY_MAX_WORKERS workers.
+SECURITY_PARALLEL_MIN_FILES: int = 512
+SECURITY_MAX_WORKERS: int = 8
+
+
+def _scan_file_security(file_path: Path) -> list[tuple[str, int]]:
+    """Return ``(pattern_name, line)`` for the first hit of each security pattern.
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    content = _read_source(file_path)
+    if content is None:
+        return []
+    hits: list[tuple[str, int]] = []
+    for pname, pat in SECURITY_PATTERNS.items():
+        m = pat.search(content)
+        if m:
+            hits.append((pname, content.count("\n", 0, m.start()) + 1))
+    return hits
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
@@ -255,17 +338,16 @@ class MetricsCollector:
             if snapshot.total_files >= MAX_FILES_PER_REPO:
                 break
             snapshot.total_files += 1
-            ext = file_path.suffix.lower()
-            if ext not in EXT_TO_LANG:
+            lang = EXT_TO_LANG.get(_file_ext(file_path.name))
+            if lang is None:
                 continue
-            lang = EXT_TO_LANG[ext]
             lang_stats[lang]["files"] += 1
-            try:
-                lines = len(file_path.read_text(errors="ignore").splitlines())
-                lang_stats[lang]["lines"] += lines
-                snapshot.total_loc += lines
-            except (OSError, UnicodeDecodeError):
-                pass
+            content = _read_source(file_path)
+            if content is None:
+                continue
+            lines = len(content.splitlines())
+            lang_stats[lang]["lines"] += lines
+            snapshot.total_loc += lines
 
         snapshot.languages = dict(lang_stats)
         if lang_stats:
@@ -297,35 +379,64 @@ class MetricsCollector:
             snapshot.git = {"error": "not a git repo"}
             return
 
-        git: dict[str, Any] = {}
-        git["total_commits"] = self._git_int(repo_path, ["rev-list", "--count", "HEAD"])
-        git["commits_30d"] = self._git_int(repo_path, ["rev-list", "--count", "--after=30 days ago", "HEAD"])
-        git["commits_90d"] = self._git_int(repo_path, ["rev-list", "--count", "--after=90 days ago", "HEAD"])
-
-        # contributors
-        shortlog = self._git_output(repo_path, ["shortlog", "-sn", "--no-merges"])
-        git["contributors"] = len([ln for ln in shortlog.splitlines() if ln.strip()])
+        # Totals and contributors are all-time: rev-list counts without formatting
+        # any commit, and shortlog applies .mailmap and skips merges. The 30d/90d
+        # figures and the last commit come from one walk bounded to 90 days, so
+        # large histories stay cheap.
+        total = self._git_int(repo_path, ["rev-list", "--count", "HEAD"])
+        log_format = "--format=%H%x09%ct%x09%aN%x09%ai%x09%s"
+        log = self._git_output(repo_path, ["log", log_format, "--since=90.days", "HEAD"])
+        cutoff_30d = time.time() - 30 * 86_400
+        commits_30d = commits_90d = 0
+        last_parts: list[str] | None = None
+        for line in log.splitlines():
+            parts = line.split("\t", 4)
+            if len(parts) < 5:
+                continue
+            if last_parts is None:
+                last_parts = parts
+            commits_90d += 1
+            try:
+                committed = int(parts[1])
+            except ValueError:
+                committed = 0
+            if committed > cutoff_30d:
+                commits_30d += 1
+
+        if last_parts is None and total:
+            # Nothing in the window; the last commit is older than 90 days.
+            parts = self._git_output(repo_path, ["log", "-1", log_format, "HEAD"]).rstrip("\n").split("\t", 4)
+            if len(parts) == 5:
+                last_parts = parts
+
+        # contributors, most commits first
+        shortlog = self._git_output(repo_path, ["shortlog", "-sn", "--no-merges", "HEAD"])
+        authors = [
+            {"name": m.group(2).strip(), "commits": int(m.group(1))}
+            for m in map(SHORTLOG_LINE_RE.match, shortlog.splitlines())
+            if m
+        ]
+
+        git: dict[str, Any] = {
+            "total_commits": total,
+            "commits_30d": commits_30d,
+            "commits_90d": commits_90d,
+            "contributors": len(authors),
+        }
 
-        # branches / tags
-        git["branches"] = len([ln for ln in self._git_output(repo_path, ["branch", "--list"]).splitlines() if ln.strip()])
-        git["tags"] = len([ln for ln in self._git_output(repo_path, ["tag", "--list"]).splitlines() if ln.strip()])
+        # branches / tags — one ref listing for both
+        refs = self._git_output(repo_path, ["for-each-ref", "--format=%(refname)", "refs/heads", "refs/tags"])
+        git["branches"] = sum(1 for ln in refs.splitlines() if ln.startswith("refs/heads/"))
+        git["tags"] = sum(1 for ln in refs.splitlines() if ln.startswith("refs/tags/"))
 
         # last commit info
-        last = self._git_output(repo_path, ["log", "-1", "--format=%H|%an|%ai|%s"])
-        if last and "|" in last:
-            parts = last.strip().split("|", 3)
-            if len(parts) >= 4:
-                git["last_commit_hash"] = parts[0][:12]
-                git["last_commit_author"] = parts[1]
-                git["last_commit_date"] = parts[2]
-                git["last_commit_message"] = parts[3][:120]
-
-        # top contributors
-        git["top_contributors"] = []
-        for line in shortlog.splitlines()[:5]:
-            m = re.match(r"\s*(\d+)\s+(.+)", line.strip())
-            if m:
-                git["top_contributors"].append({"name": m.group(2).strip(), "commits": int(m.group(1))})
+        if last_parts is not None:
+            git["last_commit_hash"] = last_parts[0][:12]
+            git["last_commit_author"] = last_parts[2]
+            git["last_commit_date"] = last_parts[3]
+            git["last_commit_message"] = last_parts[4][:120]
+
+        git["top_contributors"] = authors[:5]
 
         snapshot.git = git
 
@@ -335,14 +446,22 @@ class MetricsCollector:
     def _collect_dependencies(self, repo_path: Path, snapshot: RepoMetricsSnapshot) -> None:
         deps: list[str] = []
 
-        # pyproject.toml (Poetry)
+        # pyproject.toml (Poetry + PEP 621)
         pyproject = repo_path / "pyproject.toml"
         if pyproject.exists():
             try:
-                data = tomllib.loads(pyproject.read_text())
-                for name in data.get("tool", {}).get("poetry", {}).get("dependencies", {}):
+                with pyproject.open("rb") as fh:
+                    data = tomllib.load(fh)
+                py_names: dict[str, None] = {}
+                poetry_deps = data.get("tool", {}).get("poetry", {}).get("dependencies", {})
+                for name in poetry_deps:
                     if name != "python":
-                        deps.append(f"py:{name}")
+                        py_names[name] = None
+                for spec in data.get("project", {}).get("dependencies", []):
+                    m = PEP508_NAME_RE.match(spec)
+                    if m:
+                        py_names[m.group(0)] = None
+                deps.extend(f"py:{name}" for name in py_names)
             except Exception:
                 pass
 
@@ -350,7 +469,7 @@ class MetricsCollector:
         pkg = repo_path / "package.json"
         if pkg.exists():
             try:
-                data = json.loads(pkg.read_text())
+                data = orjson.loads(pkg.read_bytes())
                 for name in data.get("dependencies", {}):
                     deps.append(f"npm:{name}")
                 for name in data.get("devDependencies", {}):
@@ -362,19 +481,10 @@ class MetricsCollector:
         cargo = repo_path / "Cargo.toml"
         if cargo.exists():
             try:
-                content = cargo.read_text()
-                in_deps = False
-                for line in content.splitlines():
-                    stripped = line.strip()
-                    if stripped == "[dependencies]":
-                        in_deps = True
-                        continue
-                    if stripped.startswith("[") and in_deps:
-                        break
-                    if in_deps:
-                        m = re.match(r'^([\w-]+)\s*=', stripped)
-                        if m:
-                            deps.append(f"cargo:{m.group(1)}")
+                with cargo.open("rb") as fh:
+                    data = tomllib.load(fh)
+                for name in data.get("dependencies", {}):
+                    deps.append(f"cargo:{name}")
             except Exception:
                 pass
 
@@ -385,16 +495,26 @@ class MetricsCollector:
                 in_require = False
                 for line in gomod.read_text().splitlines():
                     stripped = line.strip()
+                    if not stripped or stripped.startswith("//"):
+                        continue
                     if stripped.startswith("require"):
-                        in_require = True
+                        # `require (` opens a block; `require mod v1.2.3` is a one-liner
+                        rest = stripped[len("require"):].strip()
+                        if rest == "(":
+                            in_require = True
+                        elif rest:
+                            m = GOMOD_DEP_RE.match(rest)
+                            if m:
+                                deps.append(f"go:{m.group(1)}")
+                        continue
+                    if not in_require:
                         continue
-                    if in_require and stripped == ")":
+                    if stripped == ")":
                         in_require = False
                         continue
-                    if in_require:
-                        m = re.match(r"([\w./\-]+)\s+v", stripped)
-                        if m:
-                            deps.append(f"go:{m.group(1)}")
+                    m = GOMOD_DEP_RE.match(stripped)
+                    if m:
+                        deps.append(f"go:{m.group(1)}")
             except Exception:
                 pass
 
@@ -405,33 +525,35 @@ class MetricsCollector:
     # Security scan
     # ------------------------------------------------------------------
     def _collect_security(self, repo_path: Path, snapshot: RepoMetricsSnapshot) -> None:
-        findings: list[dict[str, Any]] = []
-        code_exts = set(EXT_TO_LANG.keys()) - {".json", ".yaml", ".yml", ".toml", ".md"}
-        scanned = 0
-
+        paths: list[Path] = []
         for file_path in self._iter_files(repo_path):
-            if scanned >= 15_000:
+            if len(paths) >= 15_000:
                 break
-            if file_path.suffix.lower() not in code_exts:
-                continue
-            scanned += 1
-            try:
-                content = file_path.read_text(errors="ignore")
-                seen_in_file: set = set()
-                for pname, pat in SECURITY_PATTERNS.items():
-                    if pname in seen_in_file:
-                        continue
-                    m = pat.search(content)
-                    if m:
-                        line_num = content[: m.start()].count("\n") + 1
-                        findings.append({
-                            "type": pname,
-                            "file": str(file_path.relative_to(repo_path)),
-                            "line": line_num,
-                        })
-                        seen_in_file.add(pname)
-            except (OSError, UnicodeDecodeError):
-                continue
+            if _file_ext(file_path.name) in SEC_EXTS:
+                paths.append(file_path)
+
+        # Regex scanning holds the GIL, so large repos fan out across processes;
+        # small ones stay inline where pool start-up would dominate.
+        results: Iterator[list[tuple[str, int]]] | None = None
+        if len(paths) >= SECURITY_PARALLEL_MIN_FILES:
+            workers = min(SECURITY_MAX_WORKERS, os.cpu_count() or 1)
+            if workers > 1:
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    ) as pool:
+                        results = iter(list(pool.map(_scan_file_security, paths, chunksize=64)))
+                except (OSError, BrokenProcessPool) as e:
+                    logger.warning("Parallel security scan unavailable (%s); scanning inline", e)
+        if results is None:
+            results = map(_scan_file_security, paths)
+
+        findings: list[dict[str, Any]] = []
+        for file_path, hits in zip(paths, results, strict=True):
+            rel = str(file_path.relative_to(repo_path))
+            for pname, line_num in hits:
+                findings.append({"type": pname, "file": rel, "line": line_num})
 
         snapshot.security_findings = findings
         snapshot.security_score = max(0.0, 100.0 - len(findings) * 10)
@@ -584,6 +706,17 @@ class MetricsCollector:
             1,
         )
 
+    def recompute_health(self, snapshots: list[RepoMetricsSnapshot]) -> list[float]:
+        """Re-score many snapshots from their collected metrics.
+
+        Lets weights be retuned and applied to a cached snapshot without
+        re-running the collectors.
+        """
+        scores = [self._calculate_health(snap) for snap in snapshots]
+        for snap, score in zip(snapshots, scores, strict=True):
+            snap.health_score = score
+        return scores
+
     @staticmethod
     def _determine_status(snapshot: RepoMetricsSnapshot) -> str:
         total = snapshot.git.get("total_commits", 0)
@@ -603,7 +736,7 @@ class MetricsCollector:
         try:
             r = subprocess.run(
                 ["git", *args], cwd=repo_path,
-                capture_output=True, text=True, timeout=15,
+                capture_output=True, encoding="utf-8", errors="replace", timeout=15,
             )
             return r.stdout if r.returncode == 0 else ""
         except (subprocess.TimeoutExpired, OSError):
@@ -627,24 +760,37 @@ class MetricsCollector:
         data = {
             "generated_at": now.isoformat(),
             "repo_count": len(snapshots),
-            "repos": [snap.to_dict() for snap in snapshots],
+            # orjson walks dataclasses natively — no asdict() deep copy
+            "repos": snapshots,
         }
-        
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
         # Save timestamped history
         history_dir = self.metrics_dir / "history"
         history_dir.mkdir(exist_ok=True)
         timestamp = now.strftime("%Y%m%d_%H%M%S")
-        (history_dir / f"metrics_snapshot_{timestamp}.json").write_text(json.dumps(data, indent=2))
-        
+        (history_dir / f"metrics_snapshot_{timestamp}.json").write_bytes(payload)
+
         # Save latest
-        (self.metrics_dir / "metrics_snapshot.json").write_text(json.dumps(data, indent=2))
+        self.snapshot_path.write_bytes(payload)
         logger.info("Saved metrics snapshot: %d repos", len(snapshots))
 
+    @property
+    def snapshot_path(self) -> Path:
+        return self.metrics_dir / "metrics_snapshot.json"
+
+    def snapshot_mtime_ns(self) -> int | None:
+        """mtime of the latest snapshot file, or None if none has been saved."""
+        try:
+            return self.snapshot_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def load_snapshot(self) -> dict[str, Any] | None:
-        p = self.metrics_dir / "metrics_snapshot.json"
+        p = self.snapshot_path
         if not p.exists():
             return None
         try:
-            return json.loads(p.read_text())
+            return orjson.loads(p.read_bytes())
         except Exception:
             return None
@@ -2,7 +2,16 @@
 Phantom Core RAG - Retrieval-Augmented Generation server
 """
 
-# Server is imported dynamically to avoid heavy dependencies
-from . import server
+import importlib
+from types import ModuleType
+
+
+# Server is imported on first access to avoid heavy dependencies (torch,
+# transformers, chromadb) when only the engine is needed (PEP 562).
+def __getattr__(name: str) -> ModuleType:
+    if name == "server":
+        return importlib.import_module(".server", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["server"]
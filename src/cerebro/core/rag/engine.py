@@ -2,10 +2,12 @@ import json
 import logging
 import os
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, ClassVar
 from uuid import uuid4
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 from cerebro.core.metadata import CANONICAL_METADATA_VERSION, build_canonical_fields
@@ -89,6 +91,16 @@ class RigorousRAGEngine:
     # Override via CEREBRO_MIN_RELEVANCE_SCORE env var or constructor param.
     DEFAULT_MIN_RELEVANCE_SCORE: ClassVar[float] = 0.25
 
+    # Source documents embedded and upserted per round-trip during local ingest.
+    INGEST_BATCH_SIZE: ClassVar[int] = 512
+
+    # GCS upload tuning for Vertex ingest. Files above the threshold use a
+    # larger resumable chunk (a multiple of 256 KiB) to cut HTTP round-trips;
+    # smaller files keep the client default (single-shot multipart <= 8 MiB).
+    GCS_LARGE_UPLOAD_BYTES: ClassVar[int] = 100 * 1024 * 1024
+    GCS_LARGE_UPLOAD_CHUNK_BYTES: ClassVar[int] = 25 * 1024 * 1024
+    GCS_UPLOAD_TIMEOUT: ClassVar[tuple[float, float]] = (60.0, 3600.0)  # (connect, read)
+
     def __init__(
         self,
         llm_provider: LLMProvider | None = None,
@@ -136,6 +148,10 @@ class RigorousRAGEngine:
             else (float(_env_threshold) if _env_threshold else self.DEFAULT_MIN_RELEVANCE_SCORE)
         )
 
+        # GCS client and buckets for Vertex ingest, created on first use and reused
+        self._storage_client: Any | None = None
+        self._bucket_by_name: dict[str, Any] = {}
+
         if llm_provider is None:
             self.llm_provider = self._build_default_llm_provider()
         else:
@@ -239,27 +255,27 @@ class RigorousRAGEngine:
             self.llm_provider.__class__.__name__,
         )
 
-    def _load_documents(self, jsonl_path: str) -> list[dict[str, Any]]:
+    def _iter_documents(self, jsonl_path: str) -> Iterator[dict[str, Any]]:
+        """Yield normalized documents one JSONL line at a time."""
         path = Path(jsonl_path)
         if not path.exists():
             raise FileNotFoundError(f"Artifacts not found: {jsonl_path}")
 
-        documents: list[dict[str, Any]] = []
-        with path.open(encoding="utf-8") as handle:
+        # Read raw bytes: orjson parses UTF-8 directly, skipping the str decode.
+        with path.open("rb") as handle:
             for line_number, line in enumerate(handle, start=1):
                 stripped = line.strip()
                 if not stripped:
                     continue
-                raw = json.loads(stripped)
+                raw = orjson.loads(stripped)
                 doc = self._normalize_document(raw, line_number)
                 if doc is not None:
-                    documents.append(doc)
-        return documents
+                    yield doc
 
-    def _normalize_document(self, raw: dict[str, Any], line_number: int) -> dict[str, Any]:
+    def _normalize_document(self, raw: dict[str, Any], line_number: int) -> dict[str, Any] | None:
         payload = raw.get("jsonData", raw)
         if isinstance(payload, str):
-            payload = json.loads(payload)
+            payload = orjson.loads(payload)
         elif not isinstance(payload, dict):
             payload = {}
 
@@ -301,33 +317,52 @@ class RigorousRAGEngine:
             return None
 
     def _ingest_local(self, jsonl_path: str) -> int:
-        documents = self._load_documents(jsonl_path)
-        if not documents:
-            return 0
-
-        # Deduplicate within the batch by content_hash (last occurrence wins).
-        # Prevents re-embedding identical chunks that appear multiple times in
-        # the same JSONL file, which is common after repeated analysis runs.
-        seen: dict[str, dict[str, Any]] = {}
-        for doc in documents:
-            seen[doc["content_hash"]] = doc
-        unique = list(seen.values())
-        skipped = len(documents) - len(unique)
+        # Stream the file in fixed-size windows so memory stays O(batch) rather
+        # than O(corpus): each window is embedded, upserted and then dropped.
+        #
+        # Deduplicate by content_hash across the whole file (first occurrence
+        # wins). Prevents re-embedding identical chunks that appear multiple
+        # times in the same JSONL file, which is common after repeated analysis
+        # runs. Only the 16-char hashes are retained between windows.
+        seen_hashes: set[str] = set()
+        batch: list[dict[str, Any]] = []
+        skipped = 0
+        ingested = 0
+        schema_ready = False
+
+        def _flush() -> int:
+            nonlocal schema_ready
+            if not schema_ready:
+                self.vector_store_provider.initialize_schema()
+                schema_ready = True
+            embeddings = self._embed_document_texts([doc["content"] for doc in batch])
+            return self.vector_store_provider.upsert_documents(
+                batch,
+                embeddings,
+                namespace=self.vector_store_namespace,
+            )
+
+        for doc in self._iter_documents(jsonl_path):
+            content_hash = doc["content_hash"]
+            if content_hash in seen_hashes:
+                skipped += 1
+                continue
+            seen_hashes.add(content_hash)
+            batch.append(doc)
+            if len(batch) >= self.INGEST_BATCH_SIZE:
+                ingested += _flush()
+                batch = []
+
+        if batch:
+            ingested += _flush()
+
         if skipped:
             logger.info(
                 "Ingest dedup: skipped %d duplicate chunk(s) in %s (same content_hash).",
                 skipped,
                 jsonl_path,
             )
-
-        self.vector_store_provider.initialize_schema()
-        texts = [doc["content"] for doc in unique]
-        embeddings = self._embed_document_texts(texts)
-        return self.vector_store_provider.upsert_documents(
-            unique,
-            embeddings,
-            namespace=self.vector_store_namespace,
-        )
+        return ingested
 
     def _ingest_vertex(self, jsonl_path: str) -> int:
         if not self.project_id or not self.data_store_id:
@@ -344,22 +379,35 @@ class RigorousRAGEngine:
             raise FileNotFoundError(f"Artifacts not found: {jsonl_path}")
 
         bucket_name = f"{self.project_id}-cerebro-ingest"
-        storage_client = storage.Client(project=self.project_id)
-
-        try:
-            bucket = storage_client.get_bucket(bucket_name)
-        except exceptions.NotFound:
-            bucket = storage_client.create_bucket(bucket_name)
+        bucket = self._bucket_by_name.get(bucket_name)
+        if bucket is None:
+            if self._storage_client is None:
+                self._storage_client = storage.Client(project=self.project_id)
+            try:
+                bucket = self._storage_client.get_bucket(bucket_name)
+            except exceptions.NotFound:
+                bucket = self._storage_client.create_bucket(bucket_name)
+            self._bucket_by_name[bucket_name] = bucket
 
         blob = bucket.blob(f"ingest/{path.name}")
-        blob.upload_from_filename(str(path))
+        if path.stat().st_size > self.GCS_LARGE_UPLOAD_BYTES:
+            blob.chunk_size = self.GCS_LARGE_UPLOAD_CHUNK_BYTES
+        blob.upload_from_filename(str(path), timeout=self.GCS_UPLOAD_TIMEOUT)
 
         gcs_uri = f"gs://{bucket_name}/ingest/{path.name}"
         operation_name = self.llm_provider.import_documents(gcs_uri)
         print(f"Vertex import started: {operation_name}")
 
-        with path.open(encoding="utf-8") as handle:
-            return sum(1 for _ in handle)
+        # Count lines over raw 1 MiB chunks — bytes.count is a C-level memchr
+        # loop, no UTF-8 decode or per-line objects. An unterminated final
+        # line still counts, matching line iteration.
+        lines = 0
+        last = b"\n"
+        with path.open("rb") as handle:
+            while chunk := handle.read(1 << 20):
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+        return lines + (last != b"\n")
 
     def ingest(self, jsonl_path: str) -> int:
         """
@@ -11,7 +11,9 @@ Design: HEAD-hash polling only — no inotify / watchdog dependency.
 import asyncio
 import logging
 import os
+import re
 from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -20,6 +22,72 @@ from cerebro.core.metrics_collector import MetricsCollector
 
 logger = logging.getLogger("cerebro.watcher")
 
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")  # SHA-1 or SHA-256 object id
+
+# Ceiling (seconds) for the poll back-off while no repos are tracked
+_EMPTY_BACKOFF_MAX = 300
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _packed_ref(packed_refs: Path, ref: str) -> str | None:
+    try:
+        with packed_refs.open() as fh:
+            for line in fh:
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+
+def _fast_head_hash(repo_path: Path) -> tuple[tuple[Path, ...], tuple[int | None, ...], str] | None:
+    """Resolve HEAD by reading ``.git`` directly — no ``git`` subprocess.
+
+    Returns ``(paths, mtimes, sha)`` where *paths* are every file the answer
+    depends on (HEAD, the loose ref, packed-refs) and *mtimes* their
+    ``st_mtime_ns`` taken before reading, so a caller can skip re-resolving
+    while none of them moved.  Returns None for layouts this doesn't handle
+    (worktrees/submodules with a ``.git`` file, unborn branches); callers
+    should fall back to ``git rev-parse``.
+    """
+    git_dir = repo_path / ".git"
+    head_path = git_dir / "HEAD"
+    head_mtime = _mtime_ns(head_path)
+    if head_mtime is None or not git_dir.is_dir():
+        return None
+    try:
+        head = head_path.read_text().strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):  # detached HEAD
+        return ((head_path,), (head_mtime,), head) if _SHA_RE.fullmatch(head) else None
+
+    ref = head[len("ref: "):].strip()
+    loose = git_dir / ref
+    packed = git_dir / "packed-refs"
+    # a loose ref that is missing now may appear later — watch it regardless
+    paths = (head_path, loose, packed)
+    mtimes = (head_mtime, _mtime_ns(loose), _mtime_ns(packed))
+    try:
+        sha: str | None = loose.read_text().strip()
+    except FileNotFoundError:
+        sha = _packed_ref(packed, ref)
+    except OSError:
+        return None
+    if not sha or not _SHA_RE.fullmatch(sha):
+        return None
+    return paths, mtimes, sha
+
 
 class RepoWatcher:
     def __init__(
@@ -33,10 +101,18 @@ class RepoWatcher:
         self.on_change = on_change
 
         self._head_cache: dict[str, str] = {}
+        # repo name -> (files HEAD depends on, their mtimes, sha) for _head_hash
+        self._head_stat_cache: dict[str, tuple[tuple[Path, ...], tuple[int | None, ...], str]] = {}
         self._tracked_repos: list[Path] = []
         self._running = False
         self._task: asyncio.Task | None = None
         self._poll_count = 0
+        # consecutive polls that found nothing to track; drives the idle back-off
+        self._empty_streak = 0
+        # caps concurrent HEAD reads per poll
+        self._head_limit = asyncio.Semaphore(min(32, (os.cpu_count() or 4) * 2))
+        # HEAD reads and re-collection run here, not on the loop's shared default executor
+        self._executor: ThreadPoolExecutor | None = self._new_executor()
 
         self.last_update: str | None = None
         self.changes_detected: int = 0
@@ -44,13 +120,19 @@ class RepoWatcher:
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
+    @staticmethod
+    def _new_executor() -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=max(2, min(8, os.cpu_count() or 4)), thread_name_prefix="watcher")
+
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
+        if self._executor is None:
+            self._executor = self._new_executor()
         self._tracked_repos = self.collector.discover_repos()
         for repo in self._tracked_repos:
-            self._head_cache[repo.name] = self.collector.get_head_hash(repo)
+            self._head_cache[repo.name] = self._head_hash(repo)
         self._task = asyncio.create_task(self._poll_loop())
         logger.info("Watcher started — tracking %d repos (interval %ds)", len(self._tracked_repos), self.poll_interval)
 
@@ -62,6 +144,9 @@ class RepoWatcher:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("Watcher stopped")
 
     @property
@@ -74,9 +159,30 @@ class RepoWatcher:
 
     def refresh_repo_list(self) -> None:
         self._tracked_repos = self.collector.discover_repos()
+        if self._tracked_repos:
+            self._empty_streak = 0
         for repo in self._tracked_repos:
             if repo.name not in self._head_cache:
-                self._head_cache[repo.name] = self.collector.get_head_hash(repo)
+                self._head_cache[repo.name] = self._head_hash(repo)
+
+    def _head_hash(self, repo_path: Path) -> str:
+        """Current HEAD sha; one stat() per watched file when nothing moved.
+
+        Resolved in-process from ``.git``; falls back to the collector's
+        ``git rev-parse HEAD`` for layouts ``_fast_head_hash`` can't read.
+        """
+        cached = self._head_stat_cache.get(repo_path.name)
+        if cached is not None:
+            paths, mtimes, sha = cached
+            if tuple(_mtime_ns(p) for p in paths) == mtimes:
+                return sha
+
+        resolved = _fast_head_hash(repo_path)
+        if resolved is None:
+            self._head_stat_cache.pop(repo_path.name, None)
+            return self.collector.get_head_hash(repo_path)
+        self._head_stat_cache[repo_path.name] = resolved
+        return resolved[2]
 
     # ------------------------------------------------------------------
     # Polling loop
@@ -84,9 +190,13 @@ class RepoWatcher:
     async def _poll_loop(self) -> None:
         while self._running:
             self._poll_count += 1
-            # refresh repo list every ~60 s
-            if self._poll_count % max(1, 60 // self.poll_interval) == 0:
+            # refresh repo list every ~60 s, or on every wake-up while there is nothing to watch
+            if not self._tracked_repos or self._poll_count % max(1, 60 // self.poll_interval) == 0:
                 self.refresh_repo_list()
+            if not self._tracked_repos:
+                self._empty_streak += 1
+                await asyncio.sleep(self._idle_interval())
+                continue
             try:
                 await self._check_all()
             except asyncio.CancelledError:
@@ -95,35 +205,61 @@ class RepoWatcher:
                 logger.error("Watcher poll error: %s", e)
             await asyncio.sleep(self.poll_interval)
 
+    def _idle_interval(self) -> float:
+        """Exponential back-off from ``poll_interval`` up to ``_EMPTY_BACKOFF_MAX`` while nothing is tracked."""
+        return min(_EMPTY_BACKOFF_MAX, self.poll_interval * 2 ** min(self._empty_streak, 6))
+
     async def _check_all(self) -> None:
         loop = asyncio.get_running_loop()
-        for repo_path in self._tracked_repos:
-            try:
-                current_head = self.collector.get_head_hash(repo_path)
-                cached_head = self._head_cache.get(repo_path.name, "")
+        repos = list(self._tracked_repos)
 
-                if not current_head or current_head == cached_head:
-                    continue
+        async def _read_head(repo_path: Path) -> str:
+            async with self._head_limit:
+                return await loop.run_in_executor(self._executor, self._head_hash, repo_path)
 
-                # first-time seed — not a real change
-                if not cached_head:
-                    self._head_cache[repo_path.name] = current_head
-                    continue
+        # wave 1: read every HEAD concurrently (bounded, so no subprocess storm)
+        heads = await asyncio.gather(*(_read_head(p) for p in repos), return_exceptions=True)
+
+        changed: list[Path] = []
+        for repo_path, current_head in zip(repos, heads, strict=True):
+            if isinstance(current_head, BaseException):
+                logger.warning("Watcher error for %s: %s", repo_path.name, current_head)
+                continue
+            cached_head = self._head_cache.get(repo_path.name, "")
+
+            if not current_head or current_head == cached_head:
+                continue
 
-                # genuine change detected
-                logger.info("Change in %s: %s → %s", repo_path.name, cached_head[:8], current_head[:8])
+            # first-time seed — not a real change
+            if not cached_head:
                 self._head_cache[repo_path.name] = current_head
-                self.changes_detected += 1
-                self.last_update = datetime.now(UTC).isoformat()
+                continue
 
-                # re-collect in thread pool so we don't block the event loop
-                snapshot = await loop.run_in_executor(None, self.collector.collect_repo, repo_path)
+            # genuine change detected
+            logger.info("Change in %s: %s → %s", repo_path.name, cached_head[:8], current_head[:8])
+            self._head_cache[repo_path.name] = current_head
+            self.changes_detected += 1
+            self.last_update = datetime.now(UTC).isoformat()
+            changed.append(repo_path)
 
-                if self.on_change:
+        if not changed:
+            return
+
+        # wave 2: re-collect changed repos in the watcher's pool so we don't block the event loop
+        snapshots = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, self.collector.collect_repo, p) for p in changed),
+            return_exceptions=True,
+        )
+        for repo_path, snapshot in zip(changed, snapshots, strict=True):
+            if isinstance(snapshot, BaseException):
+                logger.warning("Watcher error for %s: %s", repo_path.name, snapshot)
+                continue
+            if self.on_change:
+                try:
                     await self.on_change({
                         "type": "repo_update",
                         "repo": snapshot.to_dict(),
                         "timestamp": self.last_update,
                     })
-            except Exception as e:
-                logger.warning("Watcher error for %s: %s", repo_path.name, e)
+                except Exception as e:
+                    logger.warning("Watcher error for %s: %s", repo_path.name, e)
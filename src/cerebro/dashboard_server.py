@@ -5,23 +5,75 @@ Reads real data from MetricsCollector snapshots (zero extra tokens).
 Run:  uvicorn cerebro.dashboard_server:app --host 0.0.0.0 --port 8009
 """
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from operator import itemgetter
+from typing import Any
 
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 
 from cerebro.core.metrics_collector import MetricsCollector
+from cerebro.core.utils.logging import get_logger
 
-app = FastAPI(title="Cerebro Dashboard API", version="0.1.0")
+logger = get_logger("cerebro.dashboard_server")
 
-_cors_origins = os.getenv("CEREBRO_CORS_ORIGINS", "http://localhost:5173").split(",")
+
+class _OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson (fastapi.responses.ORJSONResponse is deprecated).
+
+    Snapshot-derived endpoints return this directly, which also skips
+    FastAPI's jsonable_encoder pass over plain dict/list payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+# Seconds between snapshot mtime checks by the background refresher
+SNAPSHOT_REFRESH_INTERVAL = 1.0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the derived cache, then keep it fresh from a background task."""
+    global _refresher_task
+    await asyncio.to_thread(_refresh_snapshot_cache)
+    _refresher_task = asyncio.create_task(_snapshot_refresher())
+    yield
+    _refresher_task.cancel()
+    try:
+        await _refresher_task
+    except asyncio.CancelledError:
+        pass
+    _refresher_task = None
+
+
+app = FastAPI(
+    title="Cerebro Dashboard API",
+    version="0.1.0",
+    default_response_class=_OrjsonResponse,
+    lifespan=lifespan,
+)
+
+# Normalized the way browsers serialize the Origin header (lowercase, no trailing
+# slash) and held in a frozenset, so each request's origin check is one hash lookup.
+_cors_origins = frozenset(
+    o.strip().rstrip("/").lower()
+    for o in os.getenv("CEREBRO_CORS_ORIGINS", "http://localhost:5173").split(",")
+    if o.strip()
+)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST"),
+    allow_headers=("content-type", "if-none-match"),
 )
 
 # ---------------------------------------------------------------------------
@@ -30,9 +82,156 @@ app.add_middleware(
 _collector = MetricsCollector()
 
 
-def _load_snapshot() -> dict | None:
-    """Load the latest persisted metrics snapshot, or None."""
-    return _collector.load_snapshot()
+@dataclass
+class _DerivedCache:
+    """Snapshot plus every view derived from it, rebuilt only when the file's mtime changes."""
+
+    mtime_ns: int | None = None
+    snapshot: dict | None = None
+    projects: list[dict] = field(default_factory=list)
+    repo_by_name: dict[str, dict] = field(default_factory=dict)
+    project_by_name: dict[str, dict] = field(default_factory=dict)
+    by_status: dict[str, list[dict]] = field(default_factory=dict)
+    by_language: dict[str, list[dict]] = field(default_factory=dict)
+    status: dict = field(default_factory=dict)
+    alerts: list[dict] = field(default_factory=list)
+    graph: dict = field(default_factory=dict)
+    briefing: dict = field(default_factory=dict)
+    # (status, language, sort_by, order) -> filtered, sorted projects; filled lazily per generation
+    filtered: dict[tuple, list[dict]] = field(default_factory=dict)
+
+
+# Cap on memoized /projects filter combinations per snapshot generation
+_FILTER_CACHE_MAX = 64
+
+
+def _build_derived(mtime_ns: int | None, snapshot: dict | None) -> _DerivedCache:
+    """Derive every view in one pass over the snapshot's repos."""
+    repos = snapshot.get("repos", []) if snapshot else []
+
+    projects: list[dict] = []
+    repo_by_name: dict[str, dict] = {}
+    project_by_name: dict[str, dict] = {}
+    by_status: dict[str, list[dict]] = {}
+    by_language: dict[str, list[dict]] = {}
+    alerts: list[dict] = []
+    nodes: list[dict] = []
+    summaries: list[tuple[float, dict]] = []
+    active_count = 0
+    health_sum = 0.0
+
+    for repo in repos:
+        name = repo["name"]
+        health = repo.get("health_score", 0)
+        if repo.get("status") == "active":
+            active_count += 1
+        health_sum += health
+
+        project = _repo_to_project(repo)
+        projects.append(project)
+        # first occurrence wins on duplicate names, as the old linear scan did
+        repo_by_name.setdefault(name, repo)
+        project_by_name.setdefault(name, project)
+        by_status.setdefault(project["status"], []).append(project)
+        for lang in {l.lower() for l in project["languages"]}:
+            by_language.setdefault(lang, []).append(project)
+
+        findings = repo.get("security_findings", [])
+        for finding in findings:
+            alerts.append({
+                "id": f"{name}-{finding['type']}-{finding['line']}",
+                "type": finding["type"],
+                "project": name,
+                "message": f"{finding['file']}:{finding['line']}",
+                "score": repo.get("security_score", 100.0),
+            })
+
+        nodes.append({"id": name, "label": name})
+        summaries.append((health, {
+            "name": name,
+            "health_score": health,
+            "status": repo.get("status", "unknown"),
+            "insights": [
+                f"{repo.get('primary_language', '—')} · {repo.get('total_loc', 0):,} LoC",
+                f"{repo.get('dep_count', 0)} deps · {len(findings)} findings",
+            ],
+        }))
+
+    avg_health = health_sum / len(repos) if repos else 0.0
+    summaries.sort(key=itemgetter(0), reverse=True)
+
+    return _DerivedCache(
+        mtime_ns=mtime_ns,
+        snapshot=snapshot,
+        projects=projects,
+        repo_by_name=repo_by_name,
+        project_by_name=project_by_name,
+        by_status=by_status,
+        by_language=by_language,
+        status={
+            "total_projects": len(repos),
+            "active_projects": active_count,
+            "health_score": round(avg_health, 1),
+            "total_intelligence": 0,
+            "alerts_count": len(alerts),
+            "last_scan": snapshot.get("generated_at") if snapshot else None,
+        },
+        alerts=alerts,
+        graph={"nodes": nodes, "edges": []},
+        # everything in a briefing except its type and timestamp, which are set per request
+        briefing={
+            "headline": f"{len(repos)} repos tracked · {active_count} active · avg health {avg_health:.0f}%",
+            "ecosystem_status": {
+                "total_projects": len(repos),
+                "active_projects": active_count,
+                "health_score": round(avg_health, 1),
+            },
+            "alerts": [{"type": a["type"], "project": a["project"], "message": a["message"]} for a in alerts[:10]],
+            "project_summaries": [summary for _, summary in summaries[:8]],
+        },
+    )
+
+
+_cache: _DerivedCache | None = None
+_refresher_task: asyncio.Task | None = None
+
+
+def _refresh_snapshot_cache() -> _DerivedCache:
+    """Re-parse and re-derive only when the snapshot's mtime moved; most calls cost one stat()."""
+    global _cache
+    mtime_ns = _collector.snapshot_mtime_ns()
+    if _cache is None or mtime_ns != _cache.mtime_ns:
+        snapshot = _collector.load_snapshot() if mtime_ns is not None else None
+        _cache = _build_derived(mtime_ns, snapshot)
+    return _cache
+
+
+def _derived() -> _DerivedCache:
+    """Views for request handlers: the refresher's latest build, or an inline refresh without it."""
+    if _refresher_task is not None and _cache is not None:
+        return _cache
+    return _refresh_snapshot_cache()
+
+
+async def _snapshot_refresher() -> None:
+    """Poll the snapshot mtime and rebuild derived views in a worker thread, off request paths."""
+    while True:
+        await asyncio.sleep(SNAPSHOT_REFRESH_INTERVAL)
+        try:
+            await asyncio.to_thread(_refresh_snapshot_cache)
+        except Exception as e:
+            logger.warning("Snapshot refresh failed: %s", e)
+
+
+def _snapshot_response(request: Request, cache: _DerivedCache, content: Any) -> Response:
+    """orjson response tagged with the snapshot mtime; 304 without serializing when the client has it."""
+    if cache.mtime_ns is None:
+        return _OrjsonResponse(content)
+    etag = f'"{cache.mtime_ns}"'
+    headers = {"etag": etag, "cache-control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return _OrjsonResponse(content, headers=headers)
 
 
 def _repo_to_project(repo: dict) -> dict:
@@ -68,18 +267,7 @@ def health():
 
 @app.get("/status")
 def status():
-    snapshot = _load_snapshot()
-    repos = snapshot.get("repos", []) if snapshot else []
-    active = sum(1 for r in repos if r.get("status") == "active")
-    avg_health = sum(r.get("health_score", 0) for r in repos) / len(repos) if repos else 0.0
-    return {
-        "total_projects": len(repos),
-        "active_projects": active,
-        "health_score": round(avg_health, 1),
-        "total_intelligence": 0,
-        "alerts_count": sum(len(r.get("security_findings", [])) for r in repos),
-        "last_scan": snapshot.get("generated_at") if snapshot else None,
-    }
+    return _derived().status
 
 
 # ---------------------------------------------------------------------------
@@ -87,59 +275,80 @@ def status():
 # ---------------------------------------------------------------------------
 @app.get("/projects")
 def list_projects(
+    request: Request,
     status: str | None = Query(None),
     language: str | None = Query(None),
     sort_by: str = Query("health_score"),
     order: str = Query("desc"),
 ):
-    snapshot = _load_snapshot()
-    if not snapshot:
-        return []
-
-    projects = [_repo_to_project(r) for r in snapshot.get("repos", [])]
-
-    if status:
-        projects = [p for p in projects if p["status"] == status]
+    cache = _derived()
+    return _snapshot_response(request, cache, _apply_filters(cache, status, language, sort_by, order))
+
+
+def _apply_filters(
+    cache: _DerivedCache, status: str | None, language: str | None, sort_by: str, order: str
+) -> list[dict]:
+    """Filtered, sorted projects, memoized on the cache so repeat queries skip the sort."""
+    key = (status, language.lower() if language else None, sort_by, order)
+    result = cache.filtered.get(key)
+    if result is None:
+        if len(cache.filtered) >= _FILTER_CACHE_MAX:
+            # query params are client-controlled; keep the memo bounded
+            cache.filtered.clear()
+        result = cache.filtered[key] = _filter_projects(cache, status, language, sort_by, order)
+    return result
+
+
+def _filter_projects(
+    cache: _DerivedCache, status: str | None, language: str | None, sort_by: str, order: str
+) -> list[dict]:
+    """Narrow via the pre-built indexes, then sort a copy of the (small) remainder."""
     if language:
-        projects = [p for p in projects if language.lower() in [l.lower() for l in p["languages"]]]
+        projects = cache.by_language.get(language.lower(), [])
+        if status:
+            projects = [p for p in projects if p["status"] == status]
+    elif status:
+        projects = cache.by_status.get(status, [])
+    else:
+        projects = cache.projects
 
     reverse = order == "desc"
     if sort_by == "health_score":
-        projects.sort(key=lambda p: p["health_score"], reverse=reverse)
-    elif sort_by == "name":
-        projects.sort(key=lambda p: p["name"], reverse=reverse)
-
-    return projects
+        return sorted(projects, key=lambda p: p["health_score"], reverse=reverse)
+    if sort_by == "name":
+        return sorted(projects, key=lambda p: p["name"], reverse=reverse)
+    return list(projects)
 
 
 @app.get("/projects/{name}")
 def get_project(name: str):
-    snapshot = _load_snapshot()
-    if not snapshot:
+    cache = _derived()
+    if not cache.snapshot:
         raise HTTPException(status_code=404, detail="No snapshot available")
 
-    repo = next((r for r in snapshot.get("repos", []) if r["name"] == name), None)
-    if not repo:
+    project = cache.project_by_name.get(name)
+    if not project:
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
-    return _repo_to_project(repo)
+    return _OrjsonResponse(project)
 
 
 # ---------------------------------------------------------------------------
 # Metrics (pass-through from snapshot)
 # ---------------------------------------------------------------------------
 @app.get("/metrics")
-def get_metrics():
-    snapshot = _load_snapshot()
-    if not snapshot:
+def get_metrics(request: Request):
+    cache = _derived()
+    if not cache.snapshot:
         return {"generated_at": "", "repo_count": 0, "repos": []}
-    return snapshot
+    return _snapshot_response(request, cache, cache.snapshot)
 
 
 @app.get("/metrics/watcher")
-def watcher_status():
+async def watcher_status():
+    repos = await asyncio.to_thread(_collector.discover_repos)
     return {
         "running": False,
-        "tracked_repos": len(_collector.discover_repos()),
+        "tracked_repos": len(repos),
         "last_update": None,
         "changes_detected": 0,
         "poll_interval": 5,
@@ -147,44 +356,32 @@ def watcher_status():
 
 
 @app.post("/metrics/scan")
-def trigger_metrics_scan():
-    """Trigger a fresh scan synchronously (blocks until done)."""
-    results = _collector.collect_all()
+async def trigger_metrics_scan():
+    """Trigger a fresh scan and wait for it; the scan itself runs in a worker thread."""
+    results = await asyncio.to_thread(_collector.collect_all)
+    await asyncio.to_thread(_refresh_snapshot_cache)
     return {"status": "ok", "repo_count": len(results)}
 
 
 @app.get("/metrics/{name}")
 def get_repo_metrics(name: str):
-    snapshot = _load_snapshot()
-    if not snapshot:
+    cache = _derived()
+    if not cache.snapshot:
         raise HTTPException(status_code=404)
 
-    repo = next((r for r in snapshot.get("repos", []) if r["name"] == name), None)
+    repo = cache.repo_by_name.get(name)
     if not repo:
         raise HTTPException(status_code=404, detail=f"Repo '{name}' not found")
-    return repo
+    return _OrjsonResponse(repo)
 
 
 # ---------------------------------------------------------------------------
 # Alerts (derived from security findings)
 # ---------------------------------------------------------------------------
 @app.get("/alerts")
-def get_alerts():
-    snapshot = _load_snapshot()
-    if not snapshot:
-        return []
-
-    alerts = []
-    for repo in snapshot.get("repos", []):
-        for finding in repo.get("security_findings", []):
-            alerts.append({
-                "id": f"{repo['name']}-{finding['type']}-{finding['line']}",
-                "type": finding["type"],
-                "project": repo["name"],
-                "message": f"{finding['file']}:{finding['line']}",
-                "score": repo.get("security_score", 100.0),
-            })
-    return alerts
+def get_alerts(request: Request):
+    cache = _derived()
+    return _snapshot_response(request, cache, cache.alerts)
 
 
 # ---------------------------------------------------------------------------
@@ -207,56 +404,28 @@ def intelligence_query():
 # ---------------------------------------------------------------------------
 # Briefings (derived from snapshot)
 # ---------------------------------------------------------------------------
-def _build_briefing(briefing_type: str) -> dict:
-    snapshot = _load_snapshot()
-    repos = snapshot.get("repos", []) if snapshot else []
-
-    active = [r for r in repos if r.get("status") == "active"]
-    avg_health = sum(r.get("health_score", 0) for r in repos) / len(repos) if repos else 0.0
-
-    alerts = []
-    for repo in repos:
-        for finding in repo.get("security_findings", []):
-            alerts.append({
-                "type": finding["type"],
-                "project": repo["name"],
-                "message": f"{finding['file']}:{finding['line']}",
-            })
-
+def _build_briefing(cache: _DerivedCache, briefing_type: str) -> dict:
     return {
         "type": briefing_type,
         "classification": "INTERNAL",
         "timestamp": datetime.now(UTC).isoformat(),
-        "headline": f"{len(repos)} repos tracked · {len(active)} active · avg health {avg_health:.0f}%",
-        "ecosystem_status": {
-            "total_projects": len(repos),
-            "active_projects": len(active),
-            "health_score": round(avg_health, 1),
-        },
-        "alerts": alerts[:10],
-        "project_summaries": [
-            {
-                "name": r["name"],
-                "health_score": r.get("health_score", 0),
-                "status": r.get("status", "unknown"),
-                "insights": [
-                    f"{r.get('primary_language', '—')} · {r.get('total_loc', 0):,} LoC",
-                    f"{r.get('dep_count', 0)} deps · {len(r.get('security_findings', []))} findings",
-                ],
-            }
-            for r in sorted(repos, key=lambda x: x.get("health_score", 0), reverse=True)[:8]
-        ],
+        **cache.briefing,
     }
 
 
+def _briefing_response(request: Request, briefing_type: str) -> Response:
+    cache = _derived()
+    return _snapshot_response(request, cache, _build_briefing(cache, briefing_type))
+
+
 @app.get("/briefing/daily")
-def daily_briefing():
-    return _build_briefing("daily")
+def daily_briefing(request: Request):
+    return _briefing_response(request, "daily")
 
 
 @app.get("/briefing/executive")
-def executive_briefing():
-    return _build_briefing("executive")
+def executive_briefing(request: Request):
+    return _briefing_response(request, "executive")
 
 
 # ---------------------------------------------------------------------------
@@ -264,10 +433,7 @@ def executive_briefing():
 # ---------------------------------------------------------------------------
 @app.get("/graph/dependencies")
 def dependency_graph():
-    snapshot = _load_snapshot()
-    repos = snapshot.get("repos", []) if snapshot else []
-    nodes = [{"id": r["name"], "label": r["name"]} for r in repos]
-    return {"nodes": nodes, "edges": []}
+    return _derived().graph
 
 
 # ---------------------------------------------------------------------------
@@ -275,9 +441,7 @@ def dependency_graph():
 # ---------------------------------------------------------------------------
 @app.post("/actions/summarize/{project_name}")
 def summarize_project(project_name: str):
-    snapshot = _load_snapshot()
-    repos = snapshot.get("repos", []) if snapshot else []
-    repo = next((r for r in repos if r["name"] == project_name), None)
+    repo = _derived().repo_by_name.get(project_name)
     if not repo:
         raise HTTPException(status_code=404)
     lines = [
@@ -11,6 +11,8 @@ Automatically detects the best interface based on environment:
 """
 
 import os
+import shutil
+import signal
 import subprocess
 import sys
 from pathlib import Path
@@ -24,7 +26,8 @@ def detect_environment() -> str:
         str: One of "cli", "tui", or "gui"
     """
     # Check for GUI environment variable
-    if os.getenv("CEREBRO_GUI") or os.getenv("CEREBRO_DASHBOARD"):
+    env = os.environ
+    if env.get("CEREBRO_GUI") or env.get("CEREBRO_DASHBOARD"):
         return "gui"
 
     # Check if running in non-interactive mode (pipe/script)
@@ -32,10 +35,11 @@ def detect_environment() -> str:
         return "cli"
 
     # If user provided arguments (and not just "tui"), use CLI
-    if len(sys.argv) > 1:
+    argv = sys.argv
+    if len(argv) > 1:
         # Check if first arg is a mode selector
-        if sys.argv[1] in ("tui", "gui", "dashboard"):
-            return sys.argv[1] if sys.argv[1] != "dashboard" else "gui"
+        if argv[1] in ("tui", "gui", "dashboard"):
+            return argv[1] if argv[1] != "dashboard" else "gui"
         # Otherwise it's a CLI command
         return "cli"
 
@@ -59,51 +63,98 @@ def launch_tui():
         sys.exit(1)
 
 
+def _frontend_command(dashboard_dir: Path) -> list[str] | None:
+    """Command for the dashboard dev server, preferring node + vite over the npm wrapper."""
+    node = shutil.which("node")
+    vite = dashboard_dir / "node_modules" / "vite" / "bin" / "vite.js"
+    if node and vite.is_file():
+        return [node, str(vite)]
+    npm = shutil.which("npm")
+    if npm:
+        return [npm, "run", "dev"]
+    return None
+
+
+def _raise_interrupt(signum, frame):
+    """Signal handler that unwinds the launcher as if Ctrl+C was pressed."""
+    raise KeyboardInterrupt
+
+
+def _stop_processes(processes: list[subprocess.Popen], timeout: float = 10.0) -> None:
+    """Terminate every process still running, then wait for all of them."""
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
 def launch_gui():
     """Launch the Dashboard GUI (React + FastAPI)."""
     print("🚀 Launching Cerebro Dashboard...")
 
     # Check if dashboard exists
-    dashboard_dir = Path(__file__).parent.parent.parent / "dashboard"
+    project_root = Path(__file__).parent.parent.parent
+    dashboard_dir = project_root / "dashboard"
     if not dashboard_dir.exists():
         print("Error: Dashboard directory not found")
         sys.exit(1)
 
-    # Start the backend API server
-    print("📡 Starting backend API server...")
-    backend_process = subprocess.Popen(
-        ["uvicorn", "cerebro.api.server:app", "--host", "0.0.0.0", "--port", "8009"],
-        cwd=Path(__file__).parent.parent.parent,
-    )
-
-    # Start the frontend dev server
-    print("🎨 Starting frontend dev server...")
+    frontend_cmd = _frontend_command(dashboard_dir)
+    if frontend_cmd is None:
+        print("Error: neither node nor npm found on PATH")
+        sys.exit(1)
+    uvicorn = shutil.which("uvicorn")
+    backend_cmd = [uvicorn] if uvicorn else [sys.executable, "-m", "uvicorn"]
+
+    # Being killed or losing the terminal unwinds like Ctrl+C, so the finally
+    # below stops both servers however the launcher exits.
+    for signum in (signal.SIGTERM, getattr(signal, "SIGHUP", None)):
+        if signum is not None:
+            signal.signal(signum, _raise_interrupt)
+
+    # Start both servers before reporting, so startup costs the slower of the two.
+    # Own sessions keep a terminal Ctrl+C from reaching them; we stop them below.
+    processes: list[subprocess.Popen] = []
     try:
-        frontend_process = subprocess.Popen(
-            ["npm", "run", "dev"],
-            cwd=dashboard_dir,
+        print("📡 Starting backend API server...")
+        processes.append(
+            subprocess.Popen(
+                [*backend_cmd, "cerebro.api.server:app", "--host", "0.0.0.0", "--port", "8009"],
+                cwd=project_root,
+                start_new_session=True,
+            )
         )
 
+        print("🎨 Starting frontend dev server...")
+        try:
+            frontend_process = subprocess.Popen(
+                frontend_cmd,
+                cwd=dashboard_dir,
+                start_new_session=True,
+            )
+        except Exception as e:
+            print(f"Error starting frontend: {e}")
+            sys.exit(1)
+        processes.append(frontend_process)
+
         print("\n✅ Cerebro Dashboard is running!")
         print("   Backend:  http://localhost:8009")
         print("   Frontend: http://localhost:18321")
         print("\nPress Ctrl+C to stop both servers\n")
 
-        # Wait for user interrupt
-        try:
-            frontend_process.wait()
-        except KeyboardInterrupt:
-            print("\n🛑 Shutting down...")
-            frontend_process.terminate()
-            backend_process.terminate()
-            frontend_process.wait()
-            backend_process.wait()
-            print("✅ Shutdown complete")
-
-    except Exception as e:
-        print(f"Error starting frontend: {e}")
-        backend_process.terminate()
-        sys.exit(1)
+        # Wait for user interrupt (or the frontend exiting on its own)
+        frontend_process.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print("\n🛑 Shutting down...")
+        _stop_processes(processes)
+        print("✅ Shutdown complete")
 
 
 def launch_cli():
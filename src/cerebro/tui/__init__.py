@@ -6,8 +6,17 @@ Built with Textual for rich, interactive terminal experience.
 
 __all__ = ["CerebroApp"]
 
+_APP_CLS = None
+
 
 def get_app():
-    """Lazy import of CerebroApp to avoid loading textual at module import time."""
-    from .app import CerebroApp
-    return CerebroApp
+    """Lazy import of CerebroApp to avoid loading textual at module import time.
+
+    The resolved class is cached, so only the first call goes through
+    the import machinery.
+    """
+    global _APP_CLS
+    if _APP_CLS is None:
+        from .app import CerebroApp
+        _APP_CLS = CerebroApp
+    return _APP_CLS
@@ -4,13 +4,137 @@ Cerebro TUI - Interactive Terminal User Interface
 Main Textual application with screen navigation and command integration.
 """
 
+import asyncio
+import inspect
+import logging
 import os
-
+import queue
+import random
+import time
+import warnings
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import ClassVar, NamedTuple
+
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
-from textual.widgets import Button, DataTable, Footer, Header, Input, Label, ProgressBar, Static
+from textual.timer import Timer
+from textual.widgets import (
+    Button,
+    DataTable,
+    Footer,
+    Header,
+    Input,
+    Label,
+    ProgressBar,
+    RichLog,
+    Static,
+)
+from textual.widgets.data_table import RowKey
+
+from cerebro.tui.commands.router import CommandRouter
+from cerebro.tui.state import TUIState
+
+# Intelligence result rendering
+_RESULT_HEADER = "[bold cyan]Result {}:[/bold cyan]".format
+_KV_LINE = "  [yellow]{}:[/yellow] {}".format
+_SKIP_RESULT_KEYS = frozenset(("embedding", "vector"))  # large fields not worth showing
+_MAX_DISPLAYED_RESULTS = 200
+
+# GCP credit status panel
+_CREDITS_TEXT = (
+    "[cyan]Total Credits:[/cyan] ${total:.2f}\n"
+    "[yellow]Used:[/yellow] ${used:.2f}\n"
+    "[green]Remaining:[/green] ${remaining:.2f}\n"
+    "[magenta]Usage:[/magenta] {percentage:.1f}%"
+).format
+
+
+def _truncated_join(items, sep: str, limit: int) -> str:
+    """``sep.join(items)[:limit]``, without joining items past the limit."""
+    parts: list[str] = []
+    length = 0
+    for item in items:
+        if parts:
+            parts.append(sep)
+            length += len(sep)
+        parts.append(item)
+        length += len(item)
+        if length >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
+_clock_cache: list = [None, ""]  # [epoch second, "HH:MM:SS"]
+
+
+def _clock() -> str:
+    """Local wall-clock time as ``HH:MM:SS``, formatted at most once per second."""
+    now = int(time.time())
+    if now != _clock_cache[0]:
+        _clock_cache[0] = now
+        _clock_cache[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    return _clock_cache[1]
+
+
+async def _invoke(handler: Callable[[], object]) -> None:
+    """Call a button handler, awaiting it if it returned an awaitable (async actions)."""
+    result = handler()
+    if inspect.isawaitable(result):
+        await result
+
+
+def _install_uvloop() -> bool:
+    """Use uvloop's event loop policy when it is installed, unless CEREBRO_UVLOOP=0."""
+    if os.getenv("CEREBRO_UVLOOP", "1").strip() in ("0", "false", ""):
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    with warnings.catch_warnings():
+        # event loop policies are deprecated from Python 3.14 but still honoured
+        warnings.simplefilter("ignore", DeprecationWarning)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class Project(NamedTuple):
+    """One row of the projects screen, unpacked once from the router's dict."""
+
+    name: str
+    path: str
+    status: str
+    health_score: float
+    languages: tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Project":
+        return cls(
+            name=data.get("name") or "Unknown",
+            path=data.get("path") or "",
+            status=data.get("status") or "unknown",
+            health_score=data.get("health_score") or 0.0,
+            languages=tuple(data.get("languages") or ()),
+        )
+
+
+class _NotifyOnceMixin:
+    """Drop repeats of the same toast shown within ``NOTIFY_REPEAT_WINDOW`` seconds."""
+
+    NOTIFY_REPEAT_WINDOW = 1.0
+
+    def _notify_once(self, message: str, severity: str = "information") -> None:
+        last_notify: dict[str, float] = self.__dict__.setdefault("_last_notify", {})
+        now = time.monotonic()
+        if now - last_notify.get(message, float("-inf")) < self.NOTIFY_REPEAT_WINDOW:
+            return
+        last_notify[message] = now
+        self.notify(message, severity=severity)
 
 
 class Sidebar(Vertical):
@@ -37,14 +161,27 @@ class DashboardScreen(Screen):
         Binding("s", "quick_scan", "Scan"),
     ]
 
+    # Auto-refresh period in seconds; doubles up to the max while metrics are unchanged
+    REFRESH_INTERVAL = 10.0
+    MAX_REFRESH_INTERVAL = 60.0
+    RESUME_REFRESH_DELAY = 0.1
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.router = None
-        self.auto_refresh = True
+        # Not `auto_refresh`: that is Textual's periodic repaint property on DOMNode
+        self.refresh_enabled = True
+        self._refresh_timer: Timer | None = None
+        self._refresh_interval = self.REFRESH_INTERVAL
+        # the displayed status fields from the last load; None forces a re-render
+        self._last_status_key: tuple | None = None
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "action-scan": self.action_quick_scan,
+            "action-query": lambda: self.app.switch_screen("intelligence"),
+            "action-refresh": self.action_refresh,
+        }
 
     def compose(self) -> ComposeResult:
-        from textual.containers import Horizontal, VerticalScroll
-
         yield Header()
         yield VerticalScroll(
             Static("📊 [bold cyan]Dashboard[/bold cyan]", classes="screen-title"),
@@ -88,22 +225,50 @@ class DashboardScreen(Screen):
 
     async def on_mount(self) -> None:
         """Load initial data when screen mounts."""
-        from cerebro.tui.commands.router import CommandRouter
-
-        self.router = CommandRouter()
+        self.router = self.app.router
         await self.load_metrics()
 
-        # Set up auto-refresh every 10 seconds
-        if self.auto_refresh:
-            self.set_interval(10.0, self.load_metrics)
+    def on_screen_resume(self) -> None:
+        """Start auto-refresh while the dashboard is the visible screen."""
+        if self.refresh_enabled and self._refresh_timer is None:
+            self._refresh_interval = self.REFRESH_INTERVAL
+            # coming back to a dashboard that already has data: refresh almost at once
+            delay = self.RESUME_REFRESH_DELAY if self._last_status_key is not None else self._refresh_interval
+            self._refresh_timer = self.set_timer(delay, self._refresh_tick)
+
+    def on_screen_suspend(self) -> None:
+        """Stop auto-refresh while another screen is in front."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+
+    async def _refresh_tick(self) -> None:
+        """Reload metrics, then schedule the next refresh with back-off while nothing changes."""
+        self._refresh_timer = None
+        changed = await self.load_metrics()
+        if changed:
+            self._refresh_interval = self.REFRESH_INTERVAL
+        else:
+            self._refresh_interval = min(self.MAX_REFRESH_INTERVAL, self._refresh_interval * 2)
+        if self.refresh_enabled and self.is_current and self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(self._refresh_interval, self._refresh_tick)
 
-    async def load_metrics(self) -> None:
-        """Load and display system metrics."""
+    async def load_metrics(self) -> bool:
+        """Load and display system metrics; returns whether they changed since the last load."""
         if not self.router:
-            return
+            return False
 
         try:
             status = await self.router.get_system_status()
+            status_key = (
+                status.get('total_projects'),
+                status.get('active_projects'),
+                round(status.get('health_score', 0), 1),
+                status.get('total_intelligence'),
+            )
+            if status_key == self._last_status_key:
+                return False
+            self._last_status_key = status_key
 
             metrics_text = f"""
 [cyan]Total Projects:[/cyan] {status.get('total_projects', 0)}
@@ -125,18 +290,19 @@ class DashboardScreen(Screen):
             else:
                 alerts_widget.update("[green]✓ All systems healthy[/green]")
 
+            return True
+
         except Exception as e:
+            self._last_status_key = None
             metrics_widget = self.query_one("#metrics-display", Static)
             metrics_widget.update(f"[red]Error loading metrics: {e!s}[/red]")
+            return False
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle quick action button clicks."""
-        if event.button.id == "action-scan":
-            self.action_quick_scan()
-        elif event.button.id == "action-query":
-            self.app.switch_screen("intelligence")
-        elif event.button.id == "action-refresh":
-            self.action_refresh()
+        handler = self._button_handlers.get(event.button.id)
+        if handler is not None:
+            await _invoke(handler)
 
     async def action_quick_scan(self) -> None:
         """Execute quick project scan."""
@@ -167,7 +333,7 @@ class DashboardScreen(Screen):
         await self.load_metrics()
 
 
-class ProjectsScreen(Screen):
+class ProjectsScreen(_NotifyOnceMixin, Screen):
     """Projects management and health scores."""
 
     BINDINGS = [
@@ -176,12 +342,36 @@ class ProjectsScreen(Screen):
         Binding("/", "focus_search", "Search"),
     ]
 
+    STATUS_COLORS: ClassVar[dict[str, str]] = {
+        "active": "green",
+        "inactive": "yellow",
+        "error": "red",
+        "unknown": "dim"
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.router = None
-        self.all_projects = []
+        self.all_projects: list[Project] = []
+        # (lowercased name, lowercased path) per project, rebuilt only when projects reload
+        self._search_index: list[tuple[str, str]] = []
+        # table cells per project, parallel to _search_index, so filtering never re-renders markup
+        self._rendered_rows: list[tuple[Text, Text, Text, Text, Text]] = []
+        # rows currently in the table -> their project, for selection under a filter
+        self._row_to_project: dict[RowKey, Project] = {}
         self.page_size = 100  # Show 100 projects at a time
         self.current_page = 0
+        # Search input is debounced: only the text still there after the delay is applied
+        self.filter_debounce = 0.08
+        self._filter_timer: Timer | None = None
+        self._pending_filter = ""
+        self._last_filter: str | None = None
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-refresh": self.action_refresh,
+            "btn-analyze": lambda: self._notify_once("Analyze feature coming soon", severity="information"),
+            "btn-summarize": lambda: self._notify_once("Summarize feature coming soon", severity="information"),
+            "btn-open": lambda: self._notify_once("Open path feature coming soon", severity="information"),
+        }
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -223,9 +413,7 @@ class ProjectsScreen(Screen):
 
     async def on_mount(self) -> None:
         """Initialize the projects table."""
-        from cerebro.tui.commands.router import CommandRouter
-
-        self.router = CommandRouter()
+        self.router = self.app.router
 
         # Set up table columns
         table = self.query_one("#projects-table", DataTable)
@@ -240,64 +428,66 @@ class ProjectsScreen(Screen):
             return
 
         try:
-            self.all_projects = await self.router.get_projects()
+            self.all_projects = [Project.from_dict(p) for p in await self.router.get_projects()]
+            self._search_index = [(p.name.lower(), p.path.lower()) for p in self.all_projects]
+            self._rendered_rows = [self._render_row(p) for p in self.all_projects]
             await self.update_table()
         except Exception as e:
             table = self.query_one("#projects-table", DataTable)
             table.clear()
+            self._row_to_project = {}
             details = self.query_one("#project-details", Static)
             details.update(f"[red]Error loading projects: {e!s}[/red]")
 
+    @classmethod
+    def _render_row(cls, project: Project) -> tuple[Text, Text, Text, Text, Text]:
+        """Table cells for one project, with health and status color-coded.
+
+        Cells are styled ``Text`` rather than markup strings, so DataTable never
+        parses markup (and names or paths containing ``[`` render verbatim).
+        """
+        name, path, status, health, languages = project
+        languages = _truncated_join(languages, ", ", 30)
+        path = path[:50]
+
+        # Color-code health score
+        if health >= 75:
+            health_color = "green"
+        elif health >= 50:
+            health_color = "yellow"
+        else:
+            health_color = "red"
+
+        return (
+            Text(name),
+            Text(status, style=cls.STATUS_COLORS.get(status, "white")),
+            Text(f"{health:.1f}", style=health_color),
+            Text(languages),
+            Text(path),
+        )
+
     async def update_table(self, filter_text: str = "") -> None:
         """Update table with filtered and paginated projects."""
-        table = self.query_one("#projects-table", DataTable)
-        table.clear()
+        self._last_filter = filter_text
 
-        # Filter projects
-        projects = self.all_projects
+        # Filter and paginate (show first page_size projects) as positions into
+        # the pre-rendered rows; matches past the page are counted, not kept.
+        # Full pagination with prev/next buttons can be added later
         if filter_text:
             filter_lower = filter_text.lower()
-            projects = [
-                p for p in projects
-                if filter_lower in p.get("name", "").lower()
-                or filter_lower in p.get("path", "").lower()
-            ]
-
-        # Paginate for performance (show first page_size projects)
-        # Full pagination with prev/next buttons can be added later
-        displayed_projects = projects[:self.page_size]
-
-        # Add rows
-        for project in displayed_projects:
-            name = project.get("name", "Unknown")
-            status = project.get("status", "unknown")
-            health = project.get("health_score", 0)
-            languages = ", ".join(project.get("languages", []))[:30]
-            path = project.get("path", "")[:50]
-
-            # Color-code health score
-            if health >= 75:
-                health_str = f"[green]{health:.1f}[/green]"
-            elif health >= 50:
-                health_str = f"[yellow]{health:.1f}[/yellow]"
-            else:
-                health_str = f"[red]{health:.1f}[/red]"
-
-            # Color-code status
-            status_colors = {
-                "active": "green",
-                "inactive": "yellow",
-                "error": "red",
-                "unknown": "dim"
-            }
-            status_color = status_colors.get(status, "white")
-            status_str = f"[{status_color}]{status}[/{status_color}]"
-
-            table.add_row(name, status_str, health_str, languages, path)
+            displayed: list[int] = []
+            total_filtered = 0
+            for idx, (name, path) in enumerate(self._search_index):
+                if filter_lower in name or filter_lower in path:
+                    total_filtered += 1
+                    if len(displayed) < self.page_size:
+                        displayed.append(idx)
+        else:
+            total_filtered = len(self._rendered_rows)
+            displayed = list(range(min(total_filtered, self.page_size)))
 
         # Update count
-        total_filtered = len(projects)
-        showing = len(displayed_projects)
+        showing = len(displayed)
         count_text = f"[dim]Showing {showing} of {total_filtered} projects"
         if total_filtered != len(self.all_projects):
             count_text += f" ({len(self.all_projects)} total)"
@@ -308,42 +498,50 @@ class ProjectsScreen(Screen):
         if total_filtered > self.page_size:
             count_text += f" [yellow](Limited to first {self.page_size} for performance)[/yellow]"
 
+        # Swap table contents and count in one compositor update
+        table = self.query_one("#projects-table", DataTable)
         details = self.query_one("#project-details", Static)
-        details.update(count_text)
+        with self.app.batch_update():
+            table.clear()
+            row_keys = table.add_rows(self._rendered_rows[idx] for idx in displayed)
+            details.update(count_text)
+        self._row_to_project = {key: self.all_projects[idx] for key, idx in zip(row_keys, displayed, strict=True)}
 
-    async def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Handle search input changes, rebuilding the table once typing pauses."""
         if event.input.id == "search-input":
-            await self.update_table(event.value)
+            self._pending_filter = event.value
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(self.filter_debounce, self._apply_pending_filter)
+
+    async def _apply_pending_filter(self) -> None:
+        """Apply the latest search text unless the table already shows it."""
+        self._filter_timer = None
+        if self._pending_filter != self._last_filter:
+            await self.update_table(self._pending_filter)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection to show project details."""
-        row_index = event.cursor_row
-
-        if 0 <= row_index < len(self.all_projects):
-            project = self.all_projects[row_index]
+        project = self._row_to_project.get(event.row_key)
 
+        if project is not None:
             details_text = f"""
-[cyan]Name:[/cyan] {project.get('name', 'N/A')}
-[cyan]Path:[/cyan] {project.get('path', 'N/A')}
-[cyan]Status:[/cyan] {project.get('status', 'N/A')}
-[cyan]Health Score:[/cyan] {project.get('health_score', 0):.1f}/100
-[cyan]Languages:[/cyan] {', '.join(project.get('languages', []))}
+[cyan]Name:[/cyan] {project.name}
+[cyan]Path:[/cyan] {project.path or 'N/A'}
+[cyan]Status:[/cyan] {project.status}
+[cyan]Health Score:[/cyan] {project.health_score:.1f}/100
+[cyan]Languages:[/cyan] {', '.join(project.languages)}
             """
 
             details = self.query_one("#project-details", Static)
             details.update(details_text.strip())
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle action button clicks."""
-        if event.button.id == "btn-refresh":
-            self.action_refresh()
-        elif event.button.id == "btn-analyze":
-            self.notify("Analyze feature coming soon", severity="information")
-        elif event.button.id == "btn-summarize":
-            self.notify("Summarize feature coming soon", severity="information")
-        elif event.button.id == "btn-open":
-            self.notify("Open path feature coming soon", severity="information")
+        handler = self._button_handlers.get(event.button.id)
+        if handler is not None:
+            await _invoke(handler)
 
     async def action_refresh(self) -> None:
         """Refresh projects list."""
@@ -356,7 +554,7 @@ class ProjectsScreen(Screen):
         search_input.focus()
 
 
-class IntelligenceScreen(Screen):
+class IntelligenceScreen(_NotifyOnceMixin, Screen):
     """AI-powered query interface with grounded generation."""
 
     BINDINGS = [
@@ -364,11 +562,25 @@ class IntelligenceScreen(Screen):
         Binding("ctrl+q", "focus_query", "Focus Query"),
     ]
 
+    # Minimum seconds between streamed progress renders in the status line
+    STATUS_THROTTLE = 0.05
+    # Queries kept in memory for the session, oldest first
+    QUERY_HISTORY_LIMIT = 200
+    # Result widgets mounted per batch before yielding back to the event loop
+    RESULTS_CHUNK = 10
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.router = None
-        self.query_history = []
+        self.query_history: deque[dict] = deque(maxlen=self.QUERY_HISTORY_LIMIT)
         self.state_manager = None
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-search": self.action_execute_query,
+            "btn-clear": self.action_clear_results,
+            "btn-export": self.action_export_results,
+            "mode-semantic": lambda: self.set_semantic_mode(True),
+            "mode-exact": lambda: self.set_semantic_mode(False),
+        }
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -416,6 +628,7 @@ class IntelligenceScreen(Screen):
                 Static("[bold]Results[/bold]", classes="panel-header"),
                 VerticalScroll(
                     Static("No results yet. Enter a query above to search.", id="results-display"),
+                    Vertical(id="results-list"),
                     id="results-scroll",
                     classes="results-scroll"
                 ),
@@ -428,11 +641,8 @@ class IntelligenceScreen(Screen):
 
     async def on_mount(self) -> None:
         """Initialize the intelligence screen."""
-        from cerebro.tui.commands.router import CommandRouter
-        from cerebro.tui.state import TUIState
-
-        self.router = CommandRouter()
-        self.state_manager = TUIState()
+        self.router = self.app.router
+        self.state_manager = self.app.state_manager
 
         # Load saved mode and limit
         self.semantic_mode = self.state_manager.get("intelligence.last_mode", "semantic") == "semantic"
@@ -445,23 +655,23 @@ class IntelligenceScreen(Screen):
         # Update mode buttons
         self.update_mode_buttons()
 
-        # Load query history
-        self.query_history = self.state_manager.get("intelligence.query_history", [])
+        # Load query history (persisted newest first, held oldest first). Copying
+        # also keeps appends here from mutating the list TUIState persists.
+        self.query_history = deque(
+            reversed(self.state_manager.get("intelligence.query_history", [])),
+            maxlen=self.QUERY_HISTORY_LIMIT,
+        )
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
-        if event.button.id == "btn-search":
-            self.action_execute_query()
-        elif event.button.id == "btn-clear":
-            self.action_clear_results()
-        elif event.button.id == "btn-export":
-            self.action_export_results()
-        elif event.button.id == "mode-semantic":
-            self.semantic_mode = True
-            self.update_mode_buttons()
-        elif event.button.id == "mode-exact":
-            self.semantic_mode = False
-            self.update_mode_buttons()
+        handler = self._button_handlers.get(event.button.id)
+        if handler is not None:
+            await _invoke(handler)
+
+    def set_semantic_mode(self, semantic: bool) -> None:
+        """Switch between semantic and exact search."""
+        self.semantic_mode = semantic
+        self.update_mode_buttons()
 
     def update_mode_buttons(self) -> None:
         """Update mode button styles."""
@@ -506,7 +716,12 @@ class IntelligenceScreen(Screen):
 
         # Clear previous results
         results_widget = self.query_one("#results-display", Static)
-        results_widget.update("[dim]Searching...[/dim]")
+        await self._show_results_message("[dim]Searching...[/dim]")
+
+        # Progress messages render at most once per STATUS_THROTTLE; the newest
+        # skipped one is flushed if the stream ends on progress.
+        last_progress = 0.0
+        pending_progress: str | None = None
 
         try:
             async for update in self.router.run_intelligence_query(
@@ -518,63 +733,104 @@ class IntelligenceScreen(Screen):
                 message = update.get("message", "")
 
                 if status == "complete":
+                    pending_progress = None
                     results = update.get("results", [])
 
                     if not results:
                         results_widget.update("[dim]No results found.[/dim]")
                         status_widget.update("[yellow]⚠️  No results found[/yellow]")
                     else:
-                        # Format results
-                        formatted = self.format_results(results)
-                        results_widget.update(formatted)
                         status_widget.update(f"[green]✓ Found {len(results)} results[/green]")
+                        await self._render_results(results)
 
                     # Add to history
                     query_record = {
                         "query": query_text,
                         "mode": "semantic" if self.semantic_mode else "exact",
                         "results_count": len(results),
-                        "timestamp": __import__('datetime').datetime.now().isoformat()
+                        "timestamp": datetime.now().isoformat()
                     }
                     self.query_history.append(query_record)
 
                     # Save to persistent state
                     if self.state_manager:
-                        self.state_manager.add_to_history("intelligence.query_history", query_record)
-                        self.state_manager.set("intelligence.last_mode", "semantic" if self.semantic_mode else "exact")
-                        self.state_manager.set("intelligence.last_limit", limit)
+                        self.state_manager.add_to_history("intelligence.query_history", query_record, save=False)
+                        self.state_manager.set_many({
+                            "intelligence.last_mode": "semantic" if self.semantic_mode else "exact",
+                            "intelligence.last_limit": limit,
+                        })
 
                 elif status == "error":
+                    pending_progress = None
                     results_widget.update(f"[red]✗ Error: {message}[/red]")
                     status_widget.update("[red]✗ Query failed[/red]")
                 else:
-                    status_widget.update(f"[yellow]🔄 {message}[/yellow]")
+                    now = time.monotonic()
+                    if now - last_progress >= self.STATUS_THROTTLE:
+                        status_widget.update(f"[yellow]🔄 {message}[/yellow]")
+                        last_progress = now
+                        pending_progress = None
+                    else:
+                        pending_progress = message
+
+            if pending_progress is not None:
+                status_widget.update(f"[yellow]🔄 {pending_progress}[/yellow]")
 
         except Exception as e:
-            results_widget.update(f"[red]✗ Error executing query: {e!s}[/red]")
+            await self._show_results_message(f"[red]✗ Error executing query: {e!s}[/red]")
             status_widget.update("[red]✗ Error[/red]")
 
+    async def _show_results_message(self, text: str) -> None:
+        """Replace any rendered results with a single message line."""
+        results_widget = self.query_one("#results-display", Static)
+        results_widget.update(text)
+        results_widget.display = True
+        await self.query_one("#results-list", Vertical).remove_children()
+
+    async def _render_results(self, results: list) -> None:
+        """Mount one widget per result in small batches so the first ones show immediately."""
+        results_list = self.query_one("#results-list", Vertical)
+        await results_list.remove_children()
+        self.query_one("#results-display", Static).display = False
+
+        shown = results[:_MAX_DISPLAYED_RESULTS]
+        for start in range(0, len(shown), self.RESULTS_CHUNK):
+            chunk = shown[start:start + self.RESULTS_CHUNK]
+            await results_list.mount_all(
+                Static(self.format_result(i, result), classes="result-item")
+                for i, result in enumerate(chunk, start + 1)
+            )
+            await asyncio.sleep(0)  # let the frame render and input through between batches
+
+        hidden = len(results) - _MAX_DISPLAYED_RESULTS
+        if hidden > 0:
+            await results_list.mount(Static(f"[dim]({hidden} more hidden)[/dim]", classes="result-item"))
+
+    @staticmethod
+    def format_result(i: int, result) -> str:
+        """Format one query result for display."""
+        output_lines = [_RESULT_HEADER(i)]
+
+        # Handle different result formats
+        if isinstance(result, dict):
+            output_lines += [_KV_LINE(key, value) for key, value in result.items() if key not in _SKIP_RESULT_KEYS]
+        else:
+            output_lines.append(f"  {result}")
+
+        return "\n".join(output_lines)
+
     def format_results(self, results: list) -> str:
-        """Format query results for display."""
+        """Format query results for display as one block."""
         if not results:
             return "[dim]No results.[/dim]"
 
-        output_lines = []
-
-        for i, result in enumerate(results, 1):
-            output_lines.append(f"[bold cyan]Result {i}:[/bold cyan]")
+        blocks = [self.format_result(i, result) for i, result in enumerate(results[:_MAX_DISPLAYED_RESULTS], 1)]
 
-            # Handle different result formats
-            if isinstance(result, dict):
-                for key, value in result.items():
-                    if key not in ["embedding", "vector"]:  # Skip large fields
-                        output_lines.append(f"  [yellow]{key}:[/yellow] {value}")
-            else:
-                output_lines.append(f"  {result}")
-
-            output_lines.append("")  # Blank line between results
+        hidden = len(results) - _MAX_DISPLAYED_RESULTS
+        if hidden > 0:
+            blocks.append(f"[dim]({hidden} more hidden)[/dim]")
 
-        return "\n".join(output_lines)
+        return "\n\n".join(blocks)
 
     def action_clear_results(self) -> None:
         """Clear query results."""
@@ -583,13 +839,15 @@ class IntelligenceScreen(Screen):
 
         results_widget = self.query_one("#results-display", Static)
         results_widget.update("[dim]No results yet. Enter a query above to search.[/dim]")
+        results_widget.display = True
+        self.query_one("#results-list", Vertical).remove_children()
 
         status_widget = self.query_one("#query-status", Static)
         status_widget.update("Ready")
 
     def action_export_results(self) -> None:
         """Export results to markdown."""
-        self.notify("Export feature coming soon", severity="information")
+        self._notify_once("Export feature coming soon", severity="information")
 
     def action_focus_query(self) -> None:
         """Focus the query input."""
@@ -597,23 +855,49 @@ class IntelligenceScreen(Screen):
         query_input.focus()
 
 
-class ScriptsScreen(Screen):
+class ScriptsScreen(_NotifyOnceMixin, Screen):
     """Script launcher with progress monitoring."""
 
     BINDINGS = [
         Binding("escape", "app.pop_screen", "Back"),
     ]
 
+    # Trailing output lines kept in the output log
+    OUTPUT_MAX_LINES = 500
+
+    # (group, command) -> (router method, positional args, returns or streams result dicts
+    # instead of progress updates). Not `COMMANDS`: Textual reads that as the
+    # screen's command-palette providers.
+    COMMAND_DISPATCH: ClassVar[dict[tuple[str, str], tuple[str, tuple, bool]]] = {
+        ("gcp", "burn"): ("run_batch_burn", (), False),
+        ("gcp", "monitor"): ("monitor_gcp_credits", (), True),
+        ("strategy", "optimize"): ("run_strategy_optimizer", (), False),
+        ("content", "mine"): ("run_content_miner", ("default_topic",), False),
+        ("test", "grounded-search"): ("run_grounded_search_test", ("test query",), False),
+        ("knowledge", "index-repo"): ("run_knowledge_index", (".",), False),
+        ("knowledge", "docs"): ("generate_documentation", ("project",), False),
+    }
+
+    # Widgets written while a command streams, bound in on_mount
+    _exec_status: Static
+    _exec_output: RichLog
+    _exec_progress: ProgressBar
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.router = None
         self.commands = {}
         self.selected_group = None
         self.selected_command = None
+        # The running command, so Stop can cancel it
+        self._execute_task: asyncio.Task | None = None
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-execute": self.action_execute_command,
+            "btn-stop": self.action_stop_execution,
+            "btn-clear-output": self.action_clear_output,
+        }
 
     def compose(self) -> ComposeResult:
-        from textual.widgets import ProgressBar
-
         yield Header()
         yield VerticalScroll(
             Static("⚙️  [bold cyan]Scripts & Commands[/bold cyan]", classes="screen-title"),
@@ -679,11 +963,7 @@ class ScriptsScreen(Screen):
             # Output Panel
             Container(
                 Static("[bold]Output[/bold]", classes="panel-header"),
-                VerticalScroll(
-                    Static("", id="command-output"),
-                    id="output-scroll",
-                    classes="output-scroll"
-                ),
+                RichLog(id="command-output", max_lines=self.OUTPUT_MAX_LINES, markup=True, auto_scroll=True),
                 classes="output-panel"
             ),
 
@@ -693,27 +973,26 @@ class ScriptsScreen(Screen):
 
     async def on_mount(self) -> None:
         """Initialize the scripts screen."""
-        from cerebro.tui.commands.router import CommandRouter
-
-        self.router = CommandRouter()
+        self.router = self.app.router
+        # Execution widgets, looked up once instead of per run
+        self._exec_status = self.query_one("#exec-status", Static)
+        self._exec_output = self.query_one("#command-output", RichLog)
+        self._exec_progress = self.query_one("#exec-progress", ProgressBar)
         self.commands = await self.router.get_available_commands()
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
         button_id = event.button.id
+        handler = self._button_handlers.get(button_id)
 
-        if button_id and button_id.startswith("group-"):
+        if handler is not None:
+            await _invoke(handler)
+        elif button_id and button_id.startswith("group-"):
             group_name = button_id.replace("group-", "")
             self.select_group(group_name)
         elif button_id and button_id.startswith("cmd-"):
             command_name = button_id.replace("cmd-", "").split("-", 1)[1]
             self.select_command(command_name)
-        elif button_id == "btn-execute":
-            self.action_execute_command()
-        elif button_id == "btn-stop":
-            self.action_stop_execution()
-        elif button_id == "btn-clear-output":
-            self.action_clear_output()
 
     def select_group(self, group_name: str) -> None:
         """Select a command group and display its commands."""
@@ -767,87 +1046,119 @@ class ScriptsScreen(Screen):
         if not self.selected_group or not self.selected_command:
             self.notify("Please select a command first", severity="warning")
             return
+        if self._execute_task is not None and not self._execute_task.done():
+            self._notify_once("A command is already running", severity="warning")
+            return
 
+        # Run in its own task so the screen stays responsive and Stop can cancel it
+        self._execute_task = asyncio.create_task(
+            self._run_command(self.selected_group, self.selected_command)
+        )
+
+    async def _run_command(self, group: str, command: str) -> None:
+        """Execute one command, streaming its updates into the output panel."""
         # Update status
-        status = self.query_one("#exec-status", Static)
-        status.update(f"[yellow]🔄 Executing {self.selected_group} {self.selected_command}...[/yellow]")
+        status = self._exec_status
+        status.update(f"[yellow]🔄 Executing {group} {command}...[/yellow]")
 
         # Clear previous output
-        output = self.query_one("#command-output", Static)
-        output.update("[dim]Starting execution...[/dim]\n")
+        output = self._exec_output
+        output.clear()
+        output.write("[dim]Starting execution...[/dim]")
 
         # Show progress
-        progress = self.query_one("#exec-progress", ProgressBar)
+        progress = self._exec_progress
 
         try:
             # Route to appropriate command
-            command_map = {
-                ("gcp", "burn"): self.router.run_batch_burn,
-                ("gcp", "monitor"): lambda: self._simple_command(self.router.monitor_gcp_credits),
-                ("strategy", "optimize"): self.router.run_strategy_optimizer,
-                ("content", "mine"): lambda: self.router.run_content_miner("default_topic"),
-                ("test", "grounded-search"): lambda: self.router.run_grounded_search_test("test query"),
-                ("knowledge", "index-repo"): lambda: self.router.run_knowledge_index("."),
-                ("knowledge", "docs"): lambda: self.router.generate_documentation("project"),
-            }
-
-            command_key = (self.selected_group, self.selected_command)
-            command_func = command_map.get(command_key)
-
-            if not command_func:
-                output.update(f"[yellow]⚠️  Command not yet implemented: {self.selected_group} {self.selected_command}[/yellow]")
+            spec = self.COMMAND_DISPATCH.get((group, command))
+
+            if spec is None:
+                output.write(f"[yellow]⚠️  Command not yet implemented: {group} {command}[/yellow]")
                 status.update("[yellow]⚠️  Not implemented[/yellow]")
                 return
 
-            # Execute and stream results
-            output_lines = []
-            async for update in command_func():
+            method_name, args, simple = spec
+            command_func = getattr(self.router, method_name)
+            updates = self._simple_command(command_func, *args) if simple else command_func(*args)
+
+            # Execute and stream results. Messages are appended to the output
+            # log; the progress bar only moves by whole percents, and is
+            # flushed on complete/error and when the stream ends.
+            shown_prog = None
+            prog = 0
+            async for update in updates:
                 status_val = update.get("status")
                 message = update.get("message", "")
                 prog = update.get("progress", 0)
-
-                # Update progress bar
-                progress.update(progress=prog)
-
-                # Update output
-                output_lines.append(message)
-                output.update("\n".join(output_lines))
+                if message:
+                    output.write(message)
 
                 # Update status
+                final = status_val in ("complete", "error")
                 if status_val == "complete":
                     result = update.get("result", {})
                     status.update("[green]✓ Complete[/green]")
-                    output_lines.append(f"\n[green]✓ Result: {result}[/green]")
-                    output.update("\n".join(output_lines))
+                    output.write(f"\n[green]✓ Result: {result}[/green]")
                 elif status_val == "error":
                     status.update("[red]✗ Error[/red]")
 
+                # Update progress bar
+                if final or shown_prog is None or abs(prog - shown_prog) >= 1:
+                    progress.update(progress=prog)
+                    shown_prog = prog
+
+            if shown_prog != prog:
+                progress.update(progress=prog)
+
+        except asyncio.CancelledError:
+            status.update("[yellow]⏹ Stopped[/yellow]")
+            output.write("[yellow]⏹ Execution stopped[/yellow]")
+            raise
         except Exception as e:
             status.update("[red]✗ Execution failed[/red]")
-            output.update(f"[red]✗ Error: {e!s}[/red]")
+            output.write(f"[red]✗ Error: {e!s}[/red]")
 
-    async def _simple_command(self, coro):
-        """Wrapper for commands that return dict instead of streaming."""
-        result = await coro()
+    async def _simple_command(self, func, *args):
+        """Wrapper for commands that return a result dict instead of progress updates.
+
+        Commands that stream result snapshots (cached, then fresh) report each
+        earlier snapshot as progress and complete with the last one.
+        """
+        result = func(*args)
+        if inspect.isawaitable(result):
+            result = await result
+        else:
+            snapshot = None
+            async for latest in result:
+                if snapshot is not None:
+                    yield {"status": "running", "progress": 50, "message": f"Cached: {snapshot}"}
+                snapshot = latest
+            result = snapshot
         yield {"status": "complete", "progress": 100, "message": "Done", "result": result}
 
     def action_stop_execution(self) -> None:
         """Stop current command execution."""
-        self.notify("Stop functionality coming soon", severity="information")
+        task = self._execute_task
+        if task is None or task.done():
+            self._notify_once("No command is running", severity="information")
+            return
+        task.cancel()
+        self.notify("Stopping command...", severity="warning")
+
+    def on_unmount(self) -> None:
+        """Cancel a running command with the screen."""
+        if self._execute_task is not None:
+            self._execute_task.cancel()
 
     def action_clear_output(self) -> None:
         """Clear command output."""
-        output = self.query_one("#command-output", Static)
-        output.update("")
-
-        status = self.query_one("#exec-status", Static)
-        status.update("Status: Ready")
+        self._exec_output.clear()
+        self._exec_status.update("Status: Ready")
+        self._exec_progress.update(progress=0)
 
-        progress = self.query_one("#exec-progress", ProgressBar)
-        progress.update(progress=0)
 
-
-class GCPCreditsScreen(Screen):
+class GCPCreditsScreen(_NotifyOnceMixin, Screen):
     """GCP Credit Management & Batch Execution."""
 
     BINDINGS = [
@@ -855,10 +1166,31 @@ class GCPCreditsScreen(Screen):
         Binding("r", "refresh", "Refresh"),
     ]
 
+    # Minimum seconds between streamed progress renders in the status line
+    STATUS_THROTTLE = 0.05
+    # Completed burns listed in the history panel
+    BURN_HISTORY_LIMIT = 10
+
+    # Widgets written while loading credits and streaming a burn, bound in on_mount
+    _credits_display: Static
+    _credits_progress: ProgressBar
+    _burn_status: Static
+    _burn_progress: ProgressBar
+    _burn_history: Static
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.router = None
         self.credits_info = {}
+        # Completed burns for this session, newest first
+        self.burn_history: deque[str] = deque(maxlen=self.BURN_HISTORY_LIMIT)
+        # The running burn, so Stop can cancel it
+        self._burn_task: asyncio.Task | None = None
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-start-burn": self.action_start_burn,
+            "btn-stop-burn": self.action_stop_burn,
+            "btn-refresh": self.action_refresh,
+        }
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -934,50 +1266,47 @@ class GCPCreditsScreen(Screen):
 
     async def on_mount(self) -> None:
         """Initialize the GCP credits screen."""
-        from cerebro.tui.commands.router import CommandRouter
-
-        self.router = CommandRouter()
+        self.router = self.app.router
+        # Widgets updated while loading credits and streaming a burn, looked up once
+        self._credits_display = self.query_one("#credits-display", Static)
+        self._credits_progress = self.query_one("#credits-progress", ProgressBar)
+        self._burn_status = self.query_one("#burn-status", Static)
+        self._burn_progress = self.query_one("#burn-progress", ProgressBar)
+        self._burn_history = self.query_one("#burn-history", Static)
         await self.load_credits()
 
     async def load_credits(self) -> None:
-        """Load current credit status."""
+        """Load current credit status, painting the cached snapshot before the fresh one."""
         if not self.router:
             return
 
         try:
-            self.credits_info = await self.router.monitor_gcp_credits()
-
-            total = self.credits_info.get("total_credits", 0)
-            used = self.credits_info.get("used_credits", 0)
-            remaining = self.credits_info.get("remaining_credits", 0)
-            percentage = self.credits_info.get("usage_percentage", 0)
-
-            # Update display
-            credits_display = self.query_one("#credits-display", Static)
-            credits_text = f"""
-[cyan]Total Credits:[/cyan] ${total:.2f}
-[yellow]Used:[/yellow] ${used:.2f}
-[green]Remaining:[/green] ${remaining:.2f}
-[magenta]Usage:[/magenta] {percentage:.1f}%
-            """
-            credits_display.update(credits_text.strip())
+            async for snapshot in self.router.monitor_gcp_credits():
+                self.credits_info = snapshot
+                self._render_credits(snapshot)
+        except Exception as e:
+            self._credits_display.update(f"[red]Error loading credits: {e!s}[/red]")
 
-            # Update progress bar
-            progress = self.query_one("#credits-progress", ProgressBar)
-            progress.update(progress=int(percentage))
+    def _render_credits(self, credits_info: dict) -> None:
+        """Show one credit status snapshot."""
+        total = credits_info.get("total_credits", 0)
+        used = credits_info.get("used_credits", 0)
+        remaining = credits_info.get("remaining_credits", 0)
+        percentage = credits_info.get("usage_percentage", 0)
 
-        except Exception as e:
-            credits_display = self.query_one("#credits-display", Static)
-            credits_display.update(f"[red]Error loading credits: {e!s}[/red]")
+        # Update display
+        self._credits_display.update(
+            _CREDITS_TEXT(total=total, used=used, remaining=remaining, percentage=percentage)
+        )
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+        # Update progress bar
+        self._credits_progress.update(progress=int(percentage))
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
-        if event.button.id == "btn-start-burn":
-            self.action_start_burn()
-        elif event.button.id == "btn-stop-burn":
-            self.action_stop_burn()
-        elif event.button.id == "btn-refresh":
-            self.action_refresh()
+        handler = self._button_handlers.get(event.button.id)
+        if handler is not None:
+            await _invoke(handler)
 
     async def action_start_burn(self) -> None:
         """Start batch execution operation."""
@@ -995,30 +1324,56 @@ class GCPCreditsScreen(Screen):
             self.notify("Invalid input values", severity="error")
             return
 
+        if self._burn_task is not None and not self._burn_task.done():
+            self._notify_once("A batch is already running", severity="warning")
+            return
+
         # Confirm large burns
         if queries > 1000:
             self.notify("Large batch requested. Confirm in status bar.", severity="warning")
             # In production, show a confirmation dialog
 
+        # Run in its own task so the screen stays responsive and Stop can cancel it
+        self._burn_task = asyncio.create_task(self._run_burn(queries, workers))
+
+    async def _run_burn(self, queries: int, workers: int) -> None:
+        """Stream one batch burn into the status line, progress bar and history."""
         # Update status
-        status = self.query_one("#burn-status", Static)
+        status = self._burn_status
         status.update(f"[yellow]Executing {queries} queries with {workers} workers...[/yellow]")
 
-        # Clear history and prepare for new entry
-        history = self.query_one("#burn-history", Static)
+        history = self._burn_history
 
         try:
-            history_lines = []
-            progress_bar = self.query_one("#burn-progress", ProgressBar)
+            progress_bar = self._burn_progress
+
+            # Progress renders at most once per STATUS_THROTTLE and the bar only
+            # moves by whole percents; the newest skipped update is flushed if
+            # the stream ends on progress.
+            last_flush = 0.0
+            shown_prog = None
+            pending: tuple[str, float] | None = None
+
+            # One limit shared by the TUI and the router's query pool
+            sem = asyncio.BoundedSemaphore(max(1, workers))
 
-            async for update in self.router.run_batch_burn(queries, workers):
+            async for update in self.router.run_batch_burn(queries, workers, sem=sem):
                 status_val = update.get("status")
                 message = update.get("message", "")
                 prog = update.get("progress", 0)
 
                 # Update progress
-                progress_bar.update(progress=prog)
-                status.update(f"[yellow]{message}[/yellow]")
+                now = time.monotonic()
+                final = status_val in ("complete", "error")
+                if final or now - last_flush >= self.STATUS_THROTTLE:
+                    if shown_prog is None or abs(prog - shown_prog) >= 1 or (final and prog != shown_prog):
+                        progress_bar.update(progress=prog)
+                        shown_prog = prog
+                    status.update(f"[yellow]{message}[/yellow]")
+                    last_flush = now
+                    pending = None
+                else:
+                    pending = (message, prog)
 
                 if status_val == "complete":
                     result = update.get("result", {})
@@ -1028,11 +1383,10 @@ class GCPCreditsScreen(Screen):
                     status.update(f"[green]✓ Batch complete: {queries_processed} queries[/green]")
 
                     # Add to history
-                    import datetime
-                    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+                    timestamp = _clock()
                     history_entry = f"[{timestamp}] {queries_processed} queries, {workers} workers - [green]Complete[/green]"
-                    history_lines.insert(0, history_entry)
-                    history.update("\n".join(history_lines[:10]))  # Keep last 10
+                    self.burn_history.appendleft(history_entry)
+                    history.update("\n".join(self.burn_history))
 
                     # Refresh credits
                     await self.load_credits()
@@ -1040,12 +1394,35 @@ class GCPCreditsScreen(Screen):
                 elif status_val == "error":
                     status.update(f"[red]✗ Execution failed: {message}[/red]")
 
+            if pending is not None:
+                message, prog = pending
+                if prog != shown_prog:
+                    progress_bar.update(progress=prog)
+                status.update(f"[yellow]{message}[/yellow]")
+
+        except asyncio.CancelledError:
+            status.update("[yellow]⏹ Batch stopped[/yellow]")
+            self.burn_history.appendleft(
+                f"[{_clock()}] {queries} queries, {workers} workers - [yellow]Stopped[/yellow]"
+            )
+            history.update("\n".join(self.burn_history))
+            raise
         except Exception as e:
             status.update(f"[red]✗ Error: {e!s}[/red]")
 
     def action_stop_burn(self) -> None:
         """Stop current batch operation."""
-        self.notify("Stop functionality coming soon", severity="information")
+        task = self._burn_task
+        if task is None or task.done():
+            self._notify_once("No batch is running", severity="information")
+            return
+        task.cancel()
+        self.notify("Stopping batch...", severity="warning")
+
+    def on_unmount(self) -> None:
+        """Cancel a running burn with the screen."""
+        if self._burn_task is not None:
+            self._burn_task.cancel()
 
     async def action_refresh(self) -> None:
         """Refresh credit information."""
@@ -1053,7 +1430,7 @@ class GCPCreditsScreen(Screen):
         self.notify("Credits refreshed", severity="information")
 
 
-class LogsScreen(Screen):
+class LogsScreen(_NotifyOnceMixin, Screen):
     """Live log viewer with filtering.
 
     Set the CEREBRO_DEMO_MODE env var to "0" (or any falsy value) to connect
@@ -1069,14 +1446,69 @@ class LogsScreen(Screen):
     # True by default; set CEREBRO_DEMO_MODE=0 to disable
     DEMO_MODE: bool = os.getenv("CEREBRO_DEMO_MODE", "1").strip() not in ("0", "false", "")
 
+    MAX_LOGS = 1000
+    # Seconds between status bar refreshes
+    STATUS_INTERVAL = 0.5
+    # Real logging: seconds between queue drains, and records taken per drain
+    LOG_DRAIN_INTERVAL = 0.1
+    LOG_DRAIN_BATCH = 500
+
+    LEVEL_COLORS: ClassVar[dict[str, str]] = {
+        "INFO": "cyan",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "DEBUG": "dim"
+    }
+    # Colored, padded level column per known level, built once
+    LEVEL_TAGS: ClassVar[dict[str, str]] = {level: f"[{color}]{level:8}[/{color}]" for level, color in LEVEL_COLORS.items()}
+    LOG_LINE = "[dim]%s[/dim] %s [yellow]%-20s[/yellow] | %s"
+
+    # Demo-mode log generator
+    SIMULATED_LOG_INTERVAL = 2.0
+    SIMULATED_LEVELS = ("INFO", "WARNING", "ERROR")
+    SIMULATED_LEVEL_WEIGHTS = (7, 2, 1)
+    SIMULATED_MODULES = (
+        "cerebro.core",
+        "cerebro.router",
+        "cerebro.intelligence",
+        "cerebro.scanner",
+        "cerebro.indexer",
+        "cerebro.api"
+    )
+    SIMULATED_MESSAGES = (
+        "Processing request",
+        "Indexing complete",
+        "Query executed successfully",
+        "Cache hit",
+        "Background task started",
+        "Health check passed"
+    )
+
+    # Widgets written per log line / status tick, bound in on_mount
+    _logs_display: RichLog
+    _logs_status: Static
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Use deque for efficient ring buffer
-        from collections import deque
-        self.log_buffer = deque(maxlen=1000)
+        # Ring buffer of (timestamp, level, module, message) for every entry,
+        # filtered or not, so a filter change can rebuild the display
+        self.log_buffer: deque[tuple[str, str, str, str]] = deque(maxlen=self.MAX_LOGS)
+        self._displayed = 0
+        self._status_key: tuple | None = None
+        self._simulator: asyncio.Task | None = None
+        # (level, module, message) from the logging handler, which may run on any thread
+        self._log_queue: queue.SimpleQueue[tuple[str, str, str]] = queue.SimpleQueue()
+        self._log_handler: logging.Handler | None = None
+        self._level_buttons: dict[str, Button] = {}
         self.paused = False
         self.filter_level = "ALL"
         self.filter_module = ""
+        self._filter_module_lower = ""  # lowercased once per filter change
+        self._button_handlers: dict[str, Callable[[], object]] = {
+            "btn-pause": self.action_toggle_pause,
+            "btn-clear": self.action_clear_logs,
+            "btn-export": self.action_export_logs,
+        }
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1105,13 +1537,9 @@ class LogsScreen(Screen):
                 classes="filter-panel"
             ),
 
-            # Log Display
+            # Log Display (append-only; scrolls to the newest line)
             Container(
-                VerticalScroll(
-                    Static("", id="logs-display"),
-                    id="logs-scroll",
-                    classes="logs-scroll"
-                ),
+                RichLog(id="logs-display", max_lines=self.MAX_LOGS, markup=True, auto_scroll=True),
                 classes="logs-panel"
             ),
 
@@ -1130,91 +1558,89 @@ class LogsScreen(Screen):
 
     async def on_mount(self) -> None:
         """Initialize the logs screen."""
+        self._logs_display = self.query_one("#logs-display", RichLog)
+        self._logs_status = self.query_one("#logs-status", Static)
+        self._level_buttons = {
+            level: self.query_one(f"#level-{level.lower()}", Button)
+            for level in ("ALL", "INFO", "WARNING", "ERROR")
+        }
         self.add_log("INFO", "cerebro.core", "Cerebro TUI initialized")
         self.add_log("INFO", "cerebro.router", "Command router ready")
         self.add_log("INFO", "cerebro.intelligence", "Intelligence engine loaded")
+        self._update_status()
+        self.set_interval(self.STATUS_INTERVAL, self._update_status)
 
         if self.DEMO_MODE:
-            self.set_interval(2.0, self.add_simulated_log)
+            self._simulator = asyncio.create_task(self._simulate_logs())
         else:
             self._attach_real_logging()
+            self.set_interval(self.LOG_DRAIN_INTERVAL, self._drain_log_queue)
+
+    def on_unmount(self) -> None:
+        """Stop the demo log generator and detach the logging handler with the screen."""
+        if self._simulator is not None:
+            self._simulator.cancel()
+            self._simulator = None
+        if self._log_handler is not None:
+            logging.getLogger("cerebro").removeHandler(self._log_handler)
+            self._log_handler = None
 
     def add_log(self, level: str, module: str, message: str) -> None:
         """Add a log entry to the buffer."""
-        import datetime
-
         if self.paused:
             return
 
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        # Apply filters
-        if self.filter_level != "ALL" and level != self.filter_level:
-            return
+        # Add to buffer (deque automatically handles max length)
+        entry = (_clock(), level, module, message)
+        self.log_buffer.append(entry)
 
-        if self.filter_module and self.filter_module.lower() not in module.lower():
-            return
+        # Render and append to the display only if it passes the filters
+        if self._matches(level, module):
+            self._logs_display.write(self._format_log(entry))
+            self._displayed = min(self._displayed + 1, self.MAX_LOGS)
 
+    def _format_log(self, entry: tuple[str, str, str, str]) -> str:
+        """Markup line for a buffered (timestamp, level, module, message) entry."""
+        timestamp, level, module, message = entry
         # Color code by level
-        level_colors = {
-            "INFO": "cyan",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "DEBUG": "dim"
-        }
-        color = level_colors.get(level, "white")
+        level_tag = self.LEVEL_TAGS.get(level) or f"[white]{level:8}[/white]"
+        return self.LOG_LINE % (timestamp, level_tag, module, message)
 
-        log_entry = f"[dim]{timestamp}[/dim] [{color}]{level:8}[/{color}] [yellow]{module:20}[/yellow] | {message}"
-
-        # Add to buffer (deque automatically handles max length)
-        self.log_buffer.append(log_entry)
+    def _matches(self, level: str, module: str) -> bool:
+        """Whether an entry passes the current level and module filters."""
+        if self.filter_level != "ALL" and level != self.filter_level:
+            return False
+        return not self._filter_module_lower or self._filter_module_lower in module.lower()
 
-        # Update display
-        self.update_logs_display()
+    async def _simulate_logs(self) -> None:
+        """Produce one simulated log entry every SIMULATED_LOG_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(self.SIMULATED_LOG_INTERVAL)
+            self.add_simulated_log()
 
     def add_simulated_log(self) -> None:
         """Add simulated log entries for demo."""
-        import random
-
         if self.paused:
             return
 
-        modules = [
-            "cerebro.core",
-            "cerebro.router",
-            "cerebro.intelligence",
-            "cerebro.scanner",
-            "cerebro.indexer",
-            "cerebro.api"
-        ]
-
-        messages = [
-            "Processing request",
-            "Indexing complete",
-            "Query executed successfully",
-            "Cache hit",
-            "Background task started",
-            "Health check passed"
-        ]
-
-        levels_weighted = ["INFO"] * 7 + ["WARNING"] * 2 + ["ERROR"] * 1
-
-        level = random.choice(levels_weighted)
-        module = random.choice(modules)
-        message = random.choice(messages)
+        level = random.choices(self.SIMULATED_LEVELS, self.SIMULATED_LEVEL_WEIGHTS)[0]
+        module = random.choice(self.SIMULATED_MODULES)
+        message = random.choice(self.SIMULATED_MESSAGES)
 
         self.add_log(level, module, message)
 
     def _attach_real_logging(self) -> None:
-        """Install a logging handler that routes Python log records into the TUI."""
-        import logging
+        """Install a logging handler that queues Python log records for the TUI.
 
-        screen = self  # capture for the closure
+        The handler only enqueues, so it is safe from any thread; records reach
+        the widgets on the UI thread via _drain_log_queue.
+        """
+        log_queue = self._log_queue
 
         class _TUIHandler(logging.Handler):
             def emit(self, record: logging.LogRecord) -> None:
                 try:
-                    screen.add_log(record.levelname, record.name, record.getMessage())
+                    log_queue.put_nowait((record.levelname, record.name, record.getMessage()))
                 except Exception:
                     pass
 
@@ -1222,66 +1648,68 @@ class LogsScreen(Screen):
         handler.setLevel(logging.DEBUG)
         # Attach to the root "cerebro" logger so all sub-loggers are captured
         logging.getLogger("cerebro").addHandler(handler)
+        self._log_handler = handler
 
-    def update_logs_display(self) -> None:
-        """Update the logs display widget."""
-        logs_display = self.query_one("#logs-display", Static)
+    def _drain_log_queue(self) -> None:
+        """Move up to LOG_DRAIN_BATCH queued records into the log view."""
+        for _ in range(self.LOG_DRAIN_BATCH):
+            try:
+                level, module, message = self._log_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.add_log(level, module, message)
 
-        # Show last 100 logs
-        display_logs = self.log_buffer[-100:]
-        logs_display.update("\n".join(display_logs))
+    def _update_status(self) -> None:
+        """Refresh the status bar, skipping the render when nothing changed."""
+        key = (self.paused, len(self.log_buffer), self._displayed)
+        if key == self._status_key:
+            return
+        self._status_key = key
 
-        # Update status
-        status = self.query_one("#logs-status", Static)
+        status = self._logs_status
         pause_indicator = "[yellow]⏸️  Paused[/yellow]" if self.paused else "[green]● Live[/green]"
         status.update(
             f"{pause_indicator} | "
             f"Logs: {len(self.log_buffer)} | "
-            f"Displayed: {len(display_logs)}"
+            f"Displayed: {self._displayed}"
         )
 
-        # Auto-scroll to bottom if not paused
-        if not self.paused:
-            logs_scroll = self.query_one("#logs-scroll", VerticalScroll)
-            logs_scroll.scroll_end(animate=False)
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
         button_id = event.button.id
+        handler = self._button_handlers.get(button_id)
 
-        if button_id and button_id.startswith("level-"):
+        if handler is not None:
+            await _invoke(handler)
+        elif button_id and button_id.startswith("level-"):
             level = button_id.replace("level-", "").upper()
             self.filter_level = level
             self.update_level_buttons()
             self.refilter_logs()
-        elif button_id == "btn-pause":
-            self.action_toggle_pause()
-        elif button_id == "btn-clear":
-            self.action_clear_logs()
-        elif button_id == "btn-export":
-            self.action_export_logs()
 
     async def on_input_changed(self, event: Input.Changed) -> None:
         """Handle module filter changes."""
         if event.input.id == "module-filter":
             self.filter_module = event.value
+            self._filter_module_lower = event.value.lower()
             self.refilter_logs()
 
     def update_level_buttons(self) -> None:
         """Update level filter button styles."""
-        for level in ["ALL", "INFO", "WARNING", "ERROR"]:
-            button_id = f"level-{level.lower()}"
-            try:
-                button = self.query_one(f"#{button_id}", Button)
-                button.variant = "primary" if level == self.filter_level else "default"
-            except Exception:
-                pass
+        for level, button in self._level_buttons.items():
+            button.variant = "primary" if level == self.filter_level else "default"
 
     def refilter_logs(self) -> None:
-        """Reapply filters to all logs."""
-        # For simplicity, just update display
-        # In production, would rebuild log_buffer from full unfiltered buffer
-        self.update_logs_display()
+        """Reapply filters to all logs, rebuilding the display from the buffer."""
+        logs_display = self._logs_display
+        logs_display.clear()
+        displayed = 0
+        for entry in self.log_buffer:
+            if self._matches(entry[1], entry[2]):
+                logs_display.write(self._format_log(entry))
+                displayed += 1
+        self._displayed = displayed
+        self._update_status()
 
     def action_toggle_pause(self) -> None:
         """Toggle pause state."""
@@ -1291,7 +1719,7 @@ class LogsScreen(Screen):
         pause_btn = self.query_one("#btn-pause", Button)
         pause_btn.label = "▶️  Resume" if self.paused else "⏸️  Pause"
 
-        self.update_logs_display()
+        self._update_status()
 
         status = "paused" if self.paused else "resumed"
         self.notify(f"Logs {status}", severity="information")
@@ -1299,12 +1727,14 @@ class LogsScreen(Screen):
     def action_clear_logs(self) -> None:
         """Clear all logs."""
         self.log_buffer.clear()
-        self.update_logs_display()
+        self._logs_display.clear()
+        self._displayed = 0
+        self._update_status()
         self.notify("Logs cleared", severity="information")
 
     def action_export_logs(self) -> None:
         """Export logs to file."""
-        self.notify("Export functionality coming soon", severity="information")
+        self._notify_once("Export functionality coming soon", severity="information")
 
 
 class HelpScreen(Screen):
@@ -1432,6 +1862,7 @@ class HelpScreen(Screen):
 • All screens: Press r to manually refresh data
 • Use Tab key to navigate between input fields
 • Esc always goes back or exits
+• Install uvloop for a faster event loop (used automatically; CEREBRO_UVLOOP=0 disables)
                     """,
                     classes="help-content"
                 ),
@@ -1511,471 +1942,17 @@ class CerebroApp(App):
     Unified interface for code analysis, RAG queries, and GCP management.
     """
 
-    CSS = """
-    Screen {
-        layout: horizontal;
-    }
-
-    Sidebar {
-        width: 20;
-        background: $panel;
-        border-right: solid $primary;
-        padding: 1;
-    }
-
-    .sidebar-title {
-        text-align: center;
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-        padding: 1;
-        background: $primary-darken-2;
-    }
-
-    .sidebar-spacer {
-        height: 1fr;
-    }
-
-    Button {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    #main-content {
-        width: 1fr;
-        height: 100%;
-        padding: 2;
-        overflow-y: auto;
-    }
-
-    .screen-title {
-        text-style: bold;
-        margin-bottom: 2;
-        padding-bottom: 1;
-        border-bottom: solid $primary;
-    }
-
-    .screen-content {
-        padding: 1;
-    }
-
-    /* Dashboard Panels */
-    .metrics-panel, .alerts-panel, .actions-panel, .activity-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-    }
-
-    .panel-header {
-        text-style: bold;
-        color: $accent;
-        margin-bottom: 1;
-    }
-
-    .metrics-content, .alerts-content, .activity-content {
-        padding: 1;
-    }
-
-    .action-buttons {
-        height: auto;
-    }
-
-    .action-buttons Button {
-        margin-right: 1;
-        width: auto;
-    }
-
-    /* Projects Screen */
-    .search-container {
-        height: auto;
-        margin-bottom: 1;
-        padding: 1;
-        background: $panel;
-        border: solid $primary;
-    }
-
-    .search-label {
-        width: auto;
-        margin-right: 1;
-    }
-
-    #search-input {
-        width: 1fr;
-    }
-
-    .projects-table {
-        height: 20;
-        margin-bottom: 1;
-        border: solid $primary;
-    }
-
-    .details-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .details-content {
-        padding: 1;
-    }
-
-    /* Intelligence Screen */
-    .query-container {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .query-label {
-        width: auto;
-        margin-bottom: 1;
-    }
-
-    .query-input {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .query-buttons {
-        height: auto;
-    }
-
-    .query-buttons Button {
-        margin-right: 1;
-        width: auto;
-    }
-
-    .options-container {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .options-row {
-        height: auto;
-        align: center middle;
-    }
-
-    .option-label {
-        width: auto;
-        margin-right: 1;
-    }
-
-    .mode-btn {
-        margin-right: 1;
-        width: auto;
-    }
-
-    .limit-input {
-        width: 10;
-    }
-
-    .status-container {
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        border: solid $primary;
-        height: auto;
-    }
-
-    .status-text {
-        text-align: center;
-    }
-
-    .results-panel {
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-        height: 1fr;
-    }
-
-    .results-scroll {
-        height: 100%;
-        border: none;
-    }
-
-    #results-display {
-        padding: 1;
-    }
-
-    /* Scripts Screen */
-    .selection-row {
-        height: 15;
-        margin-bottom: 1;
-    }
-
-    .groups-panel {
-        width: 20;
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-        margin-right: 1;
-    }
-
-    .groups-scroll {
-        height: 100%;
-        border: none;
-    }
-
-    .group-btn {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .commands-panel {
-        width: 1fr;
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-    }
-
-    .commands-scroll {
-        height: 100%;
-        border: none;
-    }
-
-    .info-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .command-info {
-        padding: 1;
-    }
-
-    .exec-panel {
-        height: auto;
-        margin-bottom: 1;
-    }
-
-    .exec-buttons {
-        height: auto;
-    }
-
-    .exec-buttons Button {
-        margin-right: 1;
-        width: auto;
-    }
-
-    .progress-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    #exec-status {
-        margin-bottom: 1;
-    }
-
-    .output-panel {
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-        height: 1fr;
-    }
-
-    .output-scroll {
-        height: 100%;
-        border: none;
-    }
-
-    #command-output {
-        padding: 1;
-    }
-
-    /* GCP Credits Screen */
-    .credits-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    #credits-display {
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    #credits-progress {
-        margin-bottom: 1;
-    }
-
-    .burn-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .burn-inputs {
-        height: auto;
-        margin-bottom: 1;
-    }
-
-    .burn-field {
-        margin-right: 2;
-        width: auto;
-    }
-
-    .burn-label {
-        width: auto;
-        margin-right: 1;
-    }
-
-    .burn-input {
-        width: 15;
-    }
-
-    .burn-buttons {
-        height: auto;
-    }
-
-    .burn-buttons Button {
-        margin-right: 1;
-        width: auto;
-    }
-
-    .burn-progress-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    #burn-status {
-        margin-bottom: 1;
-    }
-
-    .history-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: 15;
-    }
-
-    .history-scroll {
-        height: 100%;
-        border: none;
-    }
-
-    .cost-panel {
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    #cost-estimate {
-        padding: 1;
-    }
-
-    /* Logs Screen */
-    .filter-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .filter-row {
-        height: auto;
-        margin-bottom: 1;
-    }
-
-    .filter-label {
-        width: auto;
-        margin-right: 1;
-    }
-
-    .level-btn {
-        margin-right: 1;
-        width: auto;
-    }
-
-    .module-input {
-        width: 30;
-        margin-right: 1;
-    }
-
-    .spacer {
-        width: 2;
-    }
-
-    .control-btn {
-        margin-right: 1;
-        width: auto;
-    }
-
-    .logs-panel {
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-        height: 1fr;
-        margin-bottom: 1;
-    }
-
-    .logs-scroll {
-        height: 100%;
-        border: none;
-    }
-
-    #logs-display {
-        padding: 1;
-        overflow-y: auto;
-    }
-
-    .logs-status-panel {
-        border: solid $primary;
-        padding: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    #logs-status {
-        text-align: center;
-    }
-
-    /* Help Screen */
-    .help-panel {
-        border: solid $primary;
-        padding: 1;
-        margin-bottom: 1;
-        background: $panel;
-        height: auto;
-    }
-
-    .help-content {
-        padding: 1;
-        line-height: 1.5;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit", priority=True),
         Binding("?", "show_help", "Help"),
-        Binding("d", "show_dashboard", "Dashboard"),
-        Binding("p", "show_projects", "Projects"),
-        Binding("i", "show_intelligence", "Intelligence"),
-        Binding("s", "show_scripts", "Scripts"),
-        Binding("g", "show_gcp", "GCP"),
-        Binding("l", "show_logs", "Logs"),
+        Binding("d", "show('dashboard')", "Dashboard"),
+        Binding("p", "show('projects')", "Projects"),
+        Binding("i", "show('intelligence')", "Intelligence"),
+        Binding("s", "show('scripts')", "Scripts"),
+        Binding("g", "show('gcp')", "GCP"),
+        Binding("l", "show('logs')", "Logs"),
     ]
 
     SCREENS = {
@@ -1988,10 +1965,19 @@ class CerebroApp(App):
         "help": HelpScreen,
     }
 
+    # Sidebar button id -> screen name
+    NAV_SCREENS: ClassVar[dict[str, str]] = {f"nav-{name}": name for name in SCREENS}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        from cerebro.tui.state import TUIState
         self.state_manager = TUIState()
+        # one router (and its project/status caches) shared by every screen
+        self.router = CommandRouter()
+
+    def run(self, *args, **kwargs):
+        """Run the app, on uvloop when available."""
+        _install_uvloop()
+        return super().run(*args, **kwargs)
 
     def compose(self) -> ComposeResult:
         """Build the application layout."""
@@ -2014,7 +2000,7 @@ class CerebroApp(App):
         """Save state when app closes."""
         # Save current screen if we have one
         if self.screen_stack:
-            current_screen = self.screen.name if hasattr(self.screen, "name") else "dashboard"
+            current_screen = getattr(self.screen, "name", None) or "dashboard"
             self.state_manager.set("last_screen", current_screen)
 
         # Final save
@@ -2026,34 +2012,12 @@ class CerebroApp(App):
 
         if button_id == "nav-quit":
             self.exit()
-        elif button_id and button_id.startswith("nav-"):
-            screen_name = button_id.replace("nav-", "")
-            if screen_name in self.SCREENS:
-                self.switch_screen(screen_name)
-
-    def action_show_dashboard(self) -> None:
-        """Show dashboard screen."""
-        self.switch_screen("dashboard")
-
-    def action_show_projects(self) -> None:
-        """Show projects screen."""
-        self.switch_screen("projects")
-
-    def action_show_intelligence(self) -> None:
-        """Show intelligence screen."""
-        self.switch_screen("intelligence")
-
-    def action_show_scripts(self) -> None:
-        """Show scripts screen."""
-        self.switch_screen("scripts")
-
-    def action_show_gcp(self) -> None:
-        """Show GCP credits screen."""
-        self.switch_screen("gcp")
-
-    def action_show_logs(self) -> None:
-        """Show logs screen."""
-        self.switch_screen("logs")
+        elif screen_name := self.NAV_SCREENS.get(button_id):
+            self.switch_screen(screen_name)
+
+    def action_show(self, screen: str) -> None:
+        """Switch to the named screen."""
+        self.switch_screen(screen)
 
     def action_show_help(self) -> None:
         """Show help screen."""
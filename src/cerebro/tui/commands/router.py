@@ -6,9 +6,73 @@ Includes caching for performance optimization.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+import random
+from collections.abc import AsyncIterator, Hashable
+from time import monotonic
 from typing import Any
 
+from cerebro.tui.performance import get_lazy_loader
+
+# Heavy backends are imported on first use, then served from the loader's cache
+_lazy = get_lazy_loader()
+
+
+def _new_intelligence() -> Any:
+    """A fresh CerebroIntelligence; it snapshots its state when constructed."""
+    return _lazy.load("cerebro.intelligence.core", "CerebroIntelligence")()
+
+
+# Static command catalogue, built once and returned by reference
+_AVAILABLE_COMMANDS: dict[str, list[str]] = {
+    "knowledge": [
+        "analyze",
+        "batch-analyze",
+        "summarize",
+        "generate-queries",
+        "index-repo",
+        "etl",
+        "docs"
+    ],
+    "rag": ["ingest", "query", "health"],
+    "ops": ["health"],
+    "gcp": ["burn", "monitor", "create-engine"],
+    "strategy": ["optimize", "salary", "moat", "trends"],
+    "content": ["mine"],
+    "test": ["grounded-search", "grounded-gen", "verify-api"]
+}
+
+# This would be enhanced to read from actual command definitions
+_COMMANDS_INFO: dict[str, dict[str, dict[str, Any]]] = {
+    "gcp": {
+        "burn": {
+            "description": "Execute batch query burn for GCP credit consumption",
+            "parameters": {
+                "queries": {"type": "int", "default": 100, "help": "Number of queries"},
+                "workers": {"type": "int", "default": 10, "help": "Concurrent workers"}
+            }
+        },
+        "monitor": {
+            "description": "Monitor GCP credit consumption",
+            "parameters": {}
+        }
+    },
+    "knowledge": {
+        "index-repo": {
+            "description": "Index repository into knowledge base",
+            "parameters": {
+                "repo_path": {"type": "str", "required": True, "help": "Path to repository"}
+            }
+        },
+        "docs": {
+            "description": "Generate documentation",
+            "parameters": {
+                "project": {"type": "str", "required": True, "help": "Project name"},
+                "format": {"type": "str", "default": "markdown", "help": "Output format"}
+            }
+        }
+    }
+}
+
 
 class CommandRouter:
     """
@@ -18,12 +82,36 @@ class CommandRouter:
     to update progress bars and status displays in the TUI.
     """
 
+    __slots__ = (
+        "_cache_ttl_range",
+        "_credits_cache",
+        "_negative_cache",
+        "_projects_cache",
+        "_refresh_tasks",
+        "_status_cache",
+        "running_tasks",
+    )
+
+    # Simulated per-query latency for the batch burn
+    BURN_QUERY_LATENCY = 0.05
+
+    # How long a failed fetch or an empty query result is remembered before retrying
+    NEGATIVE_CACHE_TTL = 5.0
+
     def __init__(self):
         """Initialize the command router."""
         self.running_tasks: dict[str, asyncio.Task] = {}
+        # (data, expires_at)
         self._projects_cache: tuple[list, float] | None = None
         self._status_cache: tuple[dict, float] | None = None
-        self._cache_ttl = 30  # Cache for 30 seconds
+        self._credits_cache: dict[str, Any] | None = None
+        # Cache for ~30 seconds; each entry draws its own TTL so caches filled
+        # together don't all expire on the same refresh tick
+        self._cache_ttl_range = (25.0, 35.0)
+        # In-flight fetches, one per cache key, shared by every caller (single-flight)
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
+        # key -> (error, expires_at); error None means an empty result
+        self._negative_cache: dict[Hashable, tuple[Exception | None, float]] = {}
 
     async def run_scan(
         self, full_scan: bool = False, collect_intelligence: bool = True
@@ -34,24 +122,13 @@ class CommandRouter:
         Yields:
             Progress updates with status, percentage, and messages
         """
-        from cerebro.intelligence.core import CerebroIntelligence
-        from cerebro.registry.scanner import ProjectScanner
-
         yield {"status": "starting", "message": "Initializing scanner..."}
 
         try:
-            # Initialize components
-            cerebro = CerebroIntelligence()
-            scanner = ProjectScanner(cerebro)
-
             yield {"status": "running", "progress": 10, "message": "Scanning projects..."}
 
-            # Run scan
-            if collect_intelligence:
-                stats = scanner.full_scan_with_intelligence()
-            else:
-                projects = scanner.scan(full_scan=full_scan)
-                stats = {"projects_found": len(projects)}
+            # Run scan (disk- and CPU-bound, so off the UI event loop)
+            stats = await asyncio.to_thread(self._scan, full_scan, collect_intelligence)
 
             yield {"status": "running", "progress": 80, "message": "Indexing results..."}
 
@@ -79,29 +156,34 @@ class CommandRouter:
         Yields:
             Progress updates and results
         """
-        from cerebro.intelligence.core import CerebroIntelligence
-        from cerebro.registry.indexer import KnowledgeIndexer
-
         yield {"status": "starting", "message": "Initializing query engine..."}
 
-        try:
-            cerebro = CerebroIntelligence()
-            indexer = KnowledgeIndexer(cerebro)
+        # A query that just failed or found nothing is answered from memory,
+        # so a broken backend isn't hit again on every retry
+        key = ("query", query, limit, semantic, tuple(types or ()), tuple(projects or ()))
+        negative = self._cached_negative(key)
+        if negative is not None:
+            error = negative[0]
+            if error is not None:
+                yield {"status": "error", "message": str(error)}
+            else:
+                yield {
+                    "status": "complete",
+                    "progress": 100,
+                    "message": "Found 0 results",
+                    "results": [],
+                }
+            return
 
+        try:
             yield {"status": "running", "progress": 30, "message": f"Searching: {query}"}
 
-            if semantic:
-                results = indexer.semantic_query(
-                    query=query,
-                    top_k=limit,
-                    types=types,
-                    projects=projects,
-                )
-            else:
-                items = cerebro.query_intelligence(
-                    query=query, types=types, projects=projects, limit=limit
-                )
-                results = [item.to_dict() for item in items]
+            # Embedding and search are CPU-bound, so off the UI event loop
+            results = await asyncio.to_thread(
+                self._query_intelligence, query, limit, semantic, types, projects
+            )
+            if not results:
+                self._cache_negative(key, None)
 
             yield {
                 "status": "complete",
@@ -111,45 +193,76 @@ class CommandRouter:
             }
 
         except Exception as e:
+            self._cache_negative(key, e)
             yield {"status": "error", "message": str(e)}
 
+    @staticmethod
+    def _scan(full_scan: bool, collect_intelligence: bool) -> dict[str, Any]:
+        """Blocking ecosystem scan; run in a worker thread."""
+        scanner_cls = _lazy.load("cerebro.registry.scanner", "ProjectScanner")
+
+        scanner = scanner_cls(_new_intelligence())
+        if collect_intelligence:
+            return scanner.full_scan_with_intelligence()
+        projects = scanner.scan(full_scan=full_scan)
+        return {"projects_found": len(projects)}
+
+    @staticmethod
+    def _query_intelligence(
+        query: str,
+        limit: int,
+        semantic: bool,
+        types: list[str] | None,
+        projects: list[str] | None,
+    ) -> list[dict[str, Any]]:
+        """Blocking intelligence query; run in a worker thread."""
+        indexer_cls = _lazy.load("cerebro.registry.indexer", "KnowledgeIndexer")
+
+        cerebro = _new_intelligence()
+        if semantic:
+            return indexer_cls(cerebro).semantic_query(
+                query=query,
+                top_k=limit,
+                types=types,
+                projects=projects,
+            )
+        items = cerebro.query_intelligence(
+            query=query, types=types, projects=projects, limit=limit
+        )
+        return [item.to_dict() for item in items]
+
     async def get_projects(self, force_refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get list of all projects with caching.
 
+        Expired data is returned as-is while a background refresh replaces it
+        (stale-while-revalidate); only a cold cache waits for the fetch, and
+        concurrent callers share one fetch.
+
         Args:
             force_refresh: Skip cache and force refresh
 
         Returns:
             List of project dictionaries
         """
-        import time
-
         # Check cache
         if not force_refresh and self._projects_cache:
-            cached_data, cached_time = self._projects_cache
-            if time.time() - cached_time < self._cache_ttl:
-                return cached_data
+            cached_data, expires_at = self._projects_cache
+            if monotonic() >= expires_at and self._cached_negative("projects") is None:
+                self._single_flight("projects", self._refresh_projects)
+            return cached_data
+        negative = None if force_refresh else self._cached_negative("projects")
+        if negative is not None and negative[0] is not None:
+            raise negative[0]
 
-        # Fetch fresh data
-        from cerebro.intelligence.core import CerebroIntelligence
+        return await asyncio.shield(self._single_flight("projects", self._refresh_projects))
 
-        cerebro = CerebroIntelligence()
-        projects = cerebro.list_projects()
-
-        result = [
-            {
-                "name": p.name,
-                "path": str(p.path),
-                "status": p.status.value,
-                "health_score": p.health_score,
-                "languages": p.languages,
-            }
-            for p in projects
-        ]
+    async def _refresh_projects(self) -> list[dict[str, Any]]:
+        # Fetch fresh data (disk-bound, so off the UI event loop)
+        result = await asyncio.to_thread(self._fetch_projects)
 
         # Update cache
-        self._projects_cache = (result, time.time())
+        self._projects_cache = (result, self._expiry())
 
         return result
 
@@ -157,42 +270,114 @@ class CommandRouter:
         """
         Get current system status with caching.
 
+        Like get_projects, expired data is served while it refreshes in the
+        background.
+
         Args:
             force_refresh: Skip cache and force refresh
 
         Returns:
             System status dictionary
         """
-        import time
-
         # Check cache
         if not force_refresh and self._status_cache:
-            cached_data, cached_time = self._status_cache
-            if time.time() - cached_time < self._cache_ttl:
-                return cached_data
+            cached_data, expires_at = self._status_cache
+            if monotonic() >= expires_at and self._cached_negative("status") is None:
+                self._single_flight("status", self._refresh_system_status)
+            return cached_data
+        negative = None if force_refresh else self._cached_negative("status")
+        if negative is not None and negative[0] is not None:
+            raise negative[0]
 
-        # Fetch fresh data
-        from cerebro.intelligence.core import CerebroIntelligence
+        return await asyncio.shield(self._single_flight("status", self._refresh_system_status))
 
-        cerebro = CerebroIntelligence()
-        status = cerebro.get_ecosystem_status()
+    async def _refresh_system_status(self) -> dict[str, Any]:
+        # Fetch fresh data (disk-bound, so off the UI event loop)
+        result = await asyncio.to_thread(self._fetch_system_status)
+
+        # Update cache
+        self._status_cache = (result, self._expiry())
+
+        return result
 
-        result = {
+    def _single_flight(self, key: str, refresh) -> asyncio.Task:
+        """The in-flight fetch for *key*, started only if none is running.
+
+        Callers await it through asyncio.shield, so one cancelled caller does
+        not cancel the fetch the others are waiting on.
+        """
+        task = self._refresh_tasks.get(key)
+        if task is not None and not task.done():
+            return task
+        task = asyncio.create_task(refresh())
+        task.add_done_callback(lambda t: self._refresh_done(key, t))
+        self._refresh_tasks[key] = task
+        return task
+
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        # A failed refresh keeps serving any stale data; reads retry it only
+        # after NEGATIVE_CACHE_TTL instead of on every call
+        if task.cancelled():
+            return
+        error = task.exception()
+        if isinstance(error, Exception):
+            self._cache_negative(key, error)
+        elif error is None:
+            self._negative_cache.pop(key, None)
+
+    def _cache_negative(self, key: Hashable, error: Exception | None) -> None:
+        """Remember a failure (or, with error None, an empty result) for *key*."""
+        now = monotonic()
+        # Drop expired entries so one-off query keys don't pile up
+        for stale in [k for k, (_, expires_at) in self._negative_cache.items() if expires_at <= now]:
+            del self._negative_cache[stale]
+        self._negative_cache[key] = (error, now + self.NEGATIVE_CACHE_TTL)
+
+    def _cached_negative(self, key: Hashable) -> tuple[Exception | None, float] | None:
+        """The unexpired negative entry for *key*, if any."""
+        entry = self._negative_cache.get(key)
+        if entry is not None and monotonic() >= entry[1]:
+            del self._negative_cache[key]
+            return None
+        return entry
+
+    @staticmethod
+    def _fetch_projects() -> list[dict[str, Any]]:
+        """Blocking project listing; run in a worker thread."""
+        cerebro = _new_intelligence()
+        return [
+            {
+                "name": p.name,
+                "path": str(p.path),
+                "status": p.status.value,
+                "health_score": p.health_score,
+                "languages": p.languages,
+            }
+            for p in cerebro.list_projects()
+        ]
+
+    @staticmethod
+    def _fetch_system_status() -> dict[str, Any]:
+        """Blocking ecosystem status read; run in a worker thread."""
+        cerebro = _new_intelligence()
+        status = cerebro.get_ecosystem_status()
+        return {
             "total_projects": status.total_projects,
             "active_projects": status.active_projects,
             "health_score": cerebro.calculate_health_score(),
             "total_intelligence": status.total_intelligence,
         }
 
-        # Update cache
-        self._status_cache = (result, time.time())
-
-        return result
+    def _expiry(self) -> float:
+        """Expiry time for a cache entry written now, with a jittered TTL."""
+        return monotonic() + random.uniform(*self._cache_ttl_range)
 
     def clear_cache(self) -> None:
         """Clear all caches."""
         self._projects_cache = None
         self._status_cache = None
+        self._credits_cache = None
+        self._negative_cache.clear()
 
     def cancel_task(self, task_id: str):
         """Cancel a running task."""
@@ -203,31 +388,55 @@ class CommandRouter:
     # === GCP Commands ===
 
     async def run_batch_burn(
-        self, queries: int = 100, workers: int = 10
+        self, queries: int = 100, workers: int = 10, sem: asyncio.Semaphore | None = None
     ) -> AsyncIterator[dict[str, Any]]:
         """
         Execute GCP batch burn with progress updates.
 
+        Queries run as a pool: at most ``workers`` tasks are outstanding and a
+        new one is started as each finishes, so pending work stays O(workers)
+        however many queries are requested. Pass ``sem`` to share the
+        concurrency limit with other callers.
+
         Yields:
             Progress updates with query count and status
         """
         yield {"status": "starting", "message": f"Starting batch burn: {queries} queries"}
 
-        try:
-            # Import the command function
+        workers = max(1, workers)
+        if sem is None:
+            sem = asyncio.BoundedSemaphore(workers)
+
+        async def burn_one() -> None:
+            async with sem:
+                # Note: The actual implementation would need to be made async
+                # For now, we'll simulate the query
+                await asyncio.sleep(self.BURN_QUERY_LATENCY)
 
+        pending: set[asyncio.Task] = set()
+        try:
             yield {"status": "running", "progress": 10, "message": "Initializing batch burn..."}
 
-            # Note: The actual implementation would need to be made async
-            # For now, we'll simulate progress
-            for i in range(0, queries, max(1, queries // 10)):
-                progress = int((i / queries) * 90) + 10
-                yield {
-                    "status": "running",
-                    "progress": progress,
-                    "message": f"Processed {i}/{queries} queries"
-                }
-                await asyncio.sleep(0.1)  # Simulate work
+            submitted = done = 0
+            last_progress = 10
+            while done < queries:
+                while submitted < queries and len(pending) < workers:
+                    pending.add(asyncio.create_task(burn_one()))
+                    submitted += 1
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    task.result()
+                done += len(finished)
+
+                # One update per whole percent, not per query
+                progress = int((done / queries) * 90) + 10
+                if progress != last_progress:
+                    last_progress = progress
+                    yield {
+                        "status": "running",
+                        "progress": progress,
+                        "message": f"Processed {done}/{queries} queries"
+                    }
 
             yield {
                 "status": "complete",
@@ -238,8 +447,29 @@ class CommandRouter:
 
         except Exception as e:
             yield {"status": "error", "message": str(e)}
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def monitor_gcp_credits(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream GCP credit status: the last known snapshot first, then a fresh one.
+
+        The cached snapshot lets callers paint immediately while the fetch is
+        in flight; it is only yielded once a fetch has succeeded.
 
-    async def monitor_gcp_credits(self) -> dict[str, Any]:
+        Yields:
+            Credit information dictionaries
+        """
+        if self._credits_cache is not None:
+            yield self._credits_cache
+
+        snapshot = await self._fetch_gcp_credits()
+        if "error" not in snapshot:
+            self._credits_cache = snapshot
+        yield snapshot
+
+    async def _fetch_gcp_credits(self) -> dict[str, Any]:
         """
         Get current GCP credit status.
 
@@ -421,25 +651,9 @@ class CommandRouter:
         Get list of all available commands organized by group.
 
         Returns:
-            Dictionary mapping group names to command lists
+            Dictionary mapping group names to command lists (shared; don't mutate)
         """
-        return {
-            "knowledge": [
-                "analyze",
-                "batch-analyze",
-                "summarize",
-                "generate-queries",
-                "index-repo",
-                "etl",
-                "docs"
-            ],
-            "rag": ["ingest", "query", "health"],
-            "ops": ["health"],
-            "gcp": ["burn", "monitor", "create-engine"],
-            "strategy": ["optimize", "salary", "moat", "trends"],
-            "content": ["mine"],
-            "test": ["grounded-search", "grounded-gen", "verify-api"]
-        }
+        return _AVAILABLE_COMMANDS
 
     async def get_command_info(self, group: str, command: str) -> dict[str, Any]:
         """
@@ -448,39 +662,7 @@ class CommandRouter:
         Returns:
             Command metadata including parameters and description
         """
-        # This would be enhanced to read from actual command definitions
-        commands_info = {
-            "gcp": {
-                "burn": {
-                    "description": "Execute batch query burn for GCP credit consumption",
-                    "parameters": {
-                        "queries": {"type": "int", "default": 100, "help": "Number of queries"},
-                        "workers": {"type": "int", "default": 10, "help": "Concurrent workers"}
-                    }
-                },
-                "monitor": {
-                    "description": "Monitor GCP credit consumption",
-                    "parameters": {}
-                }
-            },
-            "knowledge": {
-                "index-repo": {
-                    "description": "Index repository into knowledge base",
-                    "parameters": {
-                        "repo_path": {"type": "str", "required": True, "help": "Path to repository"}
-                    }
-                },
-                "docs": {
-                    "description": "Generate documentation",
-                    "parameters": {
-                        "project": {"type": "str", "required": True, "help": "Project name"},
-                        "format": {"type": "str", "default": "markdown", "help": "Output format"}
-                    }
-                }
-            }
-        }
-
-        return commands_info.get(group, {}).get(command, {
+        return _COMMANDS_INFO.get(group, {}).get(command) or {
             "description": f"{group} {command}",
             "parameters": {}
-        })
+        }
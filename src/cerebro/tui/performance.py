@@ -4,27 +4,60 @@ Performance utilities for TUI optimization.
 Includes caching, lazy loading, and batch processing utilities.
 """
 
-import time
-from collections import deque
-from collections.abc import Callable
+import functools
+import heapq
+import importlib
+import random
+from collections.abc import Callable, Hashable, Iterator
 from functools import wraps
+from itertools import count
+from time import monotonic
 from typing import Any
 
 
 class Cache:
-    """Simple time-based cache for expensive operations."""
+    """Simple time-based cache for expensive operations.
 
-    def __init__(self, ttl: int = 60):
+    Expiry times are kept in a min-heap, so expired entries are dropped on
+    every get/set (or purge_expired) whether or not they are read again.
+    """
+
+    __slots__ = ("_cache", "_heap", "_seq", "ttl")
+
+    def __init__(self, ttl: float | tuple[float, float] = 60):
         """
         Initialize cache.
 
         Args:
-            ttl: Time to live in seconds
+            ttl: Time to live in seconds, or a (low, high) range to draw each
+                entry's TTL from so entries set together expire spread out
         """
         self.ttl = ttl
-        self._cache: dict[str, tuple[Any, float]] = {}
+        # key -> (value, expires_at)
+        self._cache: dict[Hashable, tuple[Any, float]] = {}
+        # (expires_at, seq, key); an overwritten key leaves a stale entry that is
+        # skipped on pop. seq breaks ties so keys of mixed types are never compared.
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._seq = count()
+
+    def _entry_ttl(self) -> float:
+        if isinstance(self.ttl, tuple):
+            return random.uniform(*self.ttl)
+        return self.ttl
+
+    def _evict_expired(self, now: float) -> None:
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._cache[key]
 
-    def get(self, key: str) -> Any | None:
+    def purge_expired(self) -> None:
+        """Drop all expired entries (e.g. from an idle timer)."""
+        self._evict_expired(monotonic())
+
+    def get(self, key: Hashable) -> Any | None:
         """
         Get value from cache if not expired.
 
@@ -34,30 +67,38 @@ class Cache:
         Returns:
             Cached value or None if expired/missing
         """
+        now = monotonic()
+        self._evict_expired(now)
         if key in self._cache:
-            value, timestamp = self._cache[key]
-            if time.time() - timestamp < self.ttl:
+            value, expires_at = self._cache[key]
+            if now < expires_at:
                 return value
             else:
                 # Expired, remove
                 del self._cache[key]
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any, ttl_override: float | None = None) -> None:
         """
         Set cache value.
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl_override: Time to live for this entry instead of the cache's
         """
-        self._cache[key] = (value, time.time())
+        now = monotonic()
+        self._evict_expired(now)
+        expires_at = now + (self._entry_ttl() if ttl_override is None else ttl_override)
+        self._cache[key] = (value, expires_at)
+        heapq.heappush(self._heap, (expires_at, next(self._seq), key))
 
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
+        self._heap.clear()
 
-    def invalidate(self, key: str) -> None:
+    def invalidate(self, key: Hashable) -> None:
         """
         Invalidate specific cache entry.
 
@@ -72,6 +113,9 @@ def cached(ttl: int = 60):
     """
     Decorator for caching async function results.
 
+    Each decorated function gets its own cache, keyed on its (hashable)
+    arguments; unhashable arguments fall back to a repr-based key.
+
     Args:
         ttl: Time to live in seconds
 
@@ -81,16 +125,20 @@ def cached(ttl: int = 60):
             # expensive operation
             return projects
     """
-    cache = Cache(ttl=ttl)
 
     def decorator(func: Callable):
+        cache = Cache(ttl=ttl)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Create cache key from function name and args
-            cache_key = f"{func.__name__}:{args}:{kwargs}"
-
-            # Try cache first
-            cached_value = cache.get(cache_key)
+            # Key on the call arguments directly; fall back to their repr
+            # only when one of them is unhashable
+            cache_key: Hashable = (args, tuple(sorted(kwargs.items())))
+            try:
+                cached_value = cache.get(cache_key)
+            except TypeError:
+                cache_key = repr(cache_key)
+                cached_value = cache.get(cache_key)
             if cached_value is not None:
                 return cached_value
 
@@ -99,8 +147,8 @@ def cached(ttl: int = 60):
             cache.set(cache_key, result)
             return result
 
-        # Expose cache for manual invalidation
-        wrapper.cache = cache
+        # Expose this function's cache for manual invalidation
+        wrapper.cache = cache  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
@@ -110,9 +158,12 @@ class RingBuffer:
     """
     Memory-efficient ring buffer for logs.
 
-    Uses deque with maxlen for automatic memory management.
+    Backed by a preallocated list and a head index, so append is a single
+    slot write with no allocation once the buffer is full.
     """
 
+    __slots__ = ("_buf", "_head", "_recent", "_size", "_version", "maxlen")
+
     def __init__(self, maxlen: int = 1000):
         """
         Initialize ring buffer.
@@ -120,8 +171,16 @@ class RingBuffer:
         Args:
             maxlen: Maximum number of items to store
         """
-        self.buffer = deque(maxlen=maxlen)
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
         self.maxlen = maxlen
+        self._buf: list[Any] = [None] * maxlen
+        # Slot the next append writes to; once full, also the oldest item
+        self._head = 0
+        self._size = 0
+        # Bumped on every write; keys the single-slot get_recent memo
+        self._version = 0
+        self._recent: tuple[int, int, list[Any]] | None = None
 
     def append(self, item: Any) -> None:
         """
@@ -132,7 +191,13 @@ class RingBuffer:
         Args:
             item: Item to append
         """
-        self.buffer.append(item)
+        head = self._head
+        self._buf[head] = item
+        head += 1
+        self._head = 0 if head == self.maxlen else head
+        if self._size < self.maxlen:
+            self._size += 1
+        self._version += 1
 
     def extend(self, items: list[Any]) -> None:
         """
@@ -141,7 +206,16 @@ class RingBuffer:
         Args:
             items: Items to append
         """
-        self.buffer.extend(items)
+        append = self.append
+        for item in items:
+            append(item)
+
+    def _slice(self, n: int) -> list[Any]:
+        # Last n items in insertion order, wrapping around the array end
+        start = self._head - n
+        if start >= 0:
+            return self._buf[start:self._head]
+        return self._buf[start:] + self._buf[:self._head]
 
     def get_recent(self, n: int = 100) -> list[Any]:
         """
@@ -151,23 +225,33 @@ class RingBuffer:
             n: Number of items to retrieve
 
         Returns:
-            List of recent items
+            List of recent items. Repeat calls with no write in between
+            return the same list, so treat it as read-only.
         """
-        if n >= len(self.buffer):
-            return list(self.buffer)
-        return list(self.buffer)[-n:]
+        if n <= 0:
+            return []
+        recent = self._recent
+        if recent is not None and recent[0] == self._version and recent[1] == n:
+            return recent[2]
+        items = self._slice(min(n, self._size))
+        self._recent = (self._version, n, items)
+        return items
 
     def clear(self) -> None:
         """Clear buffer."""
-        self.buffer.clear()
+        self._buf = [None] * self.maxlen
+        self._head = 0
+        self._size = 0
+        self._version += 1
+        self._recent = None
 
     def __len__(self) -> int:
         """Get buffer length."""
-        return len(self.buffer)
+        return self._size
 
     def __iter__(self):
         """Iterate over buffer."""
-        return iter(self.buffer)
+        return iter(self._slice(self._size))
 
 
 class BatchProcessor:
@@ -175,6 +259,8 @@ class BatchProcessor:
     Batch processor for rendering large datasets efficiently.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def paginate(data: list[Any], page_size: int = 100, page: int = 0) -> list[Any]:
         """
@@ -193,7 +279,7 @@ class BatchProcessor:
         return data[start:end]
 
     @staticmethod
-    def chunk(data: list[Any], chunk_size: int = 50) -> list[list[Any]]:
+    def chunk(data: list[Any], chunk_size: int = 50) -> Iterator[list[Any]]:
         """
         Split data into chunks.
 
@@ -201,13 +287,11 @@ class BatchProcessor:
             data: Data to chunk
             chunk_size: Size of each chunk
 
-        Returns:
-            List of chunks
+        Yields:
+            Chunks of up to chunk_size items, one at a time
         """
-        chunks = []
         for i in range(0, len(data), chunk_size):
-            chunks.append(data[i:i + chunk_size])
-        return chunks
+            yield data[i:i + chunk_size]
 
     @staticmethod
     async def process_in_batches(
@@ -231,15 +315,14 @@ class BatchProcessor:
         import asyncio
         results = []
 
-        chunks = BatchProcessor.chunk(data, batch_size)
-        for chunk in chunks:
+        for chunk in BatchProcessor.chunk(data, batch_size):
             # Process chunk
             if asyncio.iscoroutinefunction(processor):
                 chunk_results = await processor(chunk)
             else:
                 chunk_results = processor(chunk)
 
-            results.extend(chunk_results)
+            results += chunk_results
 
             # Small delay to prevent UI freezing
             await asyncio.sleep(delay)
@@ -252,9 +335,7 @@ class LazyLoader:
     Lazy loader for expensive imports.
     """
 
-    def __init__(self):
-        """Initialize lazy loader."""
-        self._modules = {}
+    __slots__ = ()
 
     def load(self, module_name: str, attribute: str | None = None) -> Any:
         """
@@ -267,19 +348,13 @@ class LazyLoader:
         Returns:
             Module or module attribute
         """
-        cache_key = f"{module_name}:{attribute}"
+        return self._load(module_name, attribute)
 
-        if cache_key not in self._modules:
-            # Import module
-            module = __import__(module_name, fromlist=[attribute] if attribute else [])
-
-            # Get attribute if specified
-            if attribute:
-                self._modules[cache_key] = getattr(module, attribute)
-            else:
-                self._modules[cache_key] = module
-
-        return self._modules[cache_key]
+    @staticmethod
+    @functools.cache
+    def _load(module_name: str, attribute: str | None) -> Any:
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute) if attribute else module
 
 
 # Global instances
@@ -4,24 +4,98 @@ TUI State Persistence
 Saves and loads TUI state between sessions.
 """
 
-import json
-from datetime import datetime
+import atexit
+import copy
+import logging
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+logger = logging.getLogger("cerebro.tui.state")
+
+
+def _timestamp() -> str:
+    """Local time as an ISO 8601 string (second precision), without a datetime object."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+# Template for default_state(); built once, deep-copied per use
+_DEFAULT_STATE: dict[str, Any] = {
+    "version": "1.0.0",
+    "last_updated": None,  # stamped on each copy
+    "last_screen": "dashboard",
+    "preferences": {
+        "auto_refresh": True,
+        "refresh_interval": 10,
+        "theme": "default"
+    },
+    "intelligence": {
+        "query_history": [],
+        "last_mode": "semantic",
+        "last_limit": 10
+    },
+    "projects": {
+        "last_filter": "",
+        "sort_column": "name",
+        "sort_order": "asc"
+    },
+    "logs": {
+        "last_level_filter": "ALL",
+        "last_module_filter": "",
+        "paused": False
+    },
+    "gcp": {
+        "last_queries": 100,
+        "last_workers": 10
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple[str, ...]:
+    """Dot-separated key path as a tuple; the TUI uses a small fixed set of keys."""
+    return tuple(key.split("."))
+
 
 class TUIState:
     """
     Manages TUI state persistence.
 
     Saves user preferences, history, and screen states to ~/.cerebro/tui_state.json
+
+    Updates are written back at most once per SAVE_DELAY seconds (and on exit)
+    rather than on every set(); save() still writes immediately.
     """
 
+    # Debounce window for writes triggered by set()/set_many()/add_to_history()
+    SAVE_DELAY = 0.5
+
     def __init__(self):
         """Initialize state manager."""
         self.state_dir = Path.home() / ".cerebro"
         self.state_file = self.state_dir / "tui_state.json"
-        self.state = self.load()
+        # Read from disk on first access, not at construction
+        self._state: dict[str, Any] | None = None
+        self._dirty = False
+        self._save_timer: threading.Timer | None = None
+        # Serializes writes from the debounce timer thread with direct saves
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """The state dict, loaded from disk on first access."""
+        if self._state is None:
+            self._state = self.load()
+        return self._state
+
+    @state.setter
+    def state(self, value: dict[str, Any]) -> None:
+        self._state = value
 
     def load(self) -> dict[str, Any]:
         """
@@ -36,10 +110,8 @@ class TUIState:
         # Load state if file exists
         if self.state_file.exists():
             try:
-                with open(self.state_file) as f:
-                    state = json.load(f)
-                return state
-            except (OSError, json.JSONDecodeError):
+                return orjson.loads(self.state_file.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
                 # Return default state if file is corrupted
                 return self.default_state()
         else:
@@ -53,46 +125,53 @@ class TUIState:
         Returns:
             dict: Default empty state
         """
-        return {
-            "version": "1.0.0",
-            "last_updated": datetime.now().isoformat(),
-            "last_screen": "dashboard",
-            "preferences": {
-                "auto_refresh": True,
-                "refresh_interval": 10,
-                "theme": "default"
-            },
-            "intelligence": {
-                "query_history": [],
-                "last_mode": "semantic",
-                "last_limit": 10
-            },
-            "projects": {
-                "last_filter": "",
-                "sort_column": "name",
-                "sort_order": "asc"
-            },
-            "logs": {
-                "last_level_filter": "ALL",
-                "last_module_filter": "",
-                "paused": False
-            },
-            "gcp": {
-                "last_queries": 100,
-                "last_workers": 10
-            }
-        }
+        state = copy.deepcopy(_DEFAULT_STATE)
+        state["last_updated"] = _timestamp()
+        return state
 
     def save(self) -> None:
-        """Save state to disk."""
+        """Save state to disk now, superseding any pending debounced write."""
+        with self._lock:
+            self._cancel_save_timer()
+            self._dirty = False
+            self._write()
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if there are any."""
+        with self._lock:
+            self._cancel_save_timer()
+            if self._dirty:
+                self._dirty = False
+                self._write()
+
+    def _schedule_save(self) -> None:
+        """Mark state dirty and flush it after SAVE_DELAY unless a flush is already pending."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _cancel_save_timer(self) -> None:
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _write(self) -> None:
         try:
-            self.state["last_updated"] = datetime.now().isoformat()
-
-            with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2)
-        except OSError:
-            # Fail silently - state persistence is not critical
-            pass
+            self.state["last_updated"] = _timestamp()
+
+            # Compact: the file is only ever read back by load()
+            payload = orjson.dumps(self.state)
+            # Write aside and rename over, so a crash never leaves a truncated file
+            tmp = self.state_file.with_suffix(".json.tmp")
+            tmp.write_bytes(payload)
+            tmp.replace(self.state_file)
+        except (OSError, TypeError, orjson.JSONEncodeError) as e:
+            # State persistence is not critical; this may run on the debounce
+            # timer thread, where an unhandled error would only hit stderr
+            logger.warning("Could not save TUI state to %s: %s", self.state_file, e)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -105,10 +184,13 @@ class TUIState:
         Returns:
             Value from state or default
         """
-        keys = key.split(".")
+        # Top-level keys (e.g. "last_screen") need no path walk
+        if "." not in key:
+            return self.state.get(key, default)
+
         value = self.state
 
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -116,15 +198,12 @@ class TUIState:
 
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        """
-        Set a value in state.
+    def _parent(self, key: str) -> tuple[dict[str, Any], str]:
+        """The dict holding a dot-separated key and its last segment, creating intermediate dicts."""
+        if "." not in key:
+            return self.state, key
 
-        Args:
-            key: Dot-separated key path
-            value: Value to set
-        """
-        keys = key.split(".")
+        keys = _split_key(key)
         target = self.state
 
         # Navigate to the target location
@@ -133,13 +212,40 @@ class TUIState:
                 target[k] = {}
             target = target[k]
 
-        # Set the value
-        target[keys[-1]] = value
+        return target, keys[-1]
+
+    def _assign(self, key: str, value: Any) -> None:
+        """Set a dot-separated key in memory."""
+        target, last = self._parent(key)
+        target[last] = value
+
+    def set(self, key: str, value: Any, save: bool = True) -> None:
+        """
+        Set a value in state.
+
+        Args:
+            key: Dot-separated key path
+            value: Value to set
+            save: Write state to disk (debounced) afterwards
+        """
+        self._assign(key, value)
 
         # Auto-save after setting
-        self.save()
+        if save:
+            self._schedule_save()
 
-    def add_to_history(self, category: str, item: Any, max_items: int = 20) -> None:
+    def set_many(self, values: dict[str, Any]) -> None:
+        """
+        Set several values in state with a single (debounced) write to disk.
+
+        Args:
+            values: Mapping of dot-separated key paths to values
+        """
+        for key, value in values.items():
+            self._assign(key, value)
+        self._schedule_save()
+
+    def add_to_history(self, category: str, item: Any, max_items: int = 20, save: bool = True) -> None:
         """
         Add an item to a history list.
 
@@ -147,20 +253,20 @@ class TUIState:
             category: Category name (e.g., "intelligence.query_history")
             item: Item to add
             max_items: Maximum number of items to keep
+            save: Write state to disk (debounced) afterwards
         """
-        history = self.get(category, [])
+        # Walk the key path once for both the read and the write
+        target, last = self._parent(category)
+        history = target.get(last)
 
         if not isinstance(history, list):
             history = []
 
-        # Add new item to beginning
-        history.insert(0, item)
-
-        # Trim to max items
-        history = history[:max_items]
+        # Add new item to beginning, trimmed to max items
+        target[last] = [item, *history][:max_items]
 
-        # Save back
-        self.set(category, history)
+        if save:
+            self._schedule_save()
 
     def clear_history(self, category: str) -> None:
         """
@@ -6,41 +6,48 @@ This script attempts to import and instantiate each command Typer app
 individually to isolate the problematic module.
 """
 
+import importlib
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-def test_module(module_name: str, app_name: str):
-    """Test importing and accessing a command module."""
+def test_module(module_name: str, app_name: str, pending: Future):
+    """Test importing and accessing a command module (import already submitted as *pending*)."""
+    # Collect the report and write it in one go rather than print() per line
+    lines = [
+        "",
+        "=" * 60,
+        f"Testing: {module_name}",
+        "=" * 60,
+    ]
     try:
-        print(f"\n{'='*60}")
-        print(f"Testing: {module_name}")
-        print(f"{'='*60}")
-
-        # Import the module
-        module = __import__(f"cerebro.commands.{module_name}", fromlist=[app_name])
+        # Import the module (re-raises the import error, if any)
+        module = pending.result()
         app = getattr(module, app_name)
 
         # Try to access the app's info (this triggers Typer's internal validation)
-        print(f"  ✓ Module imported successfully")
-        print(f"  ✓ App object: {app}")
-        print(f"  ✓ App name: {app.info.name}")
-        print(f"  ✓ Commands: {len(app.registered_commands)}")
+        lines.append("  ✓ Module imported successfully")
+        lines.append(f"  ✓ App object: {app}")
+        lines.append(f"  ✓ App name: {app.info.name}")
+        lines.append(f"  ✓ Commands: {len(app.registered_commands)}")
 
         # List commands
-        for cmd in app.registered_commands:
-            print(f"    - {cmd.name}")
+        lines.extend(f"    - {cmd.name}" for cmd in app.registered_commands)
 
-        print(f"  ✓ {module_name} OK\n")
-        return True
+        lines.append(f"  ✓ {module_name} OK\n")
+        ok = True
 
     except Exception as e:
-        print(f"  ✗ ERROR in {module_name}:")
-        print(f"    {type(e).__name__}: {e}")
-        print(f"  ✗ {module_name} FAILED\n")
-        return False
+        lines.append(f"  ✗ ERROR in {module_name}:")
+        lines.append(f"    {type(e).__name__}: {e}")
+        lines.append(f"  ✗ {module_name} FAILED\n")
+        ok = False
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    return ok
 
 def main():
     print("="*60)
@@ -55,9 +62,16 @@ def main():
         ("testing", "testing_app"),
     ]
 
+    # Import all modules concurrently, then report on each in order
+    with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+        imports = {
+            module_name: pool.submit(importlib.import_module, f"cerebro.commands.{module_name}")
+            for module_name, _ in modules
+        }
+
     results = {}
     for module_name, app_name in modules:
-        results[module_name] = test_module(module_name, app_name)
+        results[module_name] = test_module(module_name, app_name, imports[module_name])
 
     # Summary
     print("\n" + "="*60)
@@ -2,6 +2,7 @@ import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 # Skip entire module if google-cloud-storage is not installed (Nix env)
@@ -43,19 +44,19 @@ class TestPhantomWorkflow:
         assert result["artifacts"][0].name == "hello"
 
         # Save artifacts for ingestion
-        import json
         jsonl_path = test_data_dir / "artifacts.jsonl"
-        with open(jsonl_path, "w") as f:
-            for a in result["artifacts"]:
-                doc = {
-                    "jsonData": json.dumps({
-                        "title": a.name,
-                        "content": a.content,
-                        "repo": "dummy_repo",
-                        "context": "test"
-                    })
-                }
-                f.write(json.dumps(doc) + "\n")
+        lines = b"\n".join(
+            orjson.dumps({
+                "jsonData": orjson.dumps({
+                    "title": a.name,
+                    "content": a.content,
+                    "repo": "dummy_repo",
+                    "context": "test"
+                }).decode()
+            })
+            for a in result["artifacts"]
+        )
+        jsonl_path.write_bytes(lines + b"\n")
 
         assert jsonl_path.exists()
 
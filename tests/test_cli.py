@@ -4,15 +4,25 @@ import importlib.util
 import json
 from unittest.mock import patch
 
-from typer.testing import CliRunner
+import pytest
+import typer
+from click.testing import CliRunner
 
 from cerebro.cli import app
 
 runner = CliRunner()
+# Build the Click command tree once; typer's runner.invoke(app) rebuilds it on every call
+cli = typer.main.get_command(app)
+
+
+@pytest.fixture(scope="module")
+def help_result():
+    """One top-level --help run shared by the tests that only read its output."""
+    return runner.invoke(cli, ["--help"])
 
 
 def test_info_command():
-    result = runner.invoke(app, ["info"])
+    result = runner.invoke(cli, ["info"])
     assert result.exit_code == 0
     assert "CEREBRO" in result.stdout
     assert "GCP Integration" in result.stdout
@@ -28,7 +38,7 @@ def test_info_reports_rag_runtime_when_local_runtime_is_available():
 
     with patch("cerebro.cli._has_rag_runtime_support", return_value=True):
         with patch("cerebro.cli.importlib.util.find_spec", side_effect=fake_find_spec):
-            result = runner.invoke(app, ["info"])
+            result = runner.invoke(cli, ["info"])
 
     assert result.exit_code == 0
     assert "RAG Runtime" in result.stdout
@@ -36,7 +46,7 @@ def test_info_reports_rag_runtime_when_local_runtime_is_available():
 
 
 def test_version_command():
-    result = runner.invoke(app, ["version"])
+    result = runner.invoke(cli, ["version"])
     assert result.exit_code == 0
     from cerebro import __version__
     assert f"v{__version__}" in result.stdout
@@ -44,33 +54,42 @@ def test_version_command():
 
 def test_version_output_format():
     """Version output should be a single line with 'Cerebro CLI vX.Y.Z'."""
-    result = runner.invoke(app, ["version"])
+    result = runner.invoke(cli, ["version"])
     assert result.exit_code == 0
     assert result.stdout.strip().startswith("Cerebro CLI v")
 
 
-def test_help_lists_command_groups():
+def test_help_lists_command_groups(help_result):
     """--help should list all registered command groups."""
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert result.exit_code == 0
     assert "knowledge" in result.stdout
     assert "ops" in result.stdout
     assert "rag" in result.stdout
 
 
-def test_help_shows_info_and_version():
+def test_help_shows_info_and_version(help_result):
     """--help should mention info and version commands."""
-    result = runner.invoke(app, ["--help"])
+    result = help_result
     assert result.exit_code == 0
     assert "info" in result.stdout
     assert "version" in result.stdout
 
 
-def test_knowledge_help():
-    """knowledge --help should show sub-commands."""
-    result = runner.invoke(app, ["knowledge", "--help"])
+@pytest.mark.parametrize(
+    ("group", "expected"),
+    [
+        ("knowledge", ["analyze"]),
+        ("ops", ["health", "status"]),
+        ("rag", ["backend", "backends", "ingest", "query", "status"]),
+    ],
+)
+def test_group_help(group, expected):
+    """<group> --help should show the group's sub-commands."""
+    result = runner.invoke(cli, [group, "--help"])
     assert result.exit_code == 0
-    assert "analyze" in result.stdout
+    for command in expected:
+        assert command in result.stdout
 
 
 def test_knowledge_docs_command_generates_markdown(tmp_path):
@@ -109,7 +128,7 @@ def test_knowledge_docs_command_generates_markdown(tmp_path):
 
     output_dir = tmp_path / "generated-docs"
     result = runner.invoke(
-        app,
+        cli,
         [
             "knowledge",
             "docs",
@@ -135,25 +154,6 @@ def test_knowledge_docs_command_generates_markdown(tmp_path):
     assert any(command["name"] == "cerebro rag backend health" for command in catalog["commands"])
 
 
-def test_ops_help():
-    """ops --help should show sub-commands."""
-    result = runner.invoke(app, ["ops", "--help"])
-    assert result.exit_code == 0
-    assert "health" in result.stdout
-    assert "status" in result.stdout
-
-
-def test_rag_help():
-    """rag --help should show sub-commands."""
-    result = runner.invoke(app, ["rag", "--help"])
-    assert result.exit_code == 0
-    assert "backend" in result.stdout
-    assert "backends" in result.stdout
-    assert "ingest" in result.stdout
-    assert "query" in result.stdout
-    assert "status" in result.stdout
-
-
 def test_rag_status_command():
     """rag status should print the current runtime status."""
 
@@ -171,7 +171,7 @@ def test_rag_status_command():
             "error": None,
         },
     ):
-        result = runner.invoke(app, ["rag", "status"])
+        result = runner.invoke(cli, ["rag", "status"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Runtime" in result.stdout
@@ -190,7 +190,7 @@ def test_rag_init_command():
             "initialized": True,
             "table_name": "cerebro_documents",
         }
-        result = runner.invoke(app, ["rag", "init"])
+        result = runner.invoke(cli, ["rag", "init"])
 
     assert result.exit_code == 0
     assert "Backend initialized: pgvector" in result.stdout
@@ -215,7 +215,7 @@ def test_rag_smoke_command():
             ],
             "error": None,
         }
-        result = runner.invoke(app, ["rag", "smoke"])
+        result = runner.invoke(cli, ["rag", "smoke"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Smoke Test" in result.stdout
@@ -246,7 +246,7 @@ def test_rag_migrate_command():
                     "batches": 1,
                     "cleared_destination": False,
                 }
-                result = runner.invoke(app, ["rag", "migrate", "--from-provider", "chroma"])
+                result = runner.invoke(cli, ["rag", "migrate", "--from-provider", "chroma"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Migration" in result.stdout
@@ -259,7 +259,7 @@ def test_rag_backends_list_command():
 
     with patch("cerebro.settings.get_settings") as mock_settings:
         mock_settings.return_value.vector_store_provider = "pgvector"
-        result = runner.invoke(app, ["rag", "backends", "list"])
+        result = runner.invoke(cli, ["rag", "backends", "list"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Backends" in result.stdout
@@ -284,7 +284,7 @@ def test_rag_backend_info_command():
             "error": None,
         },
     ):
-        result = runner.invoke(app, ["rag", "backend", "info"])
+        result = runner.invoke(cli, ["rag", "backend", "info"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Runtime" in result.stdout
@@ -308,7 +308,7 @@ def test_rag_backend_health_command():
             "error": None,
         },
     ):
-        result = runner.invoke(app, ["rag", "backend", "health"])
+        result = runner.invoke(cli, ["rag", "backend", "health"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Backend Health" in result.stdout
@@ -326,7 +326,7 @@ def test_rag_backend_init_command():
             "initialized": True,
             "table_name": "cerebro_documents",
         }
-        result = runner.invoke(app, ["rag", "backend", "init"])
+        result = runner.invoke(cli, ["rag", "backend", "init"])
 
     assert result.exit_code == 0
     assert "Backend initialized: pgvector" in result.stdout
@@ -350,7 +350,7 @@ def test_rag_backend_smoke_command():
             ],
             "error": None,
         }
-        result = runner.invoke(app, ["rag", "backend", "smoke"])
+        result = runner.invoke(cli, ["rag", "backend", "smoke"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Smoke Test" in result.stdout
@@ -379,7 +379,7 @@ def test_rag_backend_migrate_command():
                     "batches": 1,
                     "cleared_destination": False,
                 }
-                result = runner.invoke(app, ["rag", "backend", "migrate", "--from-provider", "chroma"])
+                result = runner.invoke(cli, ["rag", "backend", "migrate", "--from-provider", "chroma"])
 
     assert result.exit_code == 0
     assert "CEREBRO RAG Migration" in result.stdout
@@ -387,7 +387,7 @@ def test_rag_backend_migrate_command():
 
 def test_no_args_shows_help():
     """Running with no args should show help (no_args_is_help=True)."""
-    result = runner.invoke(app, [])
+    result = runner.invoke(cli, [])
     # Typer uses exit code 0 or 2 for help display
     assert result.exit_code in (0, 2)
     output = result.stdout + (result.stderr if hasattr(result, 'stderr') and result.stderr else "")
@@ -396,5 +396,5 @@ def test_no_args_shows_help():
 
 def test_invalid_command():
     """An unknown command should produce a non-zero exit code."""
-    result = runner.invoke(app, ["nonexistent-command-xyz"])
+    result = runner.invoke(cli, ["nonexistent-command-xyz"])
     assert result.exit_code != 0
@@ -4,6 +4,7 @@ Uses FastAPI TestClient with a mocked MetricsCollector to avoid
 real filesystem access.
 """
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,8 @@ try:
 except (ImportError, RuntimeError):
     pytest.skip("httpx required for FastAPI TestClient", allow_module_level=True)
 
+from cerebro import dashboard_server
+from cerebro.dashboard_server import _apply_filters, _build_derived
 
 # ---------------------------------------------------------------------------
 # Sample snapshot data used across tests
@@ -61,29 +64,51 @@ SAMPLE_SNAPSHOT = {
 }
 
 
-@pytest.fixture
-def client():
-    """Create a TestClient with mocked MetricsCollector."""
+# Stand-ins for discovered repos / collection results; only their count is read
+_SENTINEL_REPOS = (MagicMock(), MagicMock())
+_SENTINEL_COLLECT = (MagicMock(), MagicMock())
+
+
+@pytest.fixture(scope="class")
+def _served():
+    """One app startup per test class; client/empty_client swap the data it serves.
+
+    Class- rather than module-scoped: the server keeps its derived cache and
+    refresher task in module globals, which the snapshot/ETag tests below
+    exercise with their own TestClients.
+    """
     with patch("cerebro.dashboard_server._collector") as mock_coll:
-        mock_coll.load_snapshot.return_value = SAMPLE_SNAPSHOT
-        mock_coll.discover_repos.return_value = [MagicMock()] * 2
-        mock_coll.collect_all.return_value = [MagicMock(), MagicMock()]
+        # start with no snapshot file so startup doesn't parse a bare mock
+        mock_coll.snapshot_mtime_ns.return_value = None
 
-        from cerebro.dashboard_server import app
-        with TestClient(app) as c:
-            yield c
+        with TestClient(dashboard_server.app) as c:
+            yield c, mock_coll
+        # don't hand views built from this mock to later tests' cold-cache checks
+        dashboard_server._cache = None
+
+
+def _serve(served, snapshot, repos, mtime_ns):
+    """Point the shared mock at new data and rebuild the derived views."""
+    c, mock_coll = served
+    mock_coll.load_snapshot.return_value = snapshot
+    mock_coll.discover_repos.return_value = repos
+    mock_coll.collect_all.return_value = _SENTINEL_COLLECT
+    # mtime last: a refresher tick in between still sees the old mtime and rebuilds nothing
+    mock_coll.snapshot_mtime_ns.return_value = mtime_ns
+    dashboard_server._refresh_snapshot_cache()
+    return c
 
 
 @pytest.fixture
-def empty_client():
-    """TestClient where load_snapshot returns None (no data)."""
-    with patch("cerebro.dashboard_server._collector") as mock_coll:
-        mock_coll.load_snapshot.return_value = None
-        mock_coll.discover_repos.return_value = []
+def client(_served):
+    """TestClient with mocked MetricsCollector serving SAMPLE_SNAPSHOT."""
+    return _serve(_served, SAMPLE_SNAPSHOT, _SENTINEL_REPOS, mtime_ns=1)
 
-        from cerebro.dashboard_server import app
-        with TestClient(app) as c:
-            yield c
+
+@pytest.fixture
+def empty_client(_served):
+    """TestClient where there is no snapshot (no data)."""
+    return _serve(_served, None, (), mtime_ns=None)
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +137,23 @@ class TestHealth:
         assert data["total_projects"] == 0
 
 
+class TestCORS:
+    def test_preflight_from_configured_origin(self, client):
+        r = client.options("/projects", headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+        })
+        assert r.status_code == 200
+        assert r.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+    def test_preflight_from_unknown_origin_is_rejected(self, client):
+        r = client.options("/projects", headers={
+            "Origin": "http://evil.example",
+            "Access-Control-Request-Method": "GET",
+        })
+        assert r.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Projects
 # ---------------------------------------------------------------------------
@@ -134,6 +176,12 @@ class TestProjects:
         assert len(projects) == 1
         assert projects[0]["name"] == "beta"
 
+    def test_list_projects_filter_status_and_language(self, client):
+        r = client.get("/projects", params={"status": "active", "language": "SHELL"})
+        assert [p["name"] for p in r.json()] == ["alpha"]
+        r = client.get("/projects", params={"status": "archived", "language": "python"})
+        assert r.json() == []
+
     def test_list_projects_sort_by_name(self, client):
         r = client.get("/projects", params={"sort_by": "name", "order": "asc"})
         projects = r.json()
@@ -268,3 +316,105 @@ class TestActions:
     def test_summarize_project_not_found(self, client):
         r = client.post("/actions/summarize/nonexistent")
         assert r.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Snapshot cache
+# ---------------------------------------------------------------------------
+class TestSnapshotCache:
+    def test_reparses_only_when_mtime_changes(self):
+        with patch("cerebro.dashboard_server._collector") as mock_coll, \
+                patch("cerebro.dashboard_server.SNAPSHOT_REFRESH_INTERVAL", 0.01):
+            mock_coll.snapshot_mtime_ns.return_value = 1
+            mock_coll.load_snapshot.return_value = SAMPLE_SNAPSHOT
+
+            with TestClient(dashboard_server.app) as c:
+                c.get("/status")
+                c.get("/projects")
+                assert mock_coll.load_snapshot.call_count == 1
+
+                # handlers never parse; the background refresher picks up the change
+                mock_coll.snapshot_mtime_ns.return_value = 2
+                deadline = time.monotonic() + 5
+                while mock_coll.load_snapshot.call_count < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert mock_coll.load_snapshot.call_count == 2
+                assert len(c.get("/projects").json()) == 2
+
+    def test_derived_views_reused_while_unchanged(self):
+        with patch("cerebro.dashboard_server._collector") as mock_coll:
+            mock_coll.snapshot_mtime_ns.return_value = 1
+            mock_coll.load_snapshot.return_value = SAMPLE_SNAPSHOT
+
+            first = dashboard_server._refresh_snapshot_cache()
+            assert dashboard_server._refresh_snapshot_cache() is first
+            assert [p["name"] for p in first.by_language["python"]] == ["alpha"]
+            assert first.graph["nodes"] == [{"id": "alpha", "label": "alpha"}, {"id": "beta", "label": "beta"}]
+
+            mock_coll.snapshot_mtime_ns.return_value = 2
+            assert dashboard_server._refresh_snapshot_cache() is not first
+
+    def test_language_index_is_case_insensitive_and_deduplicated(self):
+        repo = {**SAMPLE_SNAPSHOT["repos"][0], "languages": {"Python": {}, "python": {}, "Shell": {}}}
+        derived = _build_derived(1, {"repos": [repo]})
+        assert sorted(derived.by_language) == ["python", "shell"]
+        assert [p["name"] for p in derived.by_language["python"]] == ["alpha"]
+        assert derived.by_status == {"active": derived.projects}
+
+    def test_name_index_keeps_first_duplicate(self):
+        alpha, beta = SAMPLE_SNAPSHOT["repos"]
+        shadow = {**beta, "name": "alpha"}
+        derived = _build_derived(1, {"repos": [alpha, beta, shadow]})
+        assert derived.repo_by_name == {"alpha": alpha, "beta": beta}
+        assert derived.project_by_name["alpha"] is derived.projects[0]
+
+    def test_filtered_projects_memoized_per_generation(self):
+        derived = _build_derived(1, SAMPLE_SNAPSHOT)
+        first = _apply_filters(derived, None, "PYTHON", "name", "asc")
+        assert [p["name"] for p in first] == ["alpha"]
+        assert _apply_filters(derived, None, "python", "name", "asc") is first
+        assert _apply_filters(_build_derived(2, SAMPLE_SNAPSHOT), None, "python", "name", "asc") is not first
+
+    def test_missing_file_skips_parse(self):
+        with patch("cerebro.dashboard_server._collector") as mock_coll:
+            mock_coll.snapshot_mtime_ns.return_value = None
+
+            with TestClient(dashboard_server.app) as c:
+                assert c.get("/projects").json() == []
+            mock_coll.load_snapshot.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Conditional requests
+# ---------------------------------------------------------------------------
+class TestETag:
+    @pytest.fixture
+    def etag_client(self):
+        with patch("cerebro.dashboard_server._collector") as mock_coll:
+            mock_coll.snapshot_mtime_ns.return_value = 42
+            mock_coll.load_snapshot.return_value = SAMPLE_SNAPSHOT
+
+            with TestClient(dashboard_server.app) as c:
+                yield c
+
+    @pytest.mark.parametrize("path", ["/metrics", "/projects", "/alerts", "/briefing/daily", "/briefing/executive"])
+    def test_revalidation_returns_304(self, etag_client, path):
+        r = etag_client.get(path)
+        assert r.status_code == 200
+        assert r.headers["etag"] == '"42"'
+
+        r = etag_client.get(path, headers={"If-None-Match": '"42"'})
+        assert r.status_code == 304
+        assert r.content == b""
+
+    def test_stale_etag_gets_full_body(self, etag_client):
+        r = etag_client.get("/alerts", headers={"If-None-Match": '"41"'})
+        assert r.status_code == 200
+        assert len(r.json()) == 1
+
+    def test_no_etag_without_snapshot(self):
+        with patch("cerebro.dashboard_server._collector") as mock_coll:
+            mock_coll.snapshot_mtime_ns.return_value = None
+
+            with TestClient(dashboard_server.app) as c:
+                assert "etag" not in c.get("/alerts").headers
@@ -18,21 +18,24 @@ from cerebro.intelligence.core import (
 # Enums
 # ---------------------------------------------------------------------------
 class TestEnums:
-    def test_intelligence_type_values(self):
-        assert IntelligenceType.SIGINT.value == "sigint"
-        assert IntelligenceType.HUMINT.value == "humint"
-        assert IntelligenceType.OSINT.value == "osint"
-        assert IntelligenceType.TECHINT.value == "techint"
-
-    def test_threat_level_values(self):
-        assert ThreatLevel.CRITICAL.value == "critical"
-        assert ThreatLevel.HIGH.value == "high"
-        assert ThreatLevel.INFO.value == "info"
-
-    def test_project_status_values(self):
-        assert ProjectStatus.ACTIVE.value == "active"
-        assert ProjectStatus.ARCHIVED.value == "archived"
-        assert ProjectStatus.UNKNOWN.value == "unknown"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (IntelligenceType.SIGINT, "sigint"),
+            (IntelligenceType.HUMINT, "humint"),
+            (IntelligenceType.OSINT, "osint"),
+            (IntelligenceType.TECHINT, "techint"),
+            (ThreatLevel.CRITICAL, "critical"),
+            (ThreatLevel.HIGH, "high"),
+            (ThreatLevel.INFO, "info"),
+            (ProjectStatus.ACTIVE, "active"),
+            (ProjectStatus.ARCHIVED, "archived"),
+            (ProjectStatus.UNKNOWN, "unknown"),
+        ],
+        ids=str,
+    )
+    def test_enum_values(self, member, expected):
+        assert member.value == expected
 
 
 # ---------------------------------------------------------------------------
@@ -128,13 +131,24 @@ class TestEcosystemStatus:
 # ---------------------------------------------------------------------------
 # CerebroIntelligence
 # ---------------------------------------------------------------------------
+def _intelligence_at(base):
+    """CerebroIntelligence with its arch and data dirs under *base*."""
+    return CerebroIntelligence(arch_path=str(base / "arch"), data_dir=str(base / "data"))
+
+
 class TestCerebroIntelligence:
+    @pytest.fixture(scope="class")
+    def _shared_cerebro(self, tmp_path_factory):
+        return _intelligence_at(tmp_path_factory.mktemp("cerebro"))
+
     @pytest.fixture
-    def cerebro(self, tmp_path):
-        return CerebroIntelligence(
-            arch_path=str(tmp_path / "arch"),
-            data_dir=str(tmp_path / "data"),
-        )
+    def cerebro(self, _shared_cerebro):
+        """The class-wide instance with its in-memory stores emptied."""
+        _shared_cerebro._projects.clear()
+        _shared_cerebro._intelligence.clear()
+        _shared_cerebro._embeddings.clear()
+        _shared_cerebro._ecosystem_status = EcosystemStatus()
+        return _shared_cerebro
 
     def test_initialization(self, cerebro):
         assert cerebro.get_project_count() == 0
@@ -173,31 +187,6 @@ class TestCerebroIntelligence:
         assert new_id != ""
         assert cerebro.get_intelligence(new_id) is not None
 
-    def test_query_intelligence(self, cerebro):
-        cerebro.add_intelligence(IntelligenceItem(
-            id="q-001",
-            type=IntelligenceType.TECHINT,
-            source="scanner",
-            title="Architecture Issue",
-            content="Circular dependency found in module alpha",
-        ))
-        results = cerebro.query_intelligence("circular dependency")
-        assert len(results) == 1
-        assert results[0].id == "q-001"
-
-    def test_query_intelligence_type_filter(self, cerebro):
-        cerebro.add_intelligence(IntelligenceItem(
-            id="f-001", type=IntelligenceType.SIGINT,
-            source="test", title="Signal", content="signal data",
-        ))
-        cerebro.add_intelligence(IntelligenceItem(
-            id="f-002", type=IntelligenceType.OSINT,
-            source="test", title="Open Source", content="signal data",
-        ))
-        results = cerebro.query_intelligence("signal", types=[IntelligenceType.SIGINT])
-        assert len(results) == 1
-        assert results[0].type == IntelligenceType.SIGINT
-
     def test_calculate_health_score_empty(self, cerebro):
         assert cerebro.calculate_health_score() == 0.0
 
@@ -217,16 +206,56 @@ class TestCerebroIntelligence:
         assert briefing["classification"] == "INTERNAL"
         assert briefing["ecosystem"]["total_projects"] == 1
 
-    def test_save_and_reload(self, tmp_path):
-        c1 = CerebroIntelligence(arch_path=str(tmp_path / "arch"), data_dir=str(tmp_path / "data"))
-        c1.register_project(Project(name="persistent", path=tmp_path, status=ProjectStatus.ACTIVE))
-        c1.save()
-
-        c2 = CerebroIntelligence(arch_path=str(tmp_path / "arch"), data_dir=str(tmp_path / "data"))
-        assert c2.get_project("persistent") is not None
-
     def test_generate_id(self, cerebro):
         id1 = cerebro.generate_id("content-a")
         id2 = cerebro.generate_id("content-b")
         assert id1 != id2
         assert len(id1) == 16
+
+
+class TestQueryIntelligence:
+    @pytest.fixture(scope="class")
+    def loaded_cerebro(self, tmp_path_factory):
+        base = tmp_path_factory.mktemp("cerebro-query")
+        ci = _intelligence_at(base)
+        for item in (
+            IntelligenceItem(
+                id="q-001", type=IntelligenceType.TECHINT, source="scanner",
+                title="Architecture Issue", content="Circular dependency found in module alpha",
+            ),
+            IntelligenceItem(
+                id="f-001", type=IntelligenceType.SIGINT,
+                source="test", title="Signal", content="signal data",
+            ),
+            IntelligenceItem(
+                id="f-002", type=IntelligenceType.OSINT,
+                source="test", title="Open Source", content="signal data",
+            ),
+        ):
+            ci.add_intelligence(item)
+        return ci
+
+    @pytest.mark.parametrize(
+        ("query", "types", "expected_ids"),
+        [
+            ("circular dependency", None, {"q-001"}),
+            ("signal", None, {"f-001", "f-002"}),
+            ("signal", [IntelligenceType.SIGINT], {"f-001"}),
+            ("signal", [IntelligenceType.OSINT], {"f-002"}),
+            ("no such thing", None, set()),
+        ],
+    )
+    def test_query(self, loaded_cerebro, query, types, expected_ids):
+        results = loaded_cerebro.query_intelligence(query, types=types)
+        assert {r.id for r in results} == expected_ids
+
+
+class TestCerebroPersistence:
+    def test_save_and_reload(self, tmp_path):
+        """The one disk round-trip of the state file; keep it on a real tmp_path."""
+        c1 = _intelligence_at(tmp_path)
+        c1.register_project(Project(name="persistent", path=tmp_path, status=ProjectStatus.ACTIVE))
+        c1.save()
+
+        c2 = _intelligence_at(tmp_path)
+        assert c2.get_project("persistent") is not None
@@ -1,101 +1,78 @@
 """Tests for the Cerebro Smart Launcher."""
 
+import subprocess
+import sys
+from types import SimpleNamespace
 from unittest.mock import patch
 
-from cerebro.launcher import detect_environment
+import pytest
+
+from cerebro.launcher import _frontend_command, _stop_processes, detect_environment
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Drop the GUI override variables for the duration of a test."""
+    monkeypatch.delenv("CEREBRO_GUI", raising=False)
+    monkeypatch.delenv("CEREBRO_DASHBOARD", raising=False)
+    return monkeypatch
 
 
 class TestDetectEnvironment:
     """Test the detect_environment() function under various conditions."""
 
-    def test_gui_env_cerebro_gui(self):
-        with patch.dict("os.environ", {"CEREBRO_GUI": "1"}, clear=False):
-            assert detect_environment() == "gui"
-
-    def test_gui_env_cerebro_dashboard(self):
-        with patch.dict("os.environ", {"CEREBRO_DASHBOARD": "1"}, clear=False):
-            assert detect_environment() == "gui"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_non_interactive_stdin(self, mock_stdout, mock_stdin):
-        """Non-interactive stdin (pipe) should return 'cli'."""
-        mock_stdin.isatty.return_value = False
-        mock_stdout.isatty.return_value = True
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro"]):
-                    assert detect_environment() == "cli"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_non_interactive_stdout(self, mock_stdout, mock_stdin):
-        """Non-interactive stdout (redirect) should return 'cli'."""
-        mock_stdin.isatty.return_value = True
-        mock_stdout.isatty.return_value = False
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro"]):
-                    assert detect_environment() == "cli"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_cli_with_args(self, mock_stdout, mock_stdin):
-        """Interactive terminal with CLI args should return 'cli'."""
-        mock_stdin.isatty.return_value = True
-        mock_stdout.isatty.return_value = True
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro", "info"]):
-                    assert detect_environment() == "cli"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_tui_mode_selector(self, mock_stdout, mock_stdin):
-        """Explicit 'tui' arg should return 'tui'."""
-        mock_stdin.isatty.return_value = True
-        mock_stdout.isatty.return_value = True
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro", "tui"]):
-                    assert detect_environment() == "tui"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_gui_mode_selector(self, mock_stdout, mock_stdin):
-        """Explicit 'gui' arg should return 'gui'."""
-        mock_stdin.isatty.return_value = True
-        mock_stdout.isatty.return_value = True
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro", "gui"]):
-                    assert detect_environment() == "gui"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_dashboard_mode_selector(self, mock_stdout, mock_stdin):
-        """Explicit 'dashboard' arg should return 'gui'."""
-        mock_stdin.isatty.return_value = True
-        mock_stdout.isatty.return_value = True
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro", "dashboard"]):
-                    assert detect_environment() == "gui"
-
-    @patch("sys.stdin")
-    @patch("sys.stdout")
-    def test_default_tui(self, mock_stdout, mock_stdin):
-        """Interactive terminal with no args should default to 'tui'."""
-        mock_stdin.isatty.return_value = True
-        mock_stdout.isatty.return_value = True
-        with patch.dict("os.environ", {}, clear=False):
-            os_env = {k: v for k, v in __import__("os").environ.items() if k not in ("CEREBRO_GUI", "CEREBRO_DASHBOARD")}
-            with patch.dict("os.environ", os_env, clear=True):
-                with patch("sys.argv", ["cerebro"]):
-                    assert detect_environment() == "tui"
+    @pytest.mark.parametrize("var", ["CEREBRO_GUI", "CEREBRO_DASHBOARD"])
+    def test_gui_env(self, clean_env, var):
+        clean_env.setenv(var, "1")
+        assert detect_environment() == "gui"
+
+    @pytest.mark.parametrize(
+        ("argv", "stdin_tty", "stdout_tty", "expected"),
+        [
+            (["cerebro"], False, True, "cli"),  # piped stdin
+            (["cerebro"], True, False, "cli"),  # redirected stdout
+            (["cerebro", "info"], True, True, "cli"),
+            (["cerebro", "tui"], True, True, "tui"),
+            (["cerebro", "gui"], True, True, "gui"),
+            (["cerebro", "dashboard"], True, True, "gui"),
+            (["cerebro"], True, True, "tui"),  # interactive default
+        ],
+    )
+    def test_detect(self, clean_env, argv, stdin_tty, stdout_tty, expected):
+        clean_env.setattr("sys.argv", argv)
+        clean_env.setattr("sys.stdin", SimpleNamespace(isatty=lambda: stdin_tty))
+        clean_env.setattr("sys.stdout", SimpleNamespace(isatty=lambda: stdout_tty))
+        assert detect_environment() == expected
+
+
+class TestFrontendCommand:
+    """Test how launch_gui() picks the dashboard dev server command."""
+
+    def test_prefers_node_with_local_vite(self, tmp_path):
+        vite = tmp_path / "node_modules" / "vite" / "bin" / "vite.js"
+        vite.parent.mkdir(parents=True)
+        vite.touch()
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+            assert _frontend_command(tmp_path) == ["/usr/bin/node", str(vite)]
+
+    def test_falls_back_to_npm(self, tmp_path):
+        with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+            assert _frontend_command(tmp_path) == ["/usr/bin/npm", "run", "dev"]
+
+    def test_no_toolchain(self, tmp_path):
+        with patch("shutil.which", return_value=None):
+            assert _frontend_command(tmp_path) is None
+
+
+class TestStopProcesses:
+    """Test the shutdown helper launch_gui() runs on every exit path."""
+
+    def test_stops_running_and_reaps_exited(self):
+        running = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+
+        _stop_processes([running, exited])
+
+        assert running.returncode is not None
+        assert exited.returncode == 0
@@ -1,7 +1,10 @@
 """Tests for MetricsCollector — zero-token repository analysis engine."""
 
 import json
+import shutil
 import subprocess
+import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -10,16 +13,18 @@ from cerebro.core.metrics_collector import (
     EXT_TO_LANG,
     MetricsCollector,
     RepoMetricsSnapshot,
+    _file_ext,
 )
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
-@pytest.fixture
-def tmp_arch(tmp_path):
-    """Create a minimal arch directory with one git repo."""
-    repo = tmp_path / "my-project"
+@pytest.fixture(scope="session")
+def _tmp_arch_template(tmp_path_factory):
+    """Build the minimal arch directory with one git repo, once per session."""
+    arch = tmp_path_factory.mktemp("arch-template")
+    repo = arch / "my-project"
     repo.mkdir()
     (repo / ".git").mkdir()
 
@@ -33,7 +38,13 @@ def tmp_arch(tmp_path):
     tests.mkdir()
     (tests / "test_main.py").write_text("def test_ok(): pass\n")
 
-    return tmp_path
+    return arch
+
+
+@pytest.fixture
+def tmp_arch(tmp_path, _tmp_arch_template):
+    """Per-test copy of the arch template; tests are free to mutate it."""
+    return shutil.copytree(_tmp_arch_template, tmp_path / "arch")
 
 
 @pytest.fixture
@@ -90,12 +101,26 @@ class TestCollectCodeMetrics:
 
         assert snap.primary_language == "Python"
 
+    def test_skips_binary_and_generated_files(self, collector, tmp_arch):
+        repo_path = tmp_arch / "my-project"
+        (repo_path / "blob.js").write_bytes(b"\x00\x01binary\n" * 10)
+        (repo_path / "bundle.min.js").write_text("x;\n" * 200_000)
+        (repo_path / "small.min.js").write_text("a;\nb;\n")
+        snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        collector._collect_code_metrics(repo_path, snap)
+
+        assert snap.languages["JavaScript"] == {"files": 3, "lines": 2}
+
     def test_language_extension_mapping(self):
         assert EXT_TO_LANG[".py"] == "Python"
         assert EXT_TO_LANG[".rs"] == "Rust"
         assert EXT_TO_LANG[".ts"] == "TypeScript"
         assert EXT_TO_LANG[".go"] == "Go"
 
+    def test_file_ext_matches_path_suffix(self):
+        for name in ["main.py", "App.TSX", "archive.tar.gz", "Makefile", ".env", "trailing."]:
+            assert _file_ext(name) == Path(name).suffix.lower(), name
+
 
 # ---------------------------------------------------------------------------
 # Git metrics
@@ -108,19 +133,80 @@ class TestCollectGitMetrics:
         collector._collect_git_metrics(plain, snap)
         assert snap.git.get("error") == "not a git repo"
 
-    def test_git_output_timeout(self, tmp_arch):
-        """_git_output returns empty string on timeout."""
+    def test_bounded_log_walk(self, collector, tmp_arch):
+        """Recent figures come from one 90-day `git log` walk; totals stay all-time."""
+        now = int(time.time())
+        log = "\n".join([
+            "a" * 40 + f"\t{now - 86_400}\tAlice\t2026-01-02 10:00:00 +0000\tfix: tab\tin subject",
+            "b" * 40 + f"\t{now - 40 * 86_400}\tBob\t2026-01-01 10:00:00 +0000\tMerge branch",
+            "c" * 40 + f"\t{now - 60 * 86_400}\tBob\t2025-12-01 10:00:00 +0000\tfeat",
+        ])
+        outputs = {
+            "rev-list": "4\n",
+            "log": log,
+            "shortlog": "     3\tAlice\n     1\tBob\n",
+            "for-each-ref": "refs/heads/main\nrefs/heads/dev\nrefs/tags/v1\n",
+        }
+
+        def fake_git(_repo, args):
+            return outputs[args[0]]
+
         repo_path = tmp_arch / "my-project"
-        with patch("cerebro.core.metrics_collector.subprocess.run", side_effect=subprocess.TimeoutExpired("git", 15)):
-            result = MetricsCollector._git_output(repo_path, ["log"])
-            assert result == ""
+        snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        with patch.object(MetricsCollector, "_git_output", side_effect=fake_git) as git_mock:
+            collector._collect_git_metrics(repo_path, snap)
+
+        assert git_mock.call_count == 4
+        assert "--since=90.days" in git_mock.call_args_list[1].args[1]
+        assert snap.git["total_commits"] == 4
+        assert snap.git["commits_30d"] == 1
+        assert snap.git["commits_90d"] == 3
+        assert snap.git["contributors"] == 2
+        assert snap.git["branches"] == 2
+        assert snap.git["tags"] == 1
+        assert snap.git["last_commit_hash"] == "a" * 12
+        assert snap.git["last_commit_author"] == "Alice"
+        assert snap.git["last_commit_message"] == "fix: tab\tin subject"
+        assert snap.git["top_contributors"] == [
+            {"name": "Alice", "commits": 3},
+            {"name": "Bob", "commits": 1},
+        ]
+
+    def test_idle_repo_keeps_all_time_figures(self, collector, tmp_arch):
+        """A repo idle for 90+ days still reports its last commit and contributors."""
+        last = "d" * 40 + "\t0\tAlice\t2025-01-01 10:00:00 +0000\tinit\n"
+
+        def fake_git(_repo, args):
+            if args[0] == "rev-list":
+                return "1\n"
+            if args[0] == "shortlog":
+                return "     1\tAlice\n"
+            return last if args[:2] == ["log", "-1"] else ""
 
-    def test_git_int_fallback(self, tmp_arch):
-        """_git_int returns 0 on non-numeric output."""
         repo_path = tmp_arch / "my-project"
-        with patch.object(MetricsCollector, "_git_output", return_value="not-a-number"):
-            result = MetricsCollector._git_int(repo_path, ["rev-list", "--count", "HEAD"])
-            assert result == 0
+        snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        with patch.object(MetricsCollector, "_git_output", side_effect=fake_git):
+            collector._collect_git_metrics(repo_path, snap)
+
+        assert snap.git["total_commits"] == 1
+        assert snap.git["commits_90d"] == 0
+        assert snap.git["contributors"] == 1
+        assert snap.git["top_contributors"] == [{"name": "Alice", "commits": 1}]
+        assert snap.git["last_commit_hash"] == "d" * 12
+        assert snap.git["last_commit_message"] == "init"
+
+    def test_git_output_timeout(self, tmp_arch, monkeypatch):
+        """_git_output returns empty string on timeout."""
+        def _timeout(*_args, **_kwargs):
+            raise subprocess.TimeoutExpired("git", 15)
+
+        monkeypatch.setattr("cerebro.core.metrics_collector.subprocess.run", _timeout)
+        assert MetricsCollector._git_output(tmp_arch / "my-project", ["log"]) == ""
+
+    def test_git_int_fallback(self, tmp_arch, monkeypatch):
+        """_git_int returns 0 on non-numeric output."""
+        monkeypatch.setattr(MetricsCollector, "_git_output", staticmethod(lambda _repo, _args: "not-a-number"))
+        assert MetricsCollector._git_int(tmp_arch / "my-project", ["rev-list", "--count", "HEAD"]) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -139,6 +225,38 @@ class TestCollectDependencies:
         assert "py:rich" in snap.dependencies
         assert snap.dep_count >= 2
 
+    def test_parses_pep621_pyproject(self, collector, tmp_arch):
+        repo_path = tmp_arch / "my-project"
+        (repo_path / "pyproject.toml").write_text(
+            '[project]\nname = "x"\ndependencies = ["fastapi>=0.100", "pyyaml ; python_version > \'3.8\'"]\n'
+        )
+        snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        collector._collect_dependencies(repo_path, snap)
+
+        assert snap.dependencies == ["py:fastapi", "py:pyyaml"]
+
+    def test_parses_cargo_inline_tables(self, collector, tmp_arch):
+        repo_path = tmp_arch / "my-project"
+        (repo_path / "Cargo.toml").write_text(
+            '[package]\nname = "x"\n\n[dependencies]\nserde = { version = "1", features = ["derive"] }\n'
+            'tokio = "1"\n\n[dev-dependencies]\ncriterion = "0.5"\n'
+        )
+        snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        collector._collect_dependencies(repo_path, snap)
+
+        assert snap.dependencies == ["cargo:serde", "cargo:tokio"]
+
+    def test_parses_go_mod(self, collector, tmp_arch):
+        repo_path = tmp_arch / "my-project"
+        (repo_path / "go.mod").write_text(
+            "module example.com/x\n\ngo 1.22\n\nrequire github.com/spf13/cobra v1.8.0\n\n"
+            "require (\n\t// indirect deps below\n\tgolang.org/x/net v0.20.0\n)\n"
+        )
+        snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        collector._collect_dependencies(repo_path, snap)
+
+        assert snap.dependencies == ["go:github.com/spf13/cobra", "go:golang.org/x/net"]
+
     def test_parses_package_json(self, collector, tmp_arch):
         repo_path = tmp_arch / "my-project"
         (repo_path / "package.json").write_text(
@@ -171,6 +289,22 @@ class TestCollectSecurity:
         assert "hardcoded_secret" in types
         assert snap.security_score < 100.0
 
+    def test_parallel_scan_matches_inline(self, collector, tmp_arch, monkeypatch):
+        repo_path = tmp_arch / "my-project"
+        (repo_path / "config.py").write_text('# cfg\nAPI_KEY = "sk_live_abcdef1234567890abcdef"\n')
+        (repo_path / "run.py").write_text("import pdb\npdb.set_trace()\neval(x)\n")
+
+        inline = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        collector._collect_security(repo_path, inline)
+
+        monkeypatch.setattr("cerebro.core.metrics_collector.SECURITY_PARALLEL_MIN_FILES", 1)
+        monkeypatch.setattr("cerebro.core.metrics_collector.os.cpu_count", lambda: 2)
+        parallel = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
+        collector._collect_security(repo_path, parallel)
+
+        assert parallel.security_findings == inline.security_findings
+        assert {"type": "hardcoded_secret", "file": "config.py", "line": 2} in inline.security_findings
+
     def test_clean_repo(self, collector, tmp_arch):
         repo_path = tmp_arch / "my-project"
         snap = RepoMetricsSnapshot(name="my-project", path=str(repo_path))
@@ -220,26 +354,46 @@ class TestHealthScore:
         score = collector._calculate_health(snap)
         assert score == 0.0
 
+    def test_recompute_health_matches_scalar(self, collector):
+        snaps = [
+            RepoMetricsSnapshot(name="a", path="/a", security_score=0.0),
+            RepoMetricsSnapshot(
+                name="b", path="/b", has_readme=True, has_tests=True, test_files=3,
+                total_loc=500, security_score=70.0, git={"commits_30d": 3},
+            ),
+            RepoMetricsSnapshot(
+                name="c", path="/c", has_docs=True, has_tests=True, test_files=8,
+                has_ci=True, git={"commits_30d": 0, "commits_90d": 7},
+            ),
+            RepoMetricsSnapshot(
+                name="d", path="/d", has_readme=True, has_docs=True, has_tests=True,
+                test_files=40, has_ci=True, total_loc=10_000, git={"commits_30d": 50},
+            ),
+        ]
+        expected = [collector._calculate_health(s) for s in snaps]
+
+        assert collector.recompute_health(snaps) == expected
+        assert [s.health_score for s in snaps] == expected
+        assert collector.recompute_health([]) == []
+
 
 # ---------------------------------------------------------------------------
 # Status determination
 # ---------------------------------------------------------------------------
 class TestDetermineStatus:
-    def test_active(self):
-        snap = RepoMetricsSnapshot(name="x", path="/x", git={"total_commits": 50, "commits_30d": 5, "commits_90d": 10})
-        assert MetricsCollector._determine_status(snap) == "active"
-
-    def test_maintenance(self):
-        snap = RepoMetricsSnapshot(name="x", path="/x", git={"total_commits": 50, "commits_30d": 0, "commits_90d": 3})
-        assert MetricsCollector._determine_status(snap) == "maintenance"
-
-    def test_archived(self):
-        snap = RepoMetricsSnapshot(name="x", path="/x", git={"total_commits": 50, "commits_30d": 0, "commits_90d": 0})
-        assert MetricsCollector._determine_status(snap) == "archived"
-
-    def test_empty(self):
-        snap = RepoMetricsSnapshot(name="x", path="/x", git={"total_commits": 0})
-        assert MetricsCollector._determine_status(snap) == "empty"
+    @pytest.mark.parametrize(
+        ("git", "expected"),
+        [
+            ({"total_commits": 50, "commits_30d": 5, "commits_90d": 10}, "active"),
+            ({"total_commits": 50, "commits_30d": 0, "commits_90d": 3}, "maintenance"),
+            ({"total_commits": 50, "commits_30d": 0, "commits_90d": 0}, "archived"),
+            ({"total_commits": 0}, "empty"),
+        ],
+        ids=["active", "maintenance", "archived", "empty"],
+    )
+    def test_status(self, git, expected):
+        snap = RepoMetricsSnapshot(name="x", path="/x", git=git)
+        assert MetricsCollector._determine_status(snap) == expected
 
 
 # ---------------------------------------------------------------------------
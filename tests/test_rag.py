@@ -79,6 +79,24 @@ def test_provider_alias_resolution_uses_registered_aliases(monkeypatch):
     mock_llama.assert_called_once()
 
 
+def test_local_engine_does_not_require_google_sdk(monkeypatch):
+    """Test that a local-only engine never imports the Google Cloud SDK."""
+    monkeypatch.delenv("CEREBRO_LLM_PROVIDER", raising=False)
+    reset_settings_cache()
+    blocked = {
+        "google.cloud": None,
+        "google.cloud.storage": None,
+        "google.api_core": None,
+        "cerebro.providers.gcp.vertex_ai_llm": None,
+    }
+    with patch.dict(sys.modules, blocked):
+        with patch("cerebro.core.rag.engine.LlamaCppProvider"):
+            with patch("cerebro.core.rag.engine.build_vector_store_provider"):
+                with patch("cerebro.core.rag.engine.EmbeddingSystem"):
+                    engine = RigorousRAGEngine(persist_directory="./test_db")
+    assert not engine._uses_vertex_backend()
+
+
 def test_provider_alias_resolution_rejects_ambiguous_values(monkeypatch):
     """Test that unregistered aliases are rejected."""
     monkeypatch.setenv("CEREBRO_LLM_PROVIDER", "local")
@@ -148,6 +166,71 @@ def test_ingest_local_success(tmp_path, mock_llm_provider, mock_vector_store_pro
     )
 
 
+def test_ingest_local_streams_in_batches_and_dedups(tmp_path, mock_llm_provider, mock_vector_store_provider):
+    """Local ingestion upserts fixed-size windows and skips repeated content across them."""
+    jsonl_path = tmp_path / "artifacts.jsonl"
+    lines = [
+        '{"title": "a", "content": "alpha", "repo": "r"}',
+        '{"title": "b", "content": "beta", "repo": "r"}',
+        '{"title": "a2", "content": "alpha", "repo": "r"}',
+        '{"title": "c", "content": "gamma", "repo": "r"}',
+    ]
+    jsonl_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    mock_vector_store_provider.upsert_documents.side_effect = lambda docs, *_a, **_k: len(docs)
+
+    with patch("cerebro.core.rag.engine.EmbeddingSystem") as mock_embed_cls:
+        mock_embed = MagicMock()
+        mock_embed.embed.side_effect = lambda texts: EmbeddingResult(
+            vectors=[[0.0]] * len(texts), model_used="test", dimension=1, latency_ms=0.0, batch_size=len(texts)
+        )
+        mock_embed_cls.return_value = mock_embed
+
+        engine = RigorousRAGEngine(
+            llm_provider=mock_llm_provider,
+            vector_store_provider=mock_vector_store_provider,
+        )
+        with patch.object(RigorousRAGEngine, "INGEST_BATCH_SIZE", 2):
+            count = engine.ingest(str(jsonl_path))
+
+    assert count == 3
+    assert [call.args[0] for call in mock_embed.embed.call_args_list] == [["alpha", "beta"], ["gamma"]]
+    mock_vector_store_provider.initialize_schema.assert_called_once()
+
+
+def test_vertex_ingest_reuses_storage_client_and_bucket(tmp_path, monkeypatch, mock_vector_store_provider):
+    """Repeated Vertex ingests build one storage.Client and resolve the bucket once."""
+    monkeypatch.setenv("GCP_PROJECT_ID", "proj")
+    monkeypatch.setenv("DATA_STORE_ID", "store")
+    jsonl_path = tmp_path / "artifacts.jsonl"
+    jsonl_path.write_text('{"title": "a", "content": "alpha", "repo": "r"}\n', encoding="utf-8")
+
+    storage = MagicMock()
+    api_core = SimpleNamespace(exceptions=SimpleNamespace(NotFound=type("NotFound", (Exception,), {})))
+    google_stubs = {
+        "google": SimpleNamespace(),
+        "google.cloud": SimpleNamespace(storage=storage),
+        "google.cloud.storage": storage,
+        "google.api_core": api_core,
+        "google.api_core.exceptions": api_core.exceptions,
+    }
+    vertex_llm = MagicMock()
+    vertex_llm.import_documents.return_value = "op"
+
+    with patch.dict(sys.modules, google_stubs), \
+            patch.object(RigorousRAGEngine, "_uses_vertex_backend", return_value=True):
+        engine = RigorousRAGEngine(
+            llm_provider=vertex_llm,
+            vector_store_provider=mock_vector_store_provider,
+        )
+        assert engine.ingest(str(jsonl_path)) == 1
+        assert engine.ingest(str(jsonl_path)) == 1
+
+    storage.Client.assert_called_once_with(project="proj")
+    storage.Client.return_value.get_bucket.assert_called_once_with("proj-cerebro-ingest")
+    assert vertex_llm.import_documents.call_count == 2
+
+
 def test_query_with_metrics_no_local_data(mock_llm_provider, mock_vector_store_provider):
     """Test query when no local vector data is available."""
 
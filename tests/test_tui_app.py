@@ -0,0 +1,54 @@
+"""Headless tests for the Textual TUI (cerebro.tui.app)."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from textual.command import CommandPalette
+
+from cerebro.tui.app import CerebroApp, DashboardScreen, ScriptsScreen
+
+STATUS = {"total_projects": 3, "active_projects": 2, "health_score": 80.0, "total_intelligence": 5}
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """CerebroApp with its state under tmp_path and a stubbed router."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    app = CerebroApp()
+    app.router = AsyncMock()
+    app.router.get_system_status.return_value = STATUS
+    app.router.get_available_commands.return_value = {}
+    return app
+
+
+class TestDashboardScreen:
+    @pytest.mark.asyncio
+    async def test_auto_refresh_reloads_metrics(self, app, monkeypatch):
+        monkeypatch.setattr(DashboardScreen, "REFRESH_INTERVAL", 0.05)
+        async with app.run_test() as pilot:
+            await pilot.pause(0.3)
+            assert isinstance(app.screen, DashboardScreen)
+            assert app.router.get_system_status.await_count >= 2
+
+    @pytest.mark.asyncio
+    async def test_resume_refreshes_promptly(self, app):
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            loads = app.router.get_system_status.await_count
+            await pilot.press("?")
+            await pilot.pause()
+            app.pop_screen()
+            await pilot.pause(DashboardScreen.RESUME_REFRESH_DELAY + 0.2)
+            assert app.router.get_system_status.await_count == loads + 1
+
+
+class TestScriptsScreen:
+    @pytest.mark.asyncio
+    async def test_command_palette_opens(self, app):
+        async with app.run_test() as pilot:
+            await app.switch_screen("scripts")
+            await pilot.pause()
+            assert isinstance(app.screen, ScriptsScreen)
+            await pilot.press("ctrl+p")
+            await pilot.pause()
+            assert isinstance(app.screen, CommandPalette)
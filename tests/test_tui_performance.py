@@ -0,0 +1,129 @@
+"""Tests for the TUI performance utilities (cerebro.tui.performance)."""
+
+import pytest
+
+from cerebro.tui import performance
+from cerebro.tui.performance import Cache, RingBuffer, cached
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Manual monotonic clock for the performance module; advance with clock.now += dt."""
+
+    class _Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(performance, "monotonic", lambda: _Clock.now)
+    return _Clock
+
+
+class TestCache:
+    def test_entries_expire_after_ttl(self, clock):
+        cache = Cache(ttl=10)
+        cache.set("a", 1)
+        clock.now += 9.9
+        assert cache.get("a") == 1
+        clock.now += 0.1
+        assert cache.get("a") is None
+
+    def test_expired_entries_are_evicted_without_reads(self, clock):
+        cache = Cache(ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        clock.now += 11
+        cache.purge_expired()
+        assert len(cache._cache) == 0
+        assert cache._heap == []
+
+    def test_overwrite_outlives_its_stale_heap_entry(self, clock):
+        cache = Cache(ttl=10)
+        cache.set("a", 1)
+        clock.now += 5
+        cache.set("a", 2)  # leaves the first expiry behind in the heap
+        clock.now += 6  # past the first expiry, before the second
+        cache.purge_expired()
+        assert cache.get("a") == 2
+        clock.now += 4
+        assert cache.get("a") is None
+
+    def test_ttl_override(self, clock):
+        cache = Cache(ttl=10)
+        cache.set("short", 1, ttl_override=1)
+        cache.set("long", 2, ttl_override=100)
+        clock.now += 2
+        assert cache.get("short") is None
+        clock.now += 50
+        assert cache.get("long") == 2
+
+    def test_ttl_range_spreads_expiry(self, clock):
+        cache = Cache(ttl=(5, 15))
+        cache.set("a", 1)
+        expires_at = cache._cache["a"][1]
+        assert clock.now + 5 <= expires_at <= clock.now + 15
+
+    def test_keys_of_mixed_types(self, clock):
+        cache = Cache(ttl=10)
+        cache.set("a", 1)
+        cache.set(("a", 1), 2)  # same expiry: the heap must not compare keys
+        cache.set(3, 3)
+        assert [cache.get(k) for k in ("a", ("a", 1), 3)] == [1, 2, 3]
+
+
+class TestRingBuffer:
+    def test_wraparound_keeps_latest_in_order(self):
+        buf = RingBuffer(maxlen=3)
+        buf.extend([1, 2, 3, 4, 5])
+        assert len(buf) == 3
+        assert list(buf) == [3, 4, 5]
+        assert buf.get_recent(2) == [4, 5]
+        assert buf.get_recent(3) == [3, 4, 5]
+
+    def test_get_recent_more_than_stored(self):
+        buf = RingBuffer(maxlen=5)
+        buf.extend([1, 2])
+        assert buf.get_recent(10) == [1, 2]
+        assert buf.get_recent(0) == []
+
+    def test_memo_invalidated_by_writes(self):
+        buf = RingBuffer(maxlen=3)
+        buf.extend([1, 2, 3])
+        first = buf.get_recent(2)
+        assert buf.get_recent(2) is first  # no write in between: memo hit
+        buf.append(4)
+        assert buf.get_recent(2) == [3, 4]
+        buf.clear()
+        assert buf.get_recent(2) == []
+        assert len(buf) == 0
+
+    def test_rejects_non_positive_maxlen(self):
+        with pytest.raises(ValueError, match="maxlen must be positive"):
+            RingBuffer(maxlen=0)
+
+
+class TestCached:
+    @pytest.mark.asyncio
+    async def test_caches_per_function(self):
+        calls = []
+
+        @cached(ttl=30)
+        async def double(x):
+            calls.append(("double", x))
+            return x * 2
+
+        @cached(ttl=30)
+        async def negate(x):
+            calls.append(("negate", x))
+            return -x
+
+        assert await double(2) == 4
+        assert await double(2) == 4
+        assert await double([1]) == [1, 1]  # unhashable argument
+        assert await double([1]) == [1, 1]
+        assert await negate(2) == -2
+        assert calls == [("double", 2), ("double", [1]), ("negate", 2)]
+
+        # invalidating one function leaves the other's entries alone
+        double.cache.clear()
+        assert await negate(2) == -2
+        assert await double(2) == 4
+        assert calls[3:] == [("double", 2)]
@@ -0,0 +1,163 @@
+"""Tests for RepoWatcher — HEAD-hash polling for repository changes."""
+
+import os
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cerebro.core.metrics_collector import RepoMetricsSnapshot
+from cerebro.core.watcher import RepoWatcher, _fast_head_hash
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    """RepoWatcher pointed at an empty arch dir with a stubbed collector."""
+    w = RepoWatcher(arch_path=str(tmp_path), poll_interval=1, on_change=AsyncMock())
+    w.collector = MagicMock()
+    return w
+
+
+def _make_git_dir(repo, head="ref: refs/heads/main\n"):
+    git_dir = repo / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(head)
+    return git_dir
+
+
+class TestFastHeadHash:
+    def test_loose_ref(self, tmp_path):
+        git_dir = _make_git_dir(tmp_path)
+        (git_dir / "refs" / "heads" / "main").write_text(SHA_A + "\n")
+        assert _fast_head_hash(tmp_path)[2] == SHA_A
+
+    def test_packed_ref(self, tmp_path):
+        git_dir = _make_git_dir(tmp_path)
+        (git_dir / "packed-refs").write_text(
+            f"# pack-refs with: peeled fully-peeled sorted\n{SHA_B} refs/heads/dev\n{SHA_A} refs/heads/main\n"
+        )
+        assert _fast_head_hash(tmp_path)[2] == SHA_A
+
+    def test_detached_head(self, tmp_path):
+        _make_git_dir(tmp_path, head=SHA_B + "\n")
+        assert _fast_head_hash(tmp_path)[2] == SHA_B
+
+    def test_unsupported_layouts(self, tmp_path):
+        assert _fast_head_hash(tmp_path) is None  # no .git at all
+        _make_git_dir(tmp_path)  # unborn branch: no loose or packed ref
+        assert _fast_head_hash(tmp_path) is None
+
+    def test_watcher_skips_reread_until_ref_moves(self, watcher, tmp_path):
+        git_dir = _make_git_dir(tmp_path)
+        ref = git_dir / "refs" / "heads" / "main"
+        ref.write_text(SHA_A + "\n")
+        assert watcher._head_hash(tmp_path) == SHA_A
+
+        # same mtime -> cached answer, even though content changed underneath
+        st = os.stat(ref)
+        ref.write_text(SHA_B + "\n")
+        os.utime(ref, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert watcher._head_hash(tmp_path) == SHA_A
+
+        os.utime(ref, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert watcher._head_hash(tmp_path) == SHA_B
+        watcher.collector.get_head_hash.assert_not_called()
+
+    def test_watcher_falls_back_to_git(self, watcher, tmp_path):
+        watcher.collector.get_head_hash.return_value = SHA_A
+        assert watcher._head_hash(tmp_path) == SHA_A
+        watcher.collector.get_head_hash.assert_called_once_with(tmp_path)
+
+
+class TestCheckAll:
+    @pytest.mark.asyncio
+    async def test_only_changed_repos_are_recollected(self, watcher, tmp_path):
+        repos = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+        watcher._tracked_repos = repos
+        watcher._head_cache = {"a": "old-a", "b": "same-b"}  # "c" is unseeded
+        heads = {"a": "new-a", "b": "same-b", "c": "seed-c"}
+        watcher.collector.get_head_hash.side_effect = lambda p: heads[p.name]
+        watcher.collector.collect_repo.side_effect = lambda p: RepoMetricsSnapshot(name=p.name, path=str(p))
+
+        await watcher._check_all()
+
+        watcher.collector.collect_repo.assert_called_once_with(repos[0])
+        assert watcher._head_cache == {"a": "new-a", "b": "same-b", "c": "seed-c"}
+        assert watcher.changes_detected == 1
+        payload = watcher.on_change.await_args.args[0]
+        assert payload["type"] == "repo_update"
+        assert payload["repo"]["name"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_one_failing_repo_does_not_stop_the_poll(self, watcher, tmp_path):
+        repos = [tmp_path / "bad", tmp_path / "good"]
+        watcher._tracked_repos = repos
+        watcher._head_cache = {"bad": "x", "good": "old"}
+
+        def head(p):
+            if p.name == "bad":
+                raise OSError("boom")
+            return "new"
+
+        watcher.collector.get_head_hash.side_effect = head
+        watcher.collector.collect_repo.side_effect = lambda p: RepoMetricsSnapshot(name=p.name, path=str(p))
+
+        await watcher._check_all()
+
+        watcher.collector.collect_repo.assert_called_once_with(repos[1])
+
+    @pytest.mark.asyncio
+    async def test_work_runs_on_the_watcher_pool(self, watcher, tmp_path):
+        watcher._tracked_repos = [tmp_path / "a"]
+        watcher._head_cache = {"a": "old"}
+        threads = []
+
+        def head(p):
+            threads.append(threading.current_thread().name)
+            return "new"
+
+        def collect(p):
+            threads.append(threading.current_thread().name)
+            return RepoMetricsSnapshot(name=p.name, path=str(p))
+
+        watcher.collector.get_head_hash.side_effect = head
+        watcher.collector.collect_repo.side_effect = collect
+
+        await watcher._check_all()
+
+        assert len(threads) == 2
+        assert all(name.startswith("watcher") for name in threads)
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_pool_and_start_recreates_it(self, watcher):
+        watcher.collector.discover_repos.return_value = []
+        await watcher.start()
+        await watcher.stop()
+        assert watcher._executor is None
+        await watcher.start()
+        assert watcher._executor is not None
+        await watcher.stop()
+
+
+class TestIdleBackoff:
+    def test_interval_doubles_up_to_ceiling(self, watcher):
+        watcher.poll_interval = 10
+        intervals = []
+        for streak in range(1, 8):
+            watcher._empty_streak = streak
+            intervals.append(watcher._idle_interval())
+        assert intervals == [20, 40, 80, 160, 300, 300, 300]
+
+    def test_refresh_with_repos_resets_streak(self, watcher, tmp_path):
+        watcher._empty_streak = 5
+        watcher.collector.discover_repos.return_value = []
+        watcher.refresh_repo_list()
+        assert watcher._empty_streak == 5
+
+        watcher.collector.discover_repos.return_value = [tmp_path / "a"]
+        watcher.collector.get_head_hash.return_value = SHA_A
+        watcher.refresh_repo_list()
+        assert watcher._empty_streak == 0